@@ -0,0 +1,70 @@
+"""
+Compare two result files of benchmarks/suite.py.
+
+Runs are matched on optimizer, objective, shift, dimension, population, budget,
+seed and vectorized; for each pair the ratio of wall time and peak memory (new / old)
+and both final fitness values are printed. The exit status is 1 when any run
+got slower than the threshold, so the script can gate a CI job.
+
+    python benchmarks/compare.py before.json after.json --threshold 1.2
+"""
+import argparse
+import json
+import sys
+
+KEY = ("optimizer", "objective", "shifted", "dimension", "population", "budget", "seed", "vectorized")
+
+
+def load(path):
+    """Records of a result file, keyed on the run parameters."""
+    with open(path) as result_file:
+        results = json.load(result_file)
+    return {tuple(record.get(field) for field in KEY): record for record in results["results"]}
+
+
+def ratio(new, old):
+    if new is None or not old:
+        return None
+    return new / old
+
+
+def compare(old, new, threshold=1.1):
+    """
+    Rows of (key, wall time ratio, memory ratio, old fitness, new fitness) for runs in both files.
+
+    :return: rows, and the keys of runs whose wall time ratio exceeds threshold.
+    """
+    rows = []
+    regressions = []
+    for key in sorted(old.keys() & new.keys(), key=str):
+        time_ratio = ratio(new[key]["wall_time"], old[key]["wall_time"])
+        memory_ratio = ratio(new[key]["peak_memory"], old[key]["peak_memory"])
+        rows.append(
+            (key, time_ratio, memory_ratio, old[key]["final_fitness"], new[key]["final_fitness"])
+        )
+        if time_ratio is not None and time_ratio > threshold:
+            regressions.append(key)
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=1.1, help="allowed wall time ratio")
+    args = parser.parse_args()
+    rows, regressions = compare(load(args.old), load(args.new), args.threshold)
+    print(f"{'optimizer':<10}{'d':>6}{'n':>6}{'budget':>8}{'seed':>6}"
+          f"{'time':>9}{'memory':>9}{'old f(x)':>14}{'new f(x)':>14}")
+    for (name, _, _, dimension, population, budget, seed, _), time_ratio, memory_ratio, old_f, new_f in rows:
+        print(
+            f"{name:<10}{dimension:>6}{population or '-':>6}{budget:>8}{seed:>6}"
+            f"{time_ratio or float('nan'):>9.2f}{memory_ratio or float('nan'):>9.2f}"
+            f"{old_f:>14.6g}{new_f:>14.6g}"
+        )
+    print(f"{len(rows)} runs compared, {len(regressions)} slower than x{args.threshold}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
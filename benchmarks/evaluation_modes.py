@@ -0,0 +1,78 @@
+"""
+Serial, thread-pool and process-pool evaluation of one population.
+
+Compares the three evaluation modes of pyMetaheuristic.evaluation.Evaluator on
+the cheap, pure-Python Easom function and on a BLAS-bound objective that spends
+its time in a linear solve, which releases the GIL. Pin BLAS to a single
+thread (e.g. OPENBLAS_NUM_THREADS=1) so the pools are not competing with it.
+
+    OPENBLAS_NUM_THREADS=1 python benchmarks/evaluation_modes.py --population 256 --jobs 4
+"""
+import argparse
+import time
+
+import numpy as np
+from pyMetaheuristic.evaluation import Evaluator
+from pyMetaheuristic.objectives import easom
+
+MATRIX = None
+
+
+def build_matrix(size=300, seed=0):
+    """Initializer: the system solved by linear_system, built once per process"""
+    global MATRIX
+    generator = np.random.default_rng(seed)
+    MATRIX = generator.standard_normal((size, size)) + size * np.eye(size)
+
+
+def linear_system(variables_values):
+    """Target Function: norm of the solution of a linear system scaled by the variables"""
+    right_hand_side = np.resize(np.asarray(variables_values, dtype=float), MATRIX.shape[0])
+    return float(np.linalg.norm(np.linalg.solve(MATRIX, right_hand_side)))
+
+
+def timed(evaluator, population, repeats):
+    """Best wall time over repeats, in seconds, of evaluating population"""
+    evaluator.evaluate(population[:, 0: population.shape[1] - 1], out=population[:, -1])
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        evaluator.evaluate(population[:, 0: population.shape[1] - 1], out=population[:, -1])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--population", type=int, default=256)
+    parser.add_argument("--dimension", type=int, default=2)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    build_matrix()
+    population = np.random.default_rng(1).uniform(
+        -5, 5, (args.population, args.dimension + 1)
+    )
+    modes = {
+        "serial": dict(),
+        "thread": dict(n_jobs=args.jobs, executor="thread"),
+        "process": dict(n_jobs=args.jobs, executor="process"),
+    }
+    print(f"{'objective':<15}{'mode':<10}{'seconds':>10}{'speedup':>10}")
+    for target_function in (easom, linear_system):
+        serial = None
+        for mode, options in modes.items():
+            evaluator = Evaluator(target_function, initializer=build_matrix, **options)
+            try:
+                seconds = timed(evaluator, population, args.repeats)
+            finally:
+                evaluator.close()
+            serial = serial or seconds
+            print(
+                f"{target_function.__name__:<15}{mode:<10}"
+                f"{seconds:>10.4f}{serial / seconds:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark suite for every optimizer of pyMetaheuristic.
+
+Runs each optimizer on a function of pyMetaheuristic.objectives (the sphere by
+default) over a grid of dimensions, population sizes, evaluation budgets and
+seeds, and writes one JSON record per run with the wall time, evaluations per
+second, peak memory and final fitness. The optimum is shifted away from its
+usual place (--no-shift keeps it), since some optimizers start their leaders at
+the origin, where most of these functions have their minimum. Two result files, e.g. from two commits,
+are compared with benchmarks/compare.py.
+
+Every run stops through StoppingCriteria(max_evaluations=budget), so it may
+overshoot the budget by the evaluations of one iteration; the evaluations
+actually made are recorded next to it. Peak memory is measured with tracemalloc
+in a second run with the same seed, so that its overhead does not distort the
+wall time.
+
+    python benchmarks/suite.py --quick --output before.json
+    python benchmarks/suite.py --optimizers pso de --objective rastrigin --output after.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+from pyMetaheuristic import objectives
+from pyMetaheuristic.adaptive_random_search import ars
+from pyMetaheuristic.ant_lion_optimizer import alo
+from pyMetaheuristic.artificial_bee_colony_optimization import abco
+from pyMetaheuristic.bat_algorithm import bat_a
+from pyMetaheuristic.cross_entropy_method import cem
+from pyMetaheuristic.cuckoo_search import cuckoo_s
+from pyMetaheuristic.differential_evolution import de
+from pyMetaheuristic.dispersive_flies_optimization import dfo
+from pyMetaheuristic.evaluation import Evaluator
+from pyMetaheuristic.events import StoppingCriteria
+from pyMetaheuristic.firefly_algorithm import firefly_a
+from pyMetaheuristic.flower_pollination_algorithm import fpa
+from pyMetaheuristic.genetic_algorithm import ga
+from pyMetaheuristic.grey_wolf_optimizer import gwo
+from pyMetaheuristic.memetic_algorithm import memetic_a
+from pyMetaheuristic.moth_flame_optimization import mfa
+from pyMetaheuristic.multiverse_optimizer import mvo
+from pyMetaheuristic.particle_swarm_optimization import pso
+from pyMetaheuristic.random_search import random_s
+from pyMetaheuristic.salp_swarm_algorithm import ssa
+from pyMetaheuristic.simulated_anealling import sa
+from pyMetaheuristic.sine_cosine_algorithm import sine_cosine_a
+from pyMetaheuristic.whale_optimization_algorithm import whale_optimization_a
+
+# Optimizer: (entry point, population argument, iterations argument)
+OPTIMIZERS = {
+    "ars": (ars.adaptive_random_search, "solutions", "iterations"),
+    "alo": (alo.ant_lion_optimizer, "colony_size", "iterations"),
+    "abc": (abco.ArtificialBeeColony, "food_sources", "iterations"),
+    "bat": (bat_a.bat_algorithm, "swarm_size", "iterations"),
+    "cem": (cem.cross_entropy_method, "n", "iterations"),
+    "cuckoo": (cuckoo_s.cuckoo_search, "birds", "iterations"),
+    "de": (de.differential_evolution, "n", "iterations"),
+    "dfo": (dfo.dispersive_fly_optimization, "swarm_size", "generations"),
+    "firefly": (firefly_a.firefly_algorithm, "swarm_size", "generations"),
+    "fpa": (fpa.flower_pollination_algorithm, "flowers", "iterations"),
+    "ga": (ga.genetic_algorithm, "population_size", "generations"),
+    "gwo": (gwo.grey_wolf_optimizer, "pack_size", "iterations"),
+    "memetic": (memetic_a.Memetic, "population_size", "generations"),
+    "mfo": (mfa.moth_flame_algorithm, "swarm_size", "generations"),
+    "mvo": (mvo.muti_verse_optimizer, "universes", "iterations"),
+    "pso": (pso.particle_swarm_optimization, "swarm_size", "iterations"),
+    "random": (random_s.random_search, "solutions", "iterations"),
+    "ssa": (ssa.salp_swarm_algorithm, "swarm_size", "iterations"),
+    "sa": (sa.simulated_annealing, None, "temperature_iterations"),
+    "sca": (sine_cosine_a.sine_cosine_algorithm, "solutions", "iterations"),
+    "woa": (whale_optimization_a.WOA, "hunting_party", "iterations"),
+}
+
+QUICK = dict(dimensions=[2, 10], populations=[10], budgets=[500], seeds=[0])
+FULL = dict(
+    dimensions=[2, 10, 100, 1000], populations=[10, 50], budgets=[1000, 10000], seeds=[0]
+)
+
+
+def target(objective, dimension, shifted=True):
+    """Target function and search box of a run."""
+    function = getattr(objectives, objective)
+    (low, high), _ = objectives.DOMAINS[objective]
+    if shifted:
+        shift = objectives.random_shift(dimension, 0.1 * low, 0.1 * high, seed=dimension)
+        function = objectives.ShiftedRotated(function, shift=shift)
+    return function, (low,) * dimension, (high,) * dimension
+
+
+def run(
+        name,
+        dimension,
+        population,
+        budget,
+        seed,
+        objective="sphere",
+        shifted=True,
+        vectorized=False,
+):
+    """
+    Run an optimizer once, until it has used up budget evaluations.
+
+    :return: the final IterationEvent of the run.
+    """
+    entry, population_name, iterations_name = OPTIMIZERS[name]
+    function, min_values, max_values = target(objective, dimension, shifted)
+    events = []
+    kwargs = dict(
+        target_function=Evaluator(function, vectorized=vectorized),
+        min_values=min_values,
+        max_values=max_values,
+        callback=events.append,
+        stop=StoppingCriteria(max_evaluations=budget),
+        seed=seed,
+    )
+    kwargs[iterations_name] = budget
+    if population_name is not None:
+        kwargs[population_name] = population
+    if isinstance(entry, type):
+        entry(**kwargs).minimize()
+    else:
+        entry(**kwargs)
+    return events[-1]
+
+
+def benchmark(
+        name,
+        dimension,
+        population,
+        budget,
+        seed,
+        memory=True,
+        objective="sphere",
+        shifted=True,
+        vectorized=False,
+):
+    """Benchmark record of one run."""
+    options = dict(objective=objective, shifted=shifted, vectorized=vectorized)
+    start = time.perf_counter()
+    final = run(name, dimension, population, budget, seed, **options)
+    wall_time = time.perf_counter() - start
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run(name, dimension, population, budget, seed, **options)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return dict(
+        optimizer=name,
+        objective=objective,
+        shifted=shifted,
+        dimension=dimension,
+        population=population if OPTIMIZERS[name][1] is not None else None,
+        budget=budget,
+        seed=seed,
+        vectorized=vectorized,
+        iterations=final.iteration,
+        evaluations=final.evaluations,
+        stopped_by=final.reason,
+        wall_time=wall_time,
+        evaluations_per_second=final.evaluations / wall_time if wall_time > 0 else None,
+        peak_memory=peak_memory,
+        final_fitness=final.best_fitness,
+    )
+
+
+def metadata():
+    """Where and when the results were produced."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return dict(
+        commit=commit,
+        created=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        python=platform.python_version(),
+        numpy=np.__version__,
+        platform=platform.platform(),
+        processor=platform.processor(),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--optimizers", nargs="+", choices=sorted(OPTIMIZERS), default=sorted(OPTIMIZERS))
+    parser.add_argument("--dimensions", nargs="+", type=int)
+    parser.add_argument("--populations", nargs="+", type=int)
+    parser.add_argument("--budgets", nargs="+", type=int)
+    parser.add_argument("--seeds", nargs="+", type=int)
+    parser.add_argument("--objective", choices=sorted(objectives.DOMAINS), default="sphere")
+    parser.add_argument("--no-shift", dest="shifted", action="store_false", help="unshifted objective")
+    parser.add_argument("--quick", action="store_true", help="small grid for a smoke run")
+    parser.add_argument("--vectorized", action="store_true", help="use the batch objective")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip tracemalloc")
+    parser.add_argument("--output", default="benchmark.json")
+    args = parser.parse_args()
+    grid = QUICK if args.quick else FULL
+    dimensions = args.dimensions or grid["dimensions"]
+    populations = args.populations or grid["populations"]
+    budgets = args.budgets or grid["budgets"]
+    seeds = args.seeds or grid["seeds"]
+    results = []
+    for name in args.optimizers:
+        # an optimizer without a population is run once per remaining grid point
+        name_populations = populations if OPTIMIZERS[name][1] is not None else populations[:1]
+        for dimension in dimensions:
+            for population in name_populations:
+                for budget in budgets:
+                    for seed in seeds:
+                        record = benchmark(
+                            name,
+                            dimension,
+                            population,
+                            budget,
+                            seed,
+                            memory=args.memory,
+                            objective=args.objective,
+                            shifted=args.shifted,
+                            vectorized=args.vectorized,
+                        )
+                        results.append(record)
+                        print(
+                            f"{name:<8} d={dimension:<5} n={population:<4} budget={budget:<6} "
+                            f"seed={seed:<3} {record['wall_time']:9.3f}s "
+                            f"{record['evaluations_per_second'] or 0:12.0f} evals/s "
+                            f"f(x) = {record['final_fitness']:.6g}"
+                        )
+    with open(args.output, "w") as output:
+        json.dump(dict(metadata=metadata(), results=results), output, indent=2)
+    print(f"{len(results)} runs written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
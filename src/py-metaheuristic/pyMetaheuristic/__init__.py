@@ -1,5 +1,7 @@
-import os
+from pyMetaheuristic.evaluation import AsyncEvaluator, Evaluator, FitnessCache
+from pyMetaheuristic.events import IterationEvent, Reporter, StoppingCriteria
+from pyMetaheuristic.rng import RandomEngine, engine, seed
 
 
 def rando():
-    return int.from_bytes(os.urandom(8), byteorder="big") / ((1 << 64) - 1)
+    return engine.random()
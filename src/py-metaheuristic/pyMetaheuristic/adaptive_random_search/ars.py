@@ -16,11 +16,12 @@
 import copy
 import logging
 import os
-import random
 
 # Required Libraries
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
@@ -30,8 +31,10 @@ def initial_position(
     position = np.zeros((solutions, len(min_values) + 1))
     for i in range(solutions):
         for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+            position[i, j] = engine.uniform(min_values[j], max_values[j])
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -47,9 +50,11 @@ def step(target_function, step_size, position, min_values=(-5, -5), max_values=(
             position_temp[i, j] = np.clip(
                 minimun + (maximum - minimun) * rand, min_values[j], max_values[j]
             )
-        position_temp[i, -1] = target_function(
-            position_temp[i, 0: position_temp.shape[1] - 1]
-        )
+    evaluate(
+        target_function,
+        position_temp[:, 0: position_temp.shape[1] - 1],
+        out=position_temp[:, -1],
+    )
     return position_temp
 
 
@@ -84,9 +89,11 @@ def large_step(
             position_temp[i, j] = np.clip(
                 minimun + (maximum - minimun) * rand, min_values[j], max_values[j]
             )
-        position_temp[i, -1] = target_function(
-            position_temp[i, 0: position_temp.shape[1] - 1]
-        )
+    evaluate(
+        target_function,
+        position_temp[:, 0: position_temp.shape[1] - 1],
+        out=position_temp[:, -1],
+    )
     return step_size_temp, position_temp
 
 
@@ -101,6 +108,17 @@ def adaptive_random_search(
         iterations=50,
         large_step_threshold=10,
         improvement_threshold=25,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     ARS Function
@@ -119,8 +137,33 @@ def adaptive_random_search(
     :param iterations:
     :param large_step_threshold:
     :param improvement_threshold:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     threshold = [0] * solutions
     position = initial_position(
@@ -136,7 +179,8 @@ def adaptive_random_search(
         for j in range(len(min_values)):
             step_size[i][j] = (max_values[j] - min_values[j]) * step_size_factor
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_solution[-1])
+        if monitor(count, best_solution[-1]):
+            break
         position_step = step(target_function=target_function, step_size=step_size, position=position,
                              min_values=min_values, max_values=max_values)
         step_large, position_large_step = large_step(
@@ -171,10 +215,20 @@ def adaptive_random_search(
         if best_solution[-1] > position[position[:, -1].argsort()][0, -1]:
             best_solution = np.copy(position[position[:, -1].argsort()][0, :])
         count = count + 1
-    print(best_solution)
+    target_function.close()
+    monitor.close(count, best_solution[-1])
     return best_solution, position
 
 
+# Function: Asynchronous Entry Point
+async def adaptive_random_search_async(target_function, **kwargs):
+    """
+    adaptive_random_search, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(adaptive_random_search, target_function, **kwargs)
+
+
 def target_function_plot(front_1, front_2, func_1_values):
     """
     plot the target function
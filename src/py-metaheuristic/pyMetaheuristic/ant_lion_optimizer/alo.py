@@ -23,72 +23,68 @@ Five main steps:
 
 ############################################################################
 
-import random
-
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+from pyMetaheuristic.selection import fitness_function, roulette_wheel
 
 
 def initial_population(
         target_function, colony_size=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     population = np.zeros((colony_size, len(min_values) + 1))
-    for i in range(colony_size):
-        for j in range(len(min_values)):
-            population[i, j] = random.uniform(min_values[j], max_values[j])
-        population[i, -1] = target_function(population[i, 0: population.shape[1] - 1])
+    population[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(colony_size, len(min_values)),
+    )
+    evaluate(
+        target_function,
+        population[:, 0: population.shape[1] - 1],
+        out=population[:, -1],
+    )
     return population
 
 
-# Function: Fitness
-def fitness_function(population):
-    fitness = np.zeros((population.shape[0], 2))
-    for i in range(fitness.shape[0]):
-        fitness[i, 0] = 1 / (1 + population[i, -1] + abs(population[:, -1].min()))
-    fit_sum = fitness[:, 0].sum()
-    fitness[0, 1] = fitness[0, 0]
-    for i in range(1, fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 0] + fitness[i - 1, 1]
-    for i in range(fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 1] / fit_sum
-    return fitness
-
-
-# Function: Selection
-def roulette_wheel(fitness):
-    ix = 0
-    _random = rando()
-    for i in range(fitness.shape[0]):
-        if _random <= fitness[i, 1]:
-            ix = i
-            break
-    return ix
+# Function: Random Walk
+def random_walk(walks, lowest, highest):
+    """
+    Advance every walk by one +1 or -1 step, in place, and return where each now
+    lies within the range it has covered so far, from 0 at its lowest to 1 at its
+    highest (1/2 while the range is empty).
 
+    :param walks: position of each walk, e.g. an (2, colony_size, dimension) array.
+    :param lowest: lowest position each walk has reached.
+    :param highest: highest position each walk has reached.
+    """
+    walks += 2 * (engine.random(walks.shape) > 0.5) - 1
+    np.minimum(lowest, walks, out=lowest)
+    np.maximum(highest, walks, out=highest)
+    span = highest - lowest
+    return np.divide(
+        walks - lowest, span, out=np.full(walks.shape, 0.5), where=span > 0
+    )
 
-# Function: Random Walk
-def random_walk(iterations):
-    x_random_walk = [0] * (iterations + 1)
-    x_random_walk[0] = 0
-    for k in range(1, len(x_random_walk)):
-        rand = rando()
-        if rand > 0.5:
-            rand = 1
-        else:
-            rand = 0
-        x_random_walk[k] = x_random_walk[k - 1] + (2 * rand - 1)
-    return x_random_walk
+
+# Function: Exploration Ratio
+def exploration_ratio(count, iterations):
+    """Ratio I that shrinks the walks around the antlions as the run goes on."""
+    stages = ((0.95, 6), (0.90, 5), (0.75, 4), (0.50, 3), (0.10, 2))
+    for fraction, w_exploration in stages:
+        if count > fraction * iterations:
+            return (10 ** w_exploration) * (count / iterations)
+    return 1
 
 
 # Function: Combine Ants
 def combine(population, antlions):
     combination = np.vstack([population, antlions])
     combination = combination[combination[:, -1].argsort()]
-    for i in range(population.shape[0]):
-        for j in range(population.shape[1]):
-            antlions[i, j] = combination[i, j]
-            population[i, j] = combination[i + population.shape[0], j]
+    antlions[:, :] = combination[: population.shape[0]]
+    population[:, :] = combination[population.shape[0]:]
     return population, antlions
 
 
@@ -101,77 +97,47 @@ def update_ants(
         iterations,
         min_values=(-5, -5),
         max_values=(5, 5),
+        walks=None,
 ):
-    i_ratio = 1
-    minimum_c_i = np.zeros((1, population.shape[1]))
-    maximum_d_i = np.zeros((1, population.shape[1]))
-    minimum_c_e = np.zeros((1, population.shape[1]))
-    maximum_d_e = np.zeros((1, population.shape[1]))
-    elite_antlion = np.zeros((1, population.shape[1]))
-    if count > 0.10 * iterations:
-        w_exploration = 2
-        i_ratio = (10 ** w_exploration) * (count / iterations)
-    elif count > 0.50 * iterations:
-        w_exploration = 3
-        i_ratio = (10 ** w_exploration) * (count / iterations)
-    elif count > 0.75 * iterations:
-        w_exploration = 4
-        i_ratio = (10 ** w_exploration) * (count / iterations)
-    elif count > 0.90 * iterations:
-        w_exploration = 5
-        i_ratio = (10 ** w_exploration) * (count / iterations)
-    elif count > 0.95 * iterations:
-        w_exploration = 6
-        i_ratio = (10 ** w_exploration) * (count / iterations)
-    for i in range(population.shape[0]):
-        fitness = fitness_function(antlions)
-        ant_lion = roulette_wheel(fitness)
-        for j in range(population.shape[1] - 1):
-            minimum_c_i[0, j] = antlions[antlions[:, -1].argsort()][0, j] / i_ratio
-            maximum_d_i[0, j] = antlions[antlions[:, -1].argsort()][-1, j] / i_ratio
-            elite_antlion[0, j] = antlions[antlions[:, -1].argsort()][0, j]
-            minimum_c_e[0, j] = antlions[antlions[:, -1].argsort()][0, j] / i_ratio
-            maximum_d_e[0, j] = antlions[antlions[:, -1].argsort()][-1, j] / i_ratio
-            rand = rando()
-            if rand < 0.5:
-                minimum_c_i[0, j] = minimum_c_i[0, j] + antlions[ant_lion, j]
-                minimum_c_e[0, j] = minimum_c_e[0, j] + elite_antlion[0, j]
-            else:
-                minimum_c_i[0, j] = -minimum_c_i[0, j] + antlions[ant_lion, j]
-                minimum_c_e[0, j] = -minimum_c_e[0, j] + elite_antlion[0, j]
-
-            rand = rando()
-            if rand >= 0.5:
-                maximum_d_i[0, j] = maximum_d_i[0, j] + antlions[ant_lion, j]
-                maximum_d_e[0, j] = maximum_d_e[0, j] + elite_antlion[0, j]
-            else:
-                maximum_d_i[0, j] = -maximum_d_i[0, j] + antlions[ant_lion, j]
-                maximum_d_e[0, j] = -maximum_d_e[0, j] + elite_antlion[0, j]
-            x_random_walk = random_walk(iterations)
-            e_random_walk = random_walk(iterations)
-            min_x, max_x = min(x_random_walk), max(x_random_walk)
-            x_random_walk[count] = (
-                                           (
-                                                   (x_random_walk[count] - min_x)
-                                                   * (maximum_d_i[0, j] - minimum_c_i[0, j])
-                                           )
-                                           / (max_x - min_x)
-                                   ) + minimum_c_i[0, j]
-            min_e, max_e = min(e_random_walk), max(e_random_walk)
-            e_random_walk[count] = (
-                                           (
-                                                   (e_random_walk[count] - min_e)
-                                                   * (maximum_d_e[0, j] - minimum_c_e[0, j])
-                                           )
-                                           / (max_e - min_e)
-                                   ) + minimum_c_e[0, j]
-            population[i, j] = np.clip(
-                (x_random_walk[count] + e_random_walk[count]) / 2,
-                min_values[j],
-                max_values[j],
-            )
-        population[i, -1] = target_function(population[i, 0: population.shape[1] - 1])
-        return population, antlions
+    """
+    Move the whole colony: each ant walks around an antlion picked by the
+    roulette wheel and around the elite antlion, within bounds that shrink by
+    exploration_ratio, and lands halfway between the two walks.
+
+    :param walks: (3, 2, colony_size, dimension) array with the positions, lowest
+        and highest positions of the two walks of every ant, carried from one
+        iteration to the next; fresh walks when None.
+    """
+    if walks is None:
+        walks = np.zeros((3, 2) + population[:, :-1].shape)
+    i_ratio = exploration_ratio(count, iterations)
+    minimum_c = np.asarray(min_values, dtype=float) / i_ratio
+    maximum_d = np.asarray(max_values, dtype=float) / i_ratio
+    elite_antlion = antlions[np.argmin(antlions[:, -1]), :-1]
+    selected = roulette_wheel(fitness_function(antlions), population.shape[0])
+    ant_lion = antlions[selected, :-1]
+    flip_c = engine.random(ant_lion.shape) < 0.5
+    flip_d = engine.random(ant_lion.shape) >= 0.5
+    minimum_c = np.where(flip_c, minimum_c, -minimum_c)
+    maximum_d = np.where(flip_d, maximum_d, -maximum_d)
+    x_random_walk, e_random_walk = random_walk(walks[0], walks[1], walks[2])
+    x_random_walk = (
+            x_random_walk * (maximum_d - minimum_c) + minimum_c + ant_lion
+    )
+    e_random_walk = (
+            e_random_walk * (maximum_d - minimum_c) + minimum_c + elite_antlion
+    )
+    population[:, :-1] = np.clip(
+        (x_random_walk + e_random_walk) / 2,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+    evaluate(
+        target_function,
+        population[:, 0: population.shape[1] - 1],
+        out=population[:, -1],
+    )
+    return population, antlions
 
 
 # ALO Function
@@ -181,6 +147,17 @@ def ant_lion_optimizer(
         min_values=(-5, -5),
         max_values=(5, 5),
         iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
 
@@ -191,8 +168,33 @@ def ant_lion_optimizer(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     population = initial_population(
         target_function=target_function,
@@ -206,9 +208,11 @@ def ant_lion_optimizer(
         min_values=min_values,
         max_values=max_values,
     )
-    elite = np.copy(antlions[antlions[:, -1].argsort()][0, :])
+    elite = np.copy(antlions[np.argmin(antlions[:, -1]), :])
+    walks = np.zeros((3, 2) + population[:, :-1].shape)
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", elite[-1])
+        if monitor(count, elite[-1]):
+            break
         population, antlions = update_ants(
             target_function=target_function,
             population=population,
@@ -217,13 +221,23 @@ def ant_lion_optimizer(
             iterations=iterations,
             min_values=min_values,
             max_values=max_values,
+            walks=walks,
         )
         population, antlions = combine(population, antlions)
-        value = np.copy(antlions[antlions[:, -1].argsort()][0, :])
-        if elite[-1] > value[-1]:
-            elite = np.copy(value)
+        if elite[-1] > antlions[0, -1]:
+            elite = np.copy(antlions[0, :])
         else:
-            antlions[antlions[:, -1].argsort()][0, :] = np.copy(elite)
+            antlions[0, :] = elite
         count = count + 1
-    print(elite)
+    target_function.close()
+    monitor.close(count, elite[-1])
     return elite
+
+
+# Function: Asynchronous Entry Point
+async def ant_lion_optimizer_async(target_function, **kwargs):
+    """
+    ant_lion_optimizer, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(ant_lion_optimizer, target_function, **kwargs)
@@ -23,10 +23,11 @@ randomly chosen from the solution pool.
 
 ############################################################################
 
-import random
-
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+from pyMetaheuristic.selection import fitness_matrix, roulette_wheel
 
 
 class ArtificialBeeColony:
@@ -53,6 +54,17 @@ class ArtificialBeeColony:
                  employed_bees=3,
                  outlookers_bees=3,
                  limit=3,
+                 vectorized=False,
+                 n_jobs=None,
+                 executor=None,
+                 initializer=None,
+                 initargs=(),
+                 chunksize=None,
+                 concurrency=None,
+                 cache=None,
+                 callback=None,
+                 stop=None,
+                 seed=None,
                  ):
         """
 
@@ -64,8 +76,34 @@ class ArtificialBeeColony:
         :param employed_bees:
         :param outlookers_bees:
         :param limit:
+        :param vectorized:
+        :param n_jobs:
+        :param executor:
+        :param initializer:
+        :param initargs:
+        :param chunksize:
+        :param concurrency:
+        :param cache:
+        :param callback:
+        :param stop:
+        :param seed:
         """
-        self.target_function = target_function
+        if seed is not None:
+            engine.seed(seed)
+        self.target_function = as_evaluator(
+            target_function,
+            vectorized=vectorized,
+            n_jobs=n_jobs,
+            executor=executor,
+            initializer=initializer,
+            initargs=initargs,
+            chunksize=chunksize,
+            concurrency=concurrency,
+            cache=cache,
+        )
+        self.evaluations = self.target_function.evaluations
+        self.callback = callback
+        self.stop = stop
         self.food_sources = food_sources
         self.iterations = iterations
         self.min_values = min_values
@@ -74,7 +112,6 @@ class ArtificialBeeColony:
         self.outlookers_bees = outlookers_bees
         self.limit = limit
         self.sources = np.zeros((food_sources, len(min_values) + 1))
-        self.sources = self.initial_sources()
 
         self.searching_in_sources = np.copy(self.sources)
         self.fitness = np.zeros((self.searching_in_sources.shape[0], 2))
@@ -88,8 +125,12 @@ class ArtificialBeeColony:
         """ Initialize Variables """
         for i in range(self.food_sources):
             for j in range(len(self.min_values)):
-                self.sources[i, j] = random.uniform(self.min_values[j], self.max_values[j])
-            self.sources[i, -1] = self.target_function(self.sources[i, 0: self.sources.shape[1] - 1])
+                self.sources[i, j] = engine.uniform(self.min_values[j], self.max_values[j])
+        evaluate(
+            self.target_function,
+            self.sources[:, 0: self.sources.shape[1] - 1],
+            out=self.sources[:, -1],
+        )
         return self.sources
 
     @staticmethod
@@ -103,100 +144,97 @@ class ArtificialBeeColony:
 
     def fitness_function(self, searching_in_sources):
         """Fitness"""
-
-        for i in range(self.fitness.shape[0]):
-            # fitness[i,0] = 1/(1+ searching_in_sources[i,-1] + abs(searching_in_sources[:,-1].min()))
-            self.fitness[i, 0] = self.fitness_calc(searching_in_sources[i, -1])
-        fit_sum = self.fitness[:, 0].sum()
-        self.fitness[0, 1] = self.fitness[0, 0]
-        for i in range(1, self.fitness.shape[0]):
-            self.fitness[i, 1] = self.fitness[i, 0] + self.fitness[i - 1, 1]
-        for i in range(self.fitness.shape[0]):
-            self.fitness[i, 1] = self.fitness[i, 1] / fit_sum
+        function_values = np.abs(searching_in_sources[:, -1])
+        self.fitness = fitness_matrix(
+            np.where(
+                searching_in_sources[:, -1] >= 0,
+                1.0 / (1.0 + function_values),
+                1.0 + function_values,
+            )
+        )
         return self.fitness
 
-    def roulette_wheel(self):
+    def roulette_wheel(self, size=None):
         """Selection"""
-        ix = 0
-        _random = rando()
-        for i in range(self.fitness.shape[0]):
-            if _random <= self.fitness[i, 1]:
-                ix = i
-                break
-        return ix
+        return roulette_wheel(self.fitness, size)
 
     def employed_bee(self):
         """ Bees with jobs """
+        candidates = np.copy(self.searching_in_sources[:, 0: len(self.min_values)])
         for i in range(self.searching_in_sources.shape[0]):
-            phi = random.uniform(-1, 1)
-            j = np.random.randint(len(self.min_values), size=1)[0]
-            k = np.random.randint(self.searching_in_sources.shape[0], size=1)[0]
+            phi = engine.uniform(-1, 1)
+            j = engine.integers(len(self.min_values))
+            k = engine.integers(self.searching_in_sources.shape[0])
             while i == k:
-                k = np.random.randint(self.searching_in_sources.shape[0], size=1)[0]
+                k = engine.integers(self.searching_in_sources.shape[0])
             xij = self.searching_in_sources[i, j]
             xkj = self.searching_in_sources[k, j]
             vij = xij + phi * (xij - xkj)
-            for variable in range(len(self.min_values)):
-                self.new_solution[0, variable] = self.searching_in_sources[i, variable]
-            self.new_solution[0, j] = np.clip(vij, self.min_values[j], self.max_values[j])
-            new_function_value = self.target_function(self.new_solution[0, 0: self.new_solution.shape[1]])
-            if self.fitness_calc(new_function_value) > self.fitness_calc(self.searching_in_sources[i, -1]):
-                self.searching_in_sources[i, j] = self.new_solution[0, j]
-                self.searching_in_sources[i, -1] = new_function_value
+            candidates[i, j] = np.clip(vij, self.min_values[j], self.max_values[j])
+        new_function_values = evaluate(self.target_function, candidates)
+        for i in range(self.searching_in_sources.shape[0]):
+            if self.fitness_calc(new_function_values[i]) > self.fitness_calc(self.searching_in_sources[i, -1]):
+                self.searching_in_sources[i, 0: len(self.min_values)] = candidates[i, :]
+                self.searching_in_sources[i, -1] = new_function_values[i]
             else:
                 self.trial[i, 0] = self.trial[i, 0] + 1
-            for variable in range(len(self.min_values)):
-                self.new_solution[0, variable] = 0.0
         return self.searching_in_sources, self.trial
 
     def outlooker_bee(self):
         """Outlooker"""
-        for _ in range(self.improving_sources.shape[0]):
-            i = self.roulette_wheel()
-            phi = random.uniform(-1, 1)
-            j = np.random.randint(len(self.min_values), size=1)[0]
-            k = np.random.randint(self.improving_sources.shape[0], size=1)[0]
+        sources = self.roulette_wheel(self.improving_sources.shape[0])
+        candidates = np.zeros((self.improving_sources.shape[0], len(self.min_values)))
+        for n, i in enumerate(sources):
+            phi = engine.uniform(-1, 1)
+            j = engine.integers(len(self.min_values))
+            k = engine.integers(self.improving_sources.shape[0])
             while i == k:
-                k = np.random.randint(self.improving_sources.shape[0], size=1)[0]
+                k = engine.integers(self.improving_sources.shape[0])
             xij = self.improving_sources[i, j]
             xkj = self.improving_sources[k, j]
             vij = xij + phi * (xij - xkj)
-            for variable in range(len(self.min_values)):
-                self.new_solution[0, variable] = self.improving_sources[i, variable]
-            self.new_solution[0, j] = np.clip(vij, self.min_values[j], self.max_values[j])
-            new_function_value = self.target_function(self.new_solution[0, 0: self.new_solution.shape[1]])
-            if self.fitness_calc(new_function_value) > self.fitness_calc(self.improving_sources[i, -1]):
-                self.improving_sources[i, j] = self.new_solution[0, j]
-                self.improving_sources[i, -1] = new_function_value
+            candidates[n, :] = self.improving_sources[i, 0: len(self.min_values)]
+            candidates[n, j] = np.clip(vij, self.min_values[j], self.max_values[j])
+        new_function_values = evaluate(self.target_function, candidates)
+        for n, i in enumerate(sources):
+            if self.fitness_calc(new_function_values[n]) > self.fitness_calc(self.improving_sources[i, -1]):
+                self.improving_sources[i, 0: len(self.min_values)] = candidates[n, :]
+                self.improving_sources[i, -1] = new_function_values[n]
                 self.trial_update[i, 0] = 0
             else:
                 self.trial_update[i, 0] = self.trial_update[i, 0] + 1
-            for variable in range(len(self.min_values)):
-                self.new_solution[0, variable] = 0.0
         return self.improving_sources, self.trial_update
 
     def scouter_bee(self):
         """Scouter"""
+        abandoned = []
         for i in range(self.improving_sources.shape[0]):
             if self.trial_update[i, 0] > self.limit:
                 for j in range(self.improving_sources.shape[1] - 1):
-                    self.improving_sources[i, j] = np.random.normal(0, 1, 1)[0]
-                function_value = self.target_function(
-                    self.improving_sources[i, 0: self.improving_sources.shape[1] - 1]
-                )
-                self.improving_sources[i, -1] = function_value
+                    self.improving_sources[i, j] = engine.normal(0, 1)
+                abandoned.append(i)
+        self.improving_sources[abandoned, -1] = evaluate(
+            self.target_function, self.improving_sources[abandoned, 0: self.improving_sources.shape[1] - 1]
+        )
         return self.improving_sources
 
     # ABC Function
     def minimize(self):
         """ minimize """
+        monitor = Monitor(
+            self.target_function, self.callback, self.stop, evaluations=self.evaluations
+        )
         count = 0
-        best_value = float("inf")
+        self.sources = self.initial_sources()
+        self.searching_in_sources = np.copy(self.sources)
+        self.improving_sources = np.copy(self.searching_in_sources)
+        best_solution = np.copy(self.sources[self.sources[:, -1].argsort()][0, :])
+        best_value = best_solution[-1]
 
         self.fitness = self.fitness_function(self.sources)
         while count <= self.iterations:
-            if count > 0:
-                print("Iteration = ", count, " f(x) = ", best_value)
+            if monitor(count, best_value):
+                break
             e_bee = self.employed_bee()
             for _ in range(self.employed_bees - 1):
                 e_bee = self.employed_bee()
@@ -211,5 +249,13 @@ class ArtificialBeeColony:
             sources = self.scouter_bee()
             self.fitness = self.fitness_function(sources)
             count = count + 1
-        print(best_solution)
+        self.target_function.close()
+        monitor.close(count, best_value)
         return best_solution
+
+    async def minimize_async(self):
+        """
+        minimize, awaited without blocking the running event loop
+        :return:
+        """
+        return await run_async(self.minimize)
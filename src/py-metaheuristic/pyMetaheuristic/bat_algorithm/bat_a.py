@@ -14,12 +14,13 @@
 ############################################################################
 
 import math
-import random
 
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
@@ -32,10 +33,12 @@ def initial_position(
     loudness = np.zeros((swarm_size, 1))
     for i in range(swarm_size):
         for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+            position[i, j] = engine.uniform(min_values[j], max_values[j])
         rate[i, 0] = rando()
-        loudness[i, 0] = random.uniform(1, 2)
+        loudness[i, 0] = engine.uniform(1, 2)
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position, velocity, frequency, rate, loudness
 
 
@@ -72,12 +75,11 @@ def update_position(
             elif position_temp[i, k] < min_values[k]:
                 position_temp[i, k] = min_values[k]
                 velocity[i, k] = 0
-        position_temp[i, -1] = target_function(position_temp[i, 0: len(max_values)])
         rand = rando()
         if rand > rate[i, 0]:
             for L in range(len(max_values)):
                 position_temp[i, L] = (
-                        best_ind[L] + random.uniform(-1, 1) * loudness.mean()
+                        best_ind[L] + engine.uniform(-1, 1) * loudness.mean()
                 )
                 if position_temp[i, L] > max_values[L]:
                     position_temp[i, L] = max_values[L]
@@ -85,19 +87,19 @@ def update_position(
                 elif position_temp[i, L] < min_values[L]:
                     position_temp[i, L] = min_values[L]
                     velocity[i, L] = 0
-            position_temp[i, -1] = target_function(
-                position_temp[i, 0: len(max_values)]
-            )
+    evaluate(
+        target_function, position_temp[:, 0: len(max_values)], out=position_temp[:, -1]
+    )
+    for i in range(position.shape[0]):
         rand = rando()
         if rand < position[i, -1] and position_temp[i, -1] <= position[i, -1]:
-            for m in range(len(max_values)):
+            for m in range(position.shape[1]):
                 position[i, m] = position_temp[i, m]
-            position[i, -1] = target_function(position[i, 0: len(max_values)])
             rate[i, 0] = rate[i, 0] * (1 - math.exp(-gama * count))
             loudness[i, 0] = alpha * loudness[i, -1]
-        value = np.copy(position[position[:, -1].argsort()][0, :])
-        if best_ind[-1] > value[-1]:
-            best_ind = np.copy(value)
+    value = np.copy(position[position[:, -1].argsort()][0, :])
+    if best_ind[-1] > value[-1]:
+        best_ind = np.copy(value)
     return position, velocity, frequency, rate, loudness, best_ind
 
 
@@ -112,6 +114,17 @@ def bat_algorithm(
         gama=0.9,
         fmin=0,
         fmax=10,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
 
@@ -127,8 +140,33 @@ def bat_algorithm(
     :param gama:
     :param fmin:
     :param fmax:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position, velocity, frequency, rate, loudness = initial_position(
         target_function=target_function,
@@ -138,7 +176,8 @@ def bat_algorithm(
     )
     best_ind = np.copy(position[position[:, -1].argsort()][0, :])
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_ind[-1])
+        if monitor(count, best_ind[-1]):
+            break
         position, velocity, frequency, rate, loudness, best_ind = update_position(
             target_function=target_function,
             position=position,
@@ -156,5 +195,15 @@ def bat_algorithm(
             max_values=max_values,
         )
         count = count + 1
-    print(best_ind)
+    target_function.close()
+    monitor.close(count, best_ind[-1])
     return best_ind
+
+
+# Function: Asynchronous Entry Point
+async def bat_algorithm_async(target_function, **kwargs):
+    """
+    bat_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(bat_algorithm, target_function, **kwargs)
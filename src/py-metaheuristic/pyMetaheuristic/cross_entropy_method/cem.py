@@ -13,36 +13,60 @@
 
 ############################################################################
 
-import random
-
 # Required Libraries
 import numpy as np
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+
+
+COVARIANCES = ("diagonal", "full", "low-rank")
 
 
 # Function: Initialize Variables
 def initial_guess(target_function, n=5, min_values=(-5, -5), max_values=(5, 5)):
     guess = np.zeros((n, len(min_values) + 1))
-    for i in range(n):
-        for j in range(len(min_values)):
-            guess[i, j] = random.uniform(min_values[j], max_values[j])
-        guess[i, -1] = target_function(guess[i, 0: guess.shape[1] - 1])
+    guess[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(n, len(min_values)),
+    )
+    evaluate(target_function, guess[:, 0: guess.shape[1] - 1], out=guess[:, -1])
     return guess
 
 
 # Function: Variables Mean
 def guess_mean_calc(guess):
-    guess_mean = np.zeros((1, guess.shape[1] - 1))
-    for j in range(guess_mean.shape[1]):
-        guess_mean[0, j] = guess[:, j].mean()
-    return guess_mean
+    return guess[:, :-1].mean(axis=0, keepdims=True)
 
 
 # Function: Variables Standard Deviation
 def guess_std_calc(guess):
-    guess_std = np.zeros((1, guess.shape[1] - 1))
-    for j in range(guess_std.shape[1]):
-        guess_std[0, j] = guess[:, j].std()
-    return guess_std
+    return guess[:, :-1].std(axis=0, keepdims=True)
+
+
+# Function: Elites
+def elite_rows(guess, k_samples=2):
+    """Indices of the k_samples best rows of guess, in no particular order."""
+    return np.argpartition(guess[:, -1], k_samples - 1)[:k_samples]
+
+
+# Function: Covariance Factor
+def covariance_factor(covariance):
+    """Matrix L with L @ L.T equal to a positive semi-definite covariance."""
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    return eigenvectors * np.sqrt(np.maximum(eigenvalues, 0))
+
+
+# Function: Low-Rank Approximation
+def low_rank(columns, rank):
+    """
+    Factor F of the best rank-rank approximation F @ F.T of columns @ columns.T,
+    and the part of its diagonal that F leaves out.
+    """
+    u, s, _ = np.linalg.svd(columns, full_matrices=False)
+    factor = u[:, :rank] * s[:rank]
+    return factor, np.sum(columns ** 2, axis=1) - np.sum(factor ** 2, axis=1)
 
 
 # Function: Generate Samples
@@ -54,39 +78,94 @@ def generate_samples(
         min_values=(-5, -5),
         max_values=(5, 5),
         k_samples=2,
+        factor=None,
 ):
-    guess_ = np.copy(guess)
-    guess_sample = guess_[guess_[:, -1].argsort()]
-    for i in range(k_samples, guess.shape[0]):
-        for j in range(len(min_values)):
-            guess_sample[i, j] = np.clip(
-                np.random.normal(guess_mean[0, j], guess_std[0, j], 1)[0],
-                min_values[j],
-                max_values[j],
-            )
-        guess_sample[i, -1] = target_function(
-            guess_sample[i, 0: guess_sample.shape[1] - 1]
-        )
+    """
+    Keep the k_samples elites of guess in its first rows and replace the others
+    by samples of guess_mean + guess_std * z + factor @ z', drawn in one call.
+
+    :param factor: (d, r) factor of the covariance beyond the diagonal guess_std,
+        or None for a diagonal model.
+    """
+    guess_sample = np.copy(guess)
+    guess_sample[:k_samples] = guess[elite_rows(guess, k_samples)]
+    dimension = guess.shape[1] - 1
+    rank = 0 if factor is None else factor.shape[1]
+    z = engine.standard_normal((guess.shape[0] - k_samples, dimension + rank))
+    samples = guess_mean + guess_std * z[:, :dimension]
+    if factor is not None:
+        samples += z[:, dimension:] @ factor.T
+    guess_sample[k_samples:, :-1] = np.clip(
+        samples,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+    evaluate(
+        target_function,
+        guess_sample[k_samples:, 0: guess_sample.shape[1] - 1],
+        out=guess_sample[k_samples:, -1],
+    )
     return guess_sample
 
 
 # Function: Update Samples
 def update_distribution(guess, guess_mean, guess_std, learning_rate=0.7, k_samples=2):
-    guess = guess[guess[:, -1].argsort()]
-    for j in range(guess_mean.shape[1]):
-        guess_mean[0, j] = (
-                learning_rate * guess_mean[0, j]
-                + (1 - learning_rate) * guess[0:k_samples, j].mean()
-        )
-        guess_std[0, j] = (
-                learning_rate * guess_std[0, j]
-                + (1 - learning_rate) * guess[0:k_samples, j].std()
-        )
-        if guess_std[0, j] < 0.005:
-            guess_std[0, j] = 3
+    elite = guess[elite_rows(guess, k_samples), :-1]
+    guess_mean = learning_rate * guess_mean + (1 - learning_rate) * elite.mean(
+        axis=0, keepdims=True
+    )
+    guess_std = learning_rate * guess_std + (1 - learning_rate) * elite.std(
+        axis=0, keepdims=True
+    )
+    guess_std[guess_std < 0.005] = 3
     return guess_mean, guess_std
 
 
+# Function: Update Full Covariance
+def update_covariance(guess, guess_mean, covariance, learning_rate=0.7, k_samples=2):
+    """
+    Smooth the mean and the (d, d) covariance toward those of the elites. A
+    variable whose standard deviation collapses below 0.005 is reset to a
+    standard deviation of 3, uncorrelated with the others.
+    """
+    elite = guess[elite_rows(guess, k_samples), :-1]
+    guess_mean = learning_rate * guess_mean + (1 - learning_rate) * elite.mean(
+        axis=0, keepdims=True
+    )
+    elite_covariance = np.atleast_2d(np.cov(elite, rowvar=False, bias=True))
+    covariance = learning_rate * covariance + (1 - learning_rate) * elite_covariance
+    collapsed = np.sqrt(np.diag(covariance)) < 0.005
+    covariance[collapsed, :] = 0
+    covariance[:, collapsed] = 0
+    covariance[collapsed, collapsed] = 9
+    return guess_mean, covariance
+
+
+# Function: Update Low-Rank Covariance
+def update_low_rank(
+        guess, guess_mean, guess_std, factor, learning_rate=0.7, k_samples=2
+):
+    """
+    Smooth a covariance factor @ factor.T + diag(guess_std ** 2) toward that of
+    the elites, keeping it at the rank of factor: the smoothed covariance is
+    compressed by an SVD of its (d, r + k_samples) square root, and what the
+    compression drops from the diagonal goes into guess_std.
+    """
+    elite = guess[elite_rows(guess, k_samples), :-1]
+    guess_mean = learning_rate * guess_mean + (1 - learning_rate) * elite.mean(
+        axis=0, keepdims=True
+    )
+    centered = (elite - elite.mean(axis=0)) / np.sqrt(k_samples)
+    columns = np.hstack(
+        [np.sqrt(learning_rate) * factor, np.sqrt(1 - learning_rate) * centered.T]
+    )
+    factor, dropped = low_rank(columns, factor.shape[1])
+    variance = learning_rate * guess_std ** 2 + np.maximum(dropped, 0)
+    collapsed = variance + np.sum(factor ** 2, axis=1) < 0.005 ** 2
+    variance[collapsed] = 9
+    return guess_mean, np.sqrt(variance), factor
+
+
 # CEM Function
 def cross_entropy_method(
         target_function,
@@ -96,6 +175,19 @@ def cross_entropy_method(
         iterations=1000,
         learning_rate=0.7,
         k_samples=2,
+        covariance="diagonal",
+        rank=5,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
 
@@ -108,8 +200,39 @@ def cross_entropy_method(
     :param iterations:
     :param learning_rate:
     :param k_samples:
+    :param covariance:
+        "diagonal" for independent variables, "full" for a (d, d) covariance
+        matrix, or "low-rank" for a rank-rank covariance plus a diagonal.
+    :param rank: rank of the "low-rank" covariance, at most the dimension.
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if covariance not in COVARIANCES:
+        raise ValueError(f"covariance must be one of {COVARIANCES}, not {covariance!r}")
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     guess = initial_guess(
         target_function=target_function,
         n=n,
@@ -118,10 +241,20 @@ def cross_entropy_method(
     )
     guess_mean = guess_mean_calc(guess)
     guess_std = guess_std_calc(guess)
-    best = np.copy(guess[guess[:, -1].argsort()][0, :])
+    factor = None
+    if covariance == "full":
+        matrix = np.atleast_2d(np.cov(guess[:, :-1], rowvar=False, bias=True))
+        factor = covariance_factor(matrix)
+        guess_std = np.zeros_like(guess_std)
+    elif covariance == "low-rank":
+        centered = (guess[:, :-1] - guess_mean) / np.sqrt(guess.shape[0])
+        factor, dropped = low_rank(centered.T, min(rank, len(min_values)))
+        guess_std = np.sqrt(np.maximum(dropped, 0))[np.newaxis, :]
+    best = np.copy(guess[np.argmin(guess[:, -1]), :])
     count = 0
     while count < iterations:
-        print("Iteration = ", count, " f(x) = ", best[-1])
+        if monitor(count, best[-1]):
+            break
         guess = generate_samples(
             target_function=target_function,
             guess=guess,
@@ -130,16 +263,47 @@ def cross_entropy_method(
             min_values=min_values,
             max_values=max_values,
             k_samples=k_samples,
+            factor=factor,
         )
-        guess_mean, guess_std = update_distribution(
-            guess,
-            guess_mean,
-            guess_std,
-            learning_rate=learning_rate,
-            k_samples=k_samples,
-        )
-        if best[-1] > guess[guess[:, -1].argsort()][0, :][-1]:
-            best = np.copy(guess[guess[:, -1].argsort()][0, :])
+        if covariance == "full":
+            guess_mean, matrix = update_covariance(
+                guess,
+                guess_mean,
+                matrix,
+                learning_rate=learning_rate,
+                k_samples=k_samples,
+            )
+            factor = covariance_factor(matrix)
+        elif covariance == "low-rank":
+            guess_mean, guess_std, factor = update_low_rank(
+                guess,
+                guess_mean,
+                guess_std,
+                factor,
+                learning_rate=learning_rate,
+                k_samples=k_samples,
+            )
+        else:
+            guess_mean, guess_std = update_distribution(
+                guess,
+                guess_mean,
+                guess_std,
+                learning_rate=learning_rate,
+                k_samples=k_samples,
+            )
+        value = guess[np.argmin(guess[:, -1]), :]
+        if best[-1] > value[-1]:
+            best = np.copy(value)
         count = count + 1
-    print(best)
+    target_function.close()
+    monitor.close(count, best[-1])
     return best
+
+
+# Function: Asynchronous Entry Point
+async def cross_entropy_method_async(target_function, **kwargs):
+    """
+    cross_entropy_method, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(cross_entropy_method, target_function, **kwargs)
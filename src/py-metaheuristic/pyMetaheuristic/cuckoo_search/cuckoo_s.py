@@ -14,42 +14,45 @@
 ############################################################################
 
 import math
-import os
-import random
 
 # Required Libraries
 import numpy as np
 
 
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(target_function, birds=3, min_values=(-5, -5), max_values=(5, 5)):
     position = np.zeros((birds, len(min_values) + 1))
-    for i in range(birds):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(birds, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # Function: Levy Distribution
-def levy_flight(mean):
-    x1 = math.sin((mean - 1.0) * (random.uniform(-0.5 * math.pi, 0.5 * math.pi))) / (
-        math.pow(
-            math.cos((random.uniform(-0.5 * math.pi, 0.5 * math.pi))),
-            (1.0 / (mean - 1.0)),
-        )
-    )
-    x2 = math.pow(
-        (
-                math.cos((2.0 - mean) * (random.uniform(-0.5 * math.pi, 0.5 * math.pi)))
-                / (-math.log(random.uniform(0.0, 1.0)))
-        ),
-        ((2.0 - mean) / (mean - 1.0)),
-    )
-    return x1 * x2
+def levy_flight(lambda_value=1.5, size=None):
+    """Levy step(s) of exponent lambda_value, in (0, 2], by Mantegna's algorithm."""
+    sigma = (
+            math.gamma(1 + lambda_value)
+            * math.sin(math.pi * lambda_value / 2)
+            / (
+                    math.gamma((1 + lambda_value) / 2)
+                    * lambda_value
+                    * 2 ** ((lambda_value - 1) / 2)
+            )
+    ) ** (1 / lambda_value)
+    u = engine.normal(0, sigma, size)
+    v = engine.standard_normal(size)
+    return u / np.abs(v) ** (1 / lambda_value)
 
 
 # Function: Replace Bird
@@ -61,23 +64,30 @@ def replace_bird(
         min_values=(-5, -5),
         max_values=(5, 5),
 ):
-    random_bird = np.random.randint(position.shape[0], size=1)[0]
-    new_solution = np.zeros((1, position.shape[1]))
-    for j in range(position.shape[1] - 1):
-        new_solution[0, j] = np.clip(
-            position[random_bird, j]
-            + alpha_value
-            * levy_flight(lambda_value)
-            * position[random_bird, j]
-            * (rando()),
-            min_values[j],
-            max_values[j],
-        )
-    new_solution[0, -1] = target_function(
-        new_solution[0, 0: new_solution.shape[1] - 1]
+    """
+    Every cuckoo lays one egg, a Levy flight away from its nest scaled by its
+    distance to the best nest; the eggs are evaluated in one batch and replace
+    the nests they beat.
+    """
+    variables = position[:, :-1]
+    best = variables[np.argmin(position[:, -1])]
+    new_solution = np.zeros(position.shape)
+    new_solution[:, :-1] = np.clip(
+        variables
+        + alpha_value
+        * levy_flight(lambda_value, variables.shape)
+        * (variables - best)
+        * engine.standard_normal(variables.shape),
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+    evaluate(
+        target_function,
+        new_solution[:, 0: new_solution.shape[1] - 1],
+        out=new_solution[:, -1],
     )
-    if position[random_bird, -1] > new_solution[0, -1]:
-        position[random_bird, j] = np.copy(new_solution[0, j])
+    improved = new_solution[:, -1] < position[:, -1]
+    position[improved] = new_solution[improved]
     return position
 
 
@@ -89,35 +99,33 @@ def update_positions(
         min_values=(-5, -5),
         max_values=(5, 5),
 ):
+    """
+    Each variable of each nest is discovered with probability discovery_rate and
+    moved by a random fraction of the difference of two random nests; the nests
+    that changed are evaluated in one batch and kept where they improved.
+    """
     updated_position = np.copy(position)
-    abandoned_nests = math.ceil(discovery_rate * updated_position.shape[0]) + 1
-    random_bird_j = np.random.randint(position.shape[0], size=1)[0]
-    random_bird_k = np.random.randint(position.shape[0], size=1)[0]
-    while random_bird_j == random_bird_k:
-        random_bird_j = np.random.randint(position.shape[0], size=1)[0]
-    nest_list = list(position.argsort()[-(abandoned_nests - 1):][::-1][0])
-    for i in range(updated_position.shape[0]):
-        for j in range(len(nest_list)):
-            rand = rando()
-            if i == nest_list[j] and rand > discovery_rate:
-                for k in range(updated_position.shape[1] - 1):
-                    rand = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
-                    updated_position[i, k] = np.clip(
-                        updated_position[i, k]
-                        + rand
-                        * (
-                                updated_position[random_bird_j, k]
-                                - updated_position[random_bird_k, k]
-                        ),
-                        min_values[k],
-                        max_values[k],
-                    )
-        updated_position[i, -1] = target_function(
-            updated_position[i, 0: updated_position.shape[1] - 1]
-        )
-    return updated_position
+    variables = updated_position[:, :-1]
+    discovered = engine.random(variables.shape) < discovery_rate
+    random_bird_j = engine.permutation(position.shape[0])
+    random_bird_k = engine.permutation(position.shape[0])
+    step = engine.random(variables.shape) * (
+            variables[random_bird_j] - variables[random_bird_k]
+    )
+    np.add(variables, step, out=variables, where=discovered)
+    np.clip(
+        variables,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        out=variables,
+    )
+    abandoned_nests = np.flatnonzero(discovered.any(axis=1))
+    updated_position[abandoned_nests, -1] = evaluate(
+        target_function, variables[abandoned_nests]
+    )
+    improved = updated_position[:, -1] < position[:, -1]
+    position[improved] = updated_position[improved]
+    return position
 
 
 def cuckoo_search(
@@ -129,6 +137,17 @@ def cuckoo_search(
         min_values=(-5, -5),
         max_values=(5, 5),
         iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     CS Function
@@ -143,8 +162,33 @@ def cuckoo_search(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -152,18 +196,18 @@ def cuckoo_search(
         min_values=min_values,
         max_values=max_values,
     )
-    best_ind = np.copy(position[position[:, -1].argsort()][0, :])
+    best_ind = np.copy(position[np.argmin(position[:, -1]), :])
     while count <= iterations:
-        print("Iteration = ", count, " of ", iterations, " f(x) = ", best_ind[-1])
-        for _ in range(position.shape[0]):
-            position = replace_bird(
-                target_function=target_function,
-                position=position,
-                alpha_value=alpha_value,
-                lambda_value=lambda_value,
-                min_values=min_values,
-                max_values=max_values,
-            )
+        if monitor(count, best_ind[-1]):
+            break
+        position = replace_bird(
+            target_function=target_function,
+            position=position,
+            alpha_value=alpha_value,
+            lambda_value=lambda_value,
+            min_values=min_values,
+            max_values=max_values,
+        )
         position = update_positions(
             target_function=target_function,
             position=position,
@@ -171,9 +215,19 @@ def cuckoo_search(
             min_values=min_values,
             max_values=max_values,
         )
-        value = np.copy(position[position[:, -1].argsort()][0, :])
-        if best_ind[-1] > value[-1]:
-            best_ind = np.copy(position[position[:, -1].argsort()][0, :])
+        best = np.argmin(position[:, -1])
+        if best_ind[-1] > position[best, -1]:
+            best_ind = np.copy(position[best, :])
         count = count + 1
-    print(best_ind)
+    target_function.close()
+    monitor.close(count, best_ind[-1])
     return best_ind
+
+
+# Function: Asynchronous Entry Point
+async def cuckoo_search_async(target_function, **kwargs):
+    """
+    cuckoo_search, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(cuckoo_search, target_function, **kwargs)
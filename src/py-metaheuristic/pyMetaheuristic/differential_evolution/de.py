@@ -13,20 +13,200 @@
 
 ############################################################################
 
-import random
-
 # Required Libraries
+import warnings
+
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+
+
+# Strategy: number of distinct donors its mutant is built from
+STRATEGIES = {"rand/1": 3, "best/1": 2, "current-to-best/1": 2, "rand/2": 5}
+CROSSOVERS = ("bin", "exp")
+REPLACEMENTS = ("synchronous", "immediate")
 
 
 def initial_position(target_function, n=3, min_values=(-5, -5), max_values=(5, 5)):
     position = np.zeros((n, len(min_values) + 1))
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(n, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
+    return position
+
+
+# Function: Donors
+def donors(n, count):
+    """(n, count) indices of distinct individuals, none of them the row's own index."""
+    ix = np.zeros((n, count), dtype=int)
+    own = np.arange(n)
+    for c in range(count):
+        redraw = np.ones(n, dtype=bool)
+        while redraw.any():
+            ix[redraw, c] = engine.integers(n, size=int(redraw.sum()))
+            redraw = ix[:, c] == own
+            for previous in range(c):
+                redraw |= ix[:, c] == ix[:, previous]
+    return ix
+
+
+# Function: Mutation
+def mutants(variables, best, donor, strategy="best/1", f=0.9, rows=None):
+    """
+    Mutant vectors of the given rows (all when None) of variables.
+
+    :param variables: (n, d) positions of the population.
+    :param best: (d,) position of the best individual.
+    :param donor: donors(n, STRATEGIES[strategy]) of the population.
+    """
+    if rows is None:
+        rows = np.arange(variables.shape[0])
+    donor = donor[rows]
+    if strategy == "rand/1":
+        return (
+                variables[donor[:, 0]]
+                + f * (variables[donor[:, 1]] - variables[donor[:, 2]])
+        )
+    if strategy == "best/1":
+        return best + f * (variables[donor[:, 0]] - variables[donor[:, 1]])
+    if strategy == "current-to-best/1":
+        current = variables[rows]
+        return (
+                current
+                + f * (best - current)
+                + f * (variables[donor[:, 0]] - variables[donor[:, 1]])
+        )
+    return (
+            variables[donor[:, 0]]
+            + f * (variables[donor[:, 1]] - variables[donor[:, 2]])
+            + f * (variables[donor[:, 3]] - variables[donor[:, 4]])
+    )
+
+
+# Function: Crossover
+def crossover_mask(n, dimension, cr=0.2, crossover="bin"):
+    """
+    (n, dimension) mask of the genes a trial takes from its mutant. "bin" picks
+    each gene with probability cr, "exp" a run of consecutive genes (wrapping
+    around) whose length is geometric in cr; either way at least one gene.
+    """
+    start = engine.integers(dimension, size=n)
+    if crossover == "bin":
+        mask = engine.random((n, dimension)) < cr
+        mask[np.arange(n), start] = True
+        return mask
+    if cr <= 0:
+        length = np.ones(n)
+    elif cr >= 1:
+        length = np.full(n, dimension)
+    else:
+        length = 1 + np.floor(np.log1p(-engine.random(n)) / np.log(cr))
+    offset = (np.arange(dimension)[np.newaxis, :] - start[:, np.newaxis]) % dimension
+    return offset < length[:, np.newaxis]
+
+
+# Function: Trial Vectors
+def trials(
+        position,
+        best,
+        donor,
+        mask,
+        strategy="best/1",
+        f=0.9,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+        rows=None,
+):
+    """Trial vectors (without fitness) of the given rows, clipped to the bounds."""
+    if rows is None:
+        rows = np.arange(position.shape[0])
+    variables = position[:, :-1]
+    trial = np.where(
+        mask[rows], mutants(variables, best, donor, strategy, f, rows), variables[rows]
+    )
+    return np.clip(
+        trial, np.asarray(min_values, dtype=float), np.asarray(max_values, dtype=float)
+    )
+
+
+# Function: Synchronous Generation
+def synchronous_generation(
+        target_function,
+        position,
+        strategy="best/1",
+        crossover="bin",
+        f=0.9,
+        cr=0.2,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+):
+    """
+    All trials are built from the same population and evaluated in one batch,
+    then each replaces its target if it is no worse.
+    """
+    n, dimension = position.shape[0], position.shape[1] - 1
+    trial = np.zeros(position.shape)
+    trial[:, :-1] = trials(
+        position,
+        position[np.argmin(position[:, -1]), :-1],
+        donors(n, STRATEGIES[strategy]),
+        crossover_mask(n, dimension, cr, crossover),
+        strategy=strategy,
+        f=f,
+        min_values=min_values,
+        max_values=max_values,
+    )
+    evaluate(target_function, trial[:, 0: trial.shape[1] - 1], out=trial[:, -1])
+    improved = trial[:, -1] <= position[:, -1]
+    position[improved] = trial[improved]
+    return position
+
+
+# Function: Immediate Generation
+def immediate_generation(
+        target_function,
+        position,
+        strategy="best/1",
+        crossover="bin",
+        f=0.9,
+        cr=0.2,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+):
+    """
+    Each trial replaces its target as soon as it is evaluated, so later trials of
+    the generation already see it. The donors and crossover masks of the whole
+    generation are still drawn at once.
+    """
+    n, dimension = position.shape[0], position.shape[1] - 1
+    donor = donors(n, STRATEGIES[strategy])
+    mask = crossover_mask(n, dimension, cr, crossover)
+    best = int(np.argmin(position[:, -1]))
     for i in range(n):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+        trial = trials(
+            position,
+            position[best, :-1],
+            donor,
+            mask,
+            strategy=strategy,
+            f=f,
+            min_values=min_values,
+            max_values=max_values,
+            rows=[i],
+        )
+        value = evaluate(target_function, trial)[0]
+        if value <= position[i, -1]:
+            position[i, :-1] = trial[0]
+            position[i, -1] = value
+            if value < position[best, -1]:
+                best = i
     return position
 
 
@@ -43,18 +223,33 @@ def velocity(
         max_values=(5, 5),
         cr=0.2,
 ):
+    """
+    Deprecated: the DE/best/1/bin trial of row k0 with donors k1 and k2, evaluated
+    on its own. Use trials, or differential_evolution, which batch a generation.
+    """
+    warnings.warn(
+        "velocity is deprecated, use trials or synchronous_generation",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    n, dimension = position.shape[0], position.shape[1] - 1
+    donor = np.zeros((n, 2), dtype=int)
+    donor[k0] = (k1, k2)
+    mask = np.zeros((n, dimension), dtype=bool)
+    mask[k0] = engine.random(dimension) <= cr
     v = np.copy(best_global)
-    for i in range(len(best_global)):
-        ri = rando()
-        if ri <= cr:
-            v[i] = best_global[i] + f * (position[k1, i] - position[k2, i])
-        else:
-            v[i] = position[k0, i]
-        if i < len(min_values) and v[i] > max_values[i]:
-            v[i] = max_values[i]
-        elif i < len(min_values) and v[i] < min_values[i]:
-            v[i] = min_values[i]
-    v[-1] = target_function(v[0: len(min_values)])
+    v[:-1] = trials(
+        position,
+        best_global[:-1],
+        donor,
+        mask,
+        strategy="best/1",
+        f=f,
+        min_values=min_values,
+        max_values=max_values,
+        rows=[k0],
+    )[0]
+    v[-1] = evaluate(target_function, v[np.newaxis, 0: len(min_values)])[0]
     return v
 
 
@@ -66,9 +261,23 @@ def differential_evolution(
         iterations=50,
         f=0.9,
         cr=0.2,
+        strategy="best/1",
+        crossover="bin",
+        replacement="synchronous",
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
-    DE Function. DE/Best/1/Bin Scheme.
+    DE Function. DE/Best/1/Bin Scheme by default.
 
     :param target_function:
         # Target Function - It can be any function that needs to be minimize, However it has to have only one argument: 'variables_values'. This Argument must be a list of variables.
@@ -79,8 +288,55 @@ def differential_evolution(
     :param iterations:
     :param f:
     :param cr:
+    :param strategy: "rand/1", "best/1", "current-to-best/1" or "rand/2".
+    :param crossover: "bin" (binomial) or "exp" (exponential).
+    :param replacement:
+        "synchronous" to evaluate each generation in one batch and replace the
+        population afterwards; "immediate" to evaluate one trial at a time and
+        replace its target right away. Each trial then depends on the previous
+        one, so vectorized, n_jobs and executor only speed up the initial
+        population in "immediate" mode.
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if strategy not in STRATEGIES:
+        raise ValueError(
+            f"strategy must be one of {tuple(STRATEGIES)}, not {strategy!r}"
+        )
+    if crossover not in CROSSOVERS:
+        raise ValueError(f"crossover must be one of {CROSSOVERS}, not {crossover!r}")
+    if replacement not in REPLACEMENTS:
+        raise ValueError(
+            f"replacement must be one of {REPLACEMENTS}, not {replacement!r}"
+        )
+    if n <= STRATEGIES[strategy]:
+        raise ValueError(
+            f"{strategy} needs n of at least {STRATEGIES[strategy] + 1}, not {n}"
+        )
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -88,31 +344,36 @@ def differential_evolution(
         min_values=min_values,
         max_values=max_values,
     )
-    best_global = np.copy(position[position[:, -1].argsort()][0, :])
+    generation = immediate_generation
+    if replacement == "synchronous":
+        generation = synchronous_generation
+    best_global = np.copy(position[np.argmin(position[:, -1]), :])
     while count <= iterations:
-        print("Iteration = ", count)
-        for i in range(position.shape[0]):
-            k1 = int(np.random.randint(position.shape[0], size=1))
-            k2 = int(np.random.randint(position.shape[0], size=1))
-            while k1 == k2:
-                k1 = int(np.random.randint(position.shape[0], size=1))
-            vi = velocity(
-                target_function=target_function,
-                position=position,
-                best_global=best_global,
-                k0=i,
-                k1=k1,
-                k2=k2,
-                f=f,
-                min_values=min_values,
-                max_values=max_values,
-                cr=cr,
-            )
-            if vi[-1] <= position[i, -1]:
-                for j in range(position.shape[1]):
-                    position[i, j] = vi[j]
-            if best_global[-1] > position[position[:, -1].argsort()][0, :][-1]:
-                best_global = np.copy(position[position[:, -1].argsort()][0, :])
+        if monitor(count, best_global[-1]):
+            break
+        position = generation(
+            target_function=target_function,
+            position=position,
+            strategy=strategy,
+            crossover=crossover,
+            f=f,
+            cr=cr,
+            min_values=min_values,
+            max_values=max_values,
+        )
+        value = position[np.argmin(position[:, -1]), :]
+        if best_global[-1] > value[-1]:
+            best_global = np.copy(value)
         count = count + 1
-    print(best_global)
+    target_function.close()
+    monitor.close(count, best_global[-1])
     return best_global
+
+
+# Function: Asynchronous Entry Point
+async def differential_evolution_async(target_function, **kwargs):
+    """
+    differential_evolution, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(differential_evolution, target_function, **kwargs)
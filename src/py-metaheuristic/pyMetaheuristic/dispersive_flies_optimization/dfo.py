@@ -34,11 +34,11 @@ to generate the position vectors for time t + 1, it exhibits a competitive perfo
 
 ############################################################################
 
-import os
-
 # Required Libraries
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_flies(
@@ -48,13 +48,13 @@ def initial_flies(
     position = np.zeros((swarm_size, len(min_values) + 1))
     for i in range(swarm_size):
         for j, _ in enumerate(min_values):
-            random_int = int.from_bytes(os.urandom(8), byteorder="big") / (
-                    (1 << 64) - 1
-            )
+            random_int = rando()
             position[i, j] = min_values[j] + random_int * (
                     max_values[j] - min_values[j]
             )
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -65,17 +65,27 @@ def update_position(
         swarm_best,
         min_values=(-5, -5),
         max_values=(5, 5),
-        fly=0,
+        thresh=0.2,
 ):
     """Update Position"""
-    for j in range(position.shape[1] - 1):
-        random_int = rando()
-        position[fly, j] = np.clip(
-            (neighbour_best[j] + random_int * (swarm_best[j] - position[fly, j])),
-            min_values[j],
-            max_values[j],
-        )
-    position[fly, -1] = target_function(position[fly, 0: position.shape[1] - 1])
+    for i in range(position.shape[0]):
+        for j in range(position.shape[1] - 1):
+            random_int = rando()
+            position[i, j] = np.clip(
+                (neighbour_best[j] + random_int * (swarm_best[j] - position[i, j])),
+                min_values[j],
+                max_values[j],
+            )
+        random_number = rando()
+        if random_number < thresh:
+            for j, _ in enumerate(min_values):
+                random_number = rando()
+                position[i, j] = min_values[j] + random_number * (
+                        max_values[j] - min_values[j]
+                )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -86,6 +96,17 @@ def dispersive_fly_optimization(
         max_values=(5, 5),
         generations=50,
         thresh=0.2,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     # DFO Function
@@ -101,8 +122,33 @@ def dispersive_fly_optimization(
     :param generations:
     :param thresh:
     :param target_function:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     population = initial_flies(
         target_function=target_function,
@@ -113,34 +159,30 @@ def dispersive_fly_optimization(
     neighbour_best = np.copy(population[population[:, -1].argsort()][0, :])
     swarm_best = np.copy(population[population[:, -1].argsort()][0, :])
     while count <= generations:
-        print("Generation: ", count, " of ", generations, " f(x) = ", swarm_best[-1])
-        for i in range(swarm_size):
-            population = update_position(
-                target_function=target_function,
-                position=population,
-                neighbour_best=neighbour_best,
-                swarm_best=swarm_best,
-                min_values=min_values,
-                max_values=max_values,
-                fly=i,
-            )
-            random_number = int.from_bytes(os.urandom(8), byteorder="big") / (
-                    (1 << 64) - 1
-            )
-            if random_number < thresh:
-                for j, _ in enumerate(min_values):
-                    random_number = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
-                    population[i, j] = min_values[j] + random_number * (
-                            max_values[j] - min_values[j]
-                    )
-                population[i, -1] = target_function(
-                    population[i, 0: population.shape[1] - 1]
-                )
+        if monitor(count, swarm_best[-1]):
+            break
+        population = update_position(
+            target_function=target_function,
+            position=population,
+            neighbour_best=neighbour_best,
+            swarm_best=swarm_best,
+            min_values=min_values,
+            max_values=max_values,
+            thresh=thresh,
+        )
         neighbour_best = np.copy(population[population[:, -1].argsort()][0, :])
         if swarm_best[-1] > neighbour_best[-1]:
             swarm_best = np.copy(neighbour_best)
         count = count + 1
-    print(swarm_best)
+    target_function.close()
+    monitor.close(count, swarm_best[-1])
     return swarm_best
+
+
+# Function: Asynchronous Entry Point
+async def dispersive_fly_optimization_async(target_function, **kwargs):
+    """
+    dispersive_fly_optimization, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(dispersive_fly_optimization, target_function, **kwargs)
@@ -0,0 +1,443 @@
+"""
+Candidate evaluation.
+
+The optimizers hand every batch of candidates, an (n, d) matrix, to ``evaluate``
+and get back an (n,) fitness vector. A plain target function is called once per
+row; an ``Evaluator`` built with ``vectorized=True`` receives the whole matrix in
+a single call, and one built with ``n_jobs`` or ``executor`` spreads the batch
+over a pool of worker processes or threads. An ``async def`` target function
+gets an ``AsyncEvaluator``, which keeps the evaluations of a batch in flight
+together on an event loop. Either can look candidates up in a ``FitnessCache``
+first, so points seen before are not evaluated again.
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import math
+import os
+import sys
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+# Event loop that AsyncEvaluator awaits batches on, set by run_async
+event_loop = contextvars.ContextVar("event_loop", default=None)
+
+
+class FitnessCache:
+    """
+    Bounded LRU memo of fitness values, keyed on the candidate vector.
+
+    With a ``tolerance`` every variable is first rounded to a multiple of it, so
+    candidates closer than that share the fitness of the first one evaluated.
+    Once the entries take more than ``max_bytes`` (an estimate of the keys,
+    values and dictionary overhead) the least recently used ones are evicted.
+    """
+
+    # Approximate size of an OrderedDict entry besides its key and value
+    entry_overhead = 100
+
+    def __init__(self, tolerance=None, max_bytes=64 * 2 ** 20):
+        """
+        :param tolerance:
+            Grid spacing candidates are rounded to before the lookup. None matches exact vectors only.
+        :param max_bytes:
+            Memory cap of the cache, in bytes.
+        """
+        self.tolerance = tolerance
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return (
+            f"FitnessCache(hits={self.hits}, misses={self.misses}, "
+            f"entries={len(self)}, nbytes={self.nbytes})"
+        )
+
+    @property
+    def hit_rate(self):
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, candidate):
+        """Hashable key of a candidate vector."""
+        candidate = np.asarray(candidate, dtype=float)
+        if self.tolerance:
+            candidate = np.round(candidate / self.tolerance)
+        return (candidate + 0.0).tobytes()
+
+    def get(self, key):
+        """Cached fitness for key, or None, counting a hit or a miss."""
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses = self.misses + 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits = self.hits + 1
+        return fitness
+
+    def put(self, key, fitness):
+        """Store fitness for key, evicting the least recently used entries over max_bytes."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        else:
+            self.nbytes = self.nbytes + sys.getsizeof(key) + self.entry_overhead
+        self.entries[key] = float(fitness)
+        while self.nbytes > self.max_bytes and self.entries:
+            old_key, _ = self.entries.popitem(last=False)
+            self.nbytes = self.nbytes - sys.getsizeof(old_key) - self.entry_overhead
+            self.evictions = self.evictions + 1
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class Evaluator:
+    """
+    Wraps a target function behind the batch evaluation protocol.
+
+    The wrapper is itself callable with a single candidate, so code that calls
+    ``target_function(variables_values)`` keeps working when it gets an Evaluator.
+
+    With ``n_jobs`` the Evaluator starts its own ProcessPoolExecutor on first use,
+    running ``initializer(*initargs)`` once in every worker; it is shut down by
+    ``close``. The target function must then be picklable. ``executor="thread"``
+    starts a ThreadPoolExecutor instead, for target functions that release the GIL:
+    the threads read their rows straight from the candidates matrix and write
+    the fitness straight into ``out``, without pickling or copying. An
+    ``executor`` instance supplied by the caller is used as is and never shut down
+    here. Either way results come back in the order of the candidates.
+
+    With a ``cache`` only candidates missing from it are evaluated, each distinct
+    one once per batch. ``evaluations`` counts the candidates actually evaluated.
+    """
+
+    def __init__(
+            self,
+            target_function,
+            vectorized=False,
+            n_jobs=None,
+            executor=None,
+            initializer=None,
+            initargs=(),
+            chunksize=None,
+            cache=None,
+    ):
+        """
+        :param target_function:
+            Function to be minimized.
+        :param vectorized:
+            When True, target_function takes an (n, d) matrix and returns an (n,) vector.
+            Otherwise it takes a single list of variables and returns a number.
+        :param n_jobs:
+            Number of worker processes; -1 uses every core. None or 1 evaluates in this process.
+        :param executor:
+            "process" or "thread" to start an own pool of n_jobs workers (every core
+            when n_jobs is None), or a concurrent.futures.Executor to evaluate with.
+        :param initializer:
+            Called once in every worker started by the Evaluator.
+        :param initargs:
+            Arguments for initializer.
+        :param chunksize:
+            Candidates sent to a worker per task. By default each worker gets about four chunks per batch.
+        :param cache:
+            A FitnessCache to look candidates up in, or True for a new one with the default settings.
+        """
+        self.target_function = target_function
+        self.vectorized = vectorized
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.initializer = initializer
+        self.initargs = initargs
+        self.chunksize = chunksize
+        if cache is True:
+            cache = FitnessCache()
+        self.cache = None if cache is False else cache
+        self.evaluations = 0
+        self._pool = None
+        self._finalizer = None
+
+    def __call__(self, variables_values):
+        """Fitness of a single candidate."""
+        candidate = np.asarray(variables_values, dtype=float).reshape(1, -1)
+        return self.evaluate(candidate)[0]
+
+    @property
+    def workers(self):
+        """Number of workers a batch is split over."""
+        if self.executor is not None and not isinstance(self.executor, str):
+            return getattr(self.executor, "_max_workers", None) or os.cpu_count() or 1
+        if self.n_jobs is None:
+            return 1 if self.executor is None else os.cpu_count() or 1
+        if self.n_jobs < 0:
+            return os.cpu_count() or 1
+        return self.n_jobs
+
+    def pool(self):
+        """Executor used for evaluation, or None to evaluate in the calling thread."""
+        if self.executor is not None and not isinstance(self.executor, str):
+            return self.executor
+        if self.workers <= 1:
+            return None
+        if self._pool is None:
+            if self.executor == "thread":
+                executor_class = ThreadPoolExecutor
+            elif self.executor in (None, "process"):
+                executor_class = ProcessPoolExecutor
+            else:
+                raise ValueError(
+                    f"unknown executor {self.executor!r}, "
+                    "expected 'process' or 'thread'"
+                )
+            self._pool = executor_class(
+                max_workers=self.workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+            self._finalizer = weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def close(self):
+        """Shut down the pool started by the Evaluator, if any."""
+        if self._pool is not None:
+            self._finalizer()
+            self._pool = None
+            self._finalizer = None
+
+    def evaluate(self, candidates, out=None):
+        """
+        Fitness of every row of the (n, d) candidates matrix, as an (n,) vector.
+
+        :param candidates:
+        :param out: optional (n,) array receiving the fitness, e.g. a last column.
+        :return: out
+        """
+        if out is None:
+            out = np.zeros(candidates.shape[0])
+        if candidates.shape[0] == 0:
+            return out
+        if self.cache is None:
+            self.evaluations = self.evaluations + candidates.shape[0]
+            return self.evaluate_batch(candidates, out)
+        keys = [self.cache.key(candidate) for candidate in candidates]
+        missing = {}
+        for i, key in enumerate(keys):
+            if key in missing:
+                self.cache.hits = self.cache.hits + 1
+                continue
+            fitness = self.cache.get(key)
+            if fitness is None:
+                missing[key] = i
+            else:
+                out[i] = fitness
+        if missing:
+            rows = list(missing.values())
+            self.evaluations = self.evaluations + len(rows)
+            fitness = self.evaluate_batch(candidates[rows], np.zeros(len(rows)))
+            values = dict(zip(missing, fitness))
+            for key, value in values.items():
+                self.cache.put(key, value)
+            for i, key in enumerate(keys):
+                if key in values:
+                    out[i] = values[key]
+        return out
+
+    def evaluate_batch(self, candidates, out):
+        """Evaluate every row of candidates with the configured backend, writing into out."""
+        executor = self.pool()
+        if executor is None:
+            self.evaluate_chunk(candidates, out)
+        elif isinstance(executor, ThreadPoolExecutor):
+            futures = [
+                executor.submit(
+                    self.evaluate_chunk, candidates[start:stop], out[start:stop]
+                )
+                for start, stop in self.chunks(candidates.shape[0])
+            ]
+            for future in futures:
+                future.result()
+        elif not self.vectorized:
+            chunksize = self.chunksize or self.chunk_length(candidates.shape[0])
+            results = executor.map(self.target_function, candidates, chunksize=chunksize)
+            out[:] = np.fromiter(results, dtype=float, count=candidates.shape[0])
+        else:
+            results = executor.map(
+                self.target_function,
+                [
+                    candidates[start:stop]
+                    for start, stop in self.chunks(candidates.shape[0])
+                ],
+            )
+            fitness = np.concatenate([np.asarray(result, dtype=float).reshape(-1) for result in results])
+            out[:] = self.checked(fitness, candidates.shape[0])
+        return out
+
+    def evaluate_chunk(self, candidates, out):
+        """Evaluate candidates in the calling thread, writing the fitness into out."""
+        if not self.vectorized:
+            for i in range(candidates.shape[0]):
+                out[i] = self.target_function(candidates[i])
+        else:
+            out[:] = self.checked(self.target_function(candidates), candidates.shape[0])
+
+    def chunk_length(self, size):
+        """Candidates per task when a batch of size candidates is split over workers."""
+        if self.chunksize:
+            return self.chunksize
+        if self.vectorized:
+            return math.ceil(size / self.workers)
+        return max(1, math.ceil(size / (4 * self.workers)))
+
+    def chunks(self, size):
+        """(start, stop) bounds of the tasks for a batch of size candidates."""
+        length = self.chunk_length(size)
+        return [(start, min(start + length, size)) for start in range(0, size, length)]
+
+    @staticmethod
+    def checked(fitness, size):
+        """Fitness returned by a vectorized target function, as a (size,) vector."""
+        fitness = np.asarray(fitness, dtype=float)
+        if fitness.size != size:
+            raise ValueError(
+                f"vectorized target function returned {fitness.size} values "
+                f"for {size} candidates"
+            )
+        return fitness.reshape(size)
+
+
+class AsyncEvaluator(Evaluator):
+    """
+    Batch evaluation protocol for an ``async def`` target function.
+
+    Every batch is awaited with ``asyncio.gather``, at most ``concurrency``
+    evaluations in flight at a time. Inside ``run_async`` the batches are awaited
+    on the caller's event loop; otherwise each batch runs on a fresh loop with
+    ``asyncio.run``, so the synchronous entry points accept async target
+    functions too.
+    """
+
+    def __init__(self, target_function, vectorized=False, concurrency=None, cache=None):
+        """
+        :param target_function:
+            Coroutine function to be minimized.
+        :param vectorized:
+            When True, target_function takes an (n, d) matrix and returns an (n,) vector.
+        :param concurrency:
+            Maximum number of evaluations awaited at once. None awaits whole batches.
+        :param cache:
+            A FitnessCache to look candidates up in, or True for a new one with the default settings.
+        """
+        super().__init__(target_function, vectorized=vectorized, cache=cache)
+        self.concurrency = concurrency
+
+    @property
+    def workers(self):
+        """Number of evaluations in flight at once."""
+        return self.concurrency or 1
+
+    def pool(self):
+        """An AsyncEvaluator never uses an executor."""
+        return None
+
+    def evaluate_batch(self, candidates, out):
+        """Await every row of candidates on the event loop, writing into out."""
+        loop = event_loop.get()
+        if loop is None:
+            out[:] = asyncio.run(self.gather(candidates))
+        else:
+            future = asyncio.run_coroutine_threadsafe(self.gather(candidates), loop)
+            out[:] = future.result()
+        return out
+
+    async def gather(self, candidates):
+        """Await the fitness of every row of candidates."""
+        if not self.vectorized:
+            bounds = [(i, i + 1) for i in range(candidates.shape[0])]
+        elif self.concurrency:
+            bounds = self.chunks(candidates.shape[0])
+        else:
+            bounds = [(0, candidates.shape[0])]
+        semaphore = asyncio.Semaphore(self.concurrency or len(bounds))
+
+        async def bounded(chunk):
+            async with semaphore:
+                if not self.vectorized:
+                    return [await self.target_function(chunk[0])]
+                return self.checked(await self.target_function(chunk), chunk.shape[0])
+
+        results = await asyncio.gather(
+            *(bounded(candidates[start:stop]) for start, stop in bounds)
+        )
+        return np.concatenate([np.asarray(result, dtype=float) for result in results])
+
+
+def as_evaluator(
+        target_function,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+):
+    """
+    Wrap target_function in an Evaluator, unless it already is one.
+
+    initializer, initargs and chunksize configure the pool started for n_jobs or
+    executor; an async def target_function is awaited on the event loop instead,
+    and ignores them.
+    """
+    if isinstance(target_function, Evaluator):
+        return target_function
+    if inspect.iscoroutinefunction(target_function):
+        return AsyncEvaluator(
+            target_function, vectorized=vectorized, concurrency=concurrency, cache=cache
+        )
+    return Evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        cache=cache,
+    )
+
+
+def evaluate(target_function, candidates, out=None):
+    """Fitness of every row of candidates, using the batch protocol of target_function."""
+    return as_evaluator(target_function).evaluate(candidates, out=out)
+
+
+async def run_async(function, *args, **kwargs):
+    """
+    Await function(*args, **kwargs) without blocking the running event loop.
+
+    The function, typically an optimizer entry point, runs in a worker thread;
+    the batches of any AsyncEvaluator it builds are awaited on the running loop.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    context.run(event_loop.set, loop)
+    return await loop.run_in_executor(
+        None, functools.partial(context.run, function, *args, **kwargs)
+    )
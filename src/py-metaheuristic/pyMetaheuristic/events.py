@@ -0,0 +1,202 @@
+"""
+Progress events and stopping criteria.
+
+The optimizers report their progress through a ``Monitor`` instead of printing.
+Each iteration becomes an ``IterationEvent`` handed to the run's ``callback``:
+by default a ``Reporter`` that prints at most one line per interval, otherwise
+any callable the caller supplies. With ``callback=False`` (or ``"silent"``) no
+event is built and nothing is formatted.
+
+The Monitor also checks the run's ``StoppingCriteria`` every iteration, and
+tells the optimizer to stop once one of them fires.
+"""
+import math
+import sys
+import time
+
+
+class IterationEvent:
+    """Progress of a run after an iteration."""
+
+    __slots__ = ("iteration", "best_fitness", "evaluations", "elapsed", "final", "reason")
+
+    def __init__(
+            self, iteration, best_fitness, evaluations, elapsed, final=False, reason=None
+    ):
+        """
+        :param iteration: iteration, generation or step counter of the optimizer.
+        :param best_fitness: best fitness found so far.
+        :param evaluations: target function evaluations made so far.
+        :param elapsed: seconds since the run started.
+        :param final: True for the event sent once the run has finished.
+        :param reason: for the final event, why the run stopped: "iterations" when it
+            ran its whole iteration count, otherwise the StoppingCriteria that fired.
+        """
+        self.iteration = iteration
+        self.best_fitness = best_fitness
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.final = final
+        self.reason = reason
+
+    def __repr__(self):
+        return (
+            f"IterationEvent(iteration={self.iteration}, best_fitness={self.best_fitness}, "
+            f"evaluations={self.evaluations}, elapsed={self.elapsed:.3f}, final={self.final}, "
+            f"reason={self.reason!r})"
+        )
+
+
+class Reporter:
+    """
+    Default callback: prints the first event, then at most one event every
+    ``interval`` seconds, and always the final one.
+    """
+
+    def __init__(self, interval=1.0, stream=None):
+        """
+        :param interval: minimum number of seconds between two printed lines.
+        :param stream: file to print to; sys.stdout when None.
+        """
+        self.interval = interval
+        self.stream = stream
+        self.last = None
+
+    def __call__(self, event):
+        if (
+                not event.final
+                and self.last is not None
+                and event.elapsed - self.last < self.interval
+        ):
+            return
+        self.last = event.elapsed
+        line = (
+            f"Iteration = {event.iteration} f(x) = {event.best_fitness} "
+            f"evaluations = {event.evaluations} elapsed = {event.elapsed:.2f}s"
+        )
+        if event.final:
+            line = f"{line} stopped by {event.reason}"
+        print(line, file=self.stream or sys.stdout)
+
+
+class StoppingCriteria:
+    """
+    Conditions that end a run before its iteration count is used up.
+
+    They are checked once per iteration, so a run may overshoot max_evaluations
+    or max_time by one iteration. After the run, ``reason`` names the criterion
+    that fired ("max_evaluations", "max_time", "target_fitness" or "patience"),
+    or is "iterations" when none did.
+    """
+
+    def __init__(
+            self,
+            max_evaluations=None,
+            max_time=None,
+            target_fitness=None,
+            patience=None,
+            tolerance=0.0,
+    ):
+        """
+        :param max_evaluations: stop after this many target function evaluations.
+        :param max_time: stop after this many seconds.
+        :param target_fitness: stop once the best fitness is at or below this value.
+        :param patience: stop after this many iterations without improvement.
+        :param tolerance: smallest decrease of the best fitness counted as an improvement.
+        """
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.target_fitness = target_fitness
+        self.patience = patience
+        self.tolerance = tolerance
+        self.reset()
+
+    def reset(self):
+        """Forget the previous run."""
+        self.reason = None
+        self.best_fitness = math.inf
+        self.stale = 0
+
+    def __call__(self, event):
+        """Name of the criterion met after event, or None to go on."""
+        if self.max_evaluations is not None and event.evaluations >= self.max_evaluations:
+            return "max_evaluations"
+        if self.max_time is not None and event.elapsed >= self.max_time:
+            return "max_time"
+        if self.target_fitness is not None and event.best_fitness <= self.target_fitness:
+            return "target_fitness"
+        if self.patience is not None:
+            if event.best_fitness < self.best_fitness - self.tolerance:
+                self.best_fitness = event.best_fitness
+                self.stale = 0
+            else:
+                self.stale = self.stale + 1
+                if self.stale >= self.patience:
+                    return "patience"
+        return None
+
+
+class Monitor:
+    """Sends the progress of one run to its callback and checks its stopping criteria."""
+
+    def __init__(self, target_function, callback=None, stop=None, evaluations=None):
+        """
+        :param target_function: the Evaluator of the run, which counts the evaluations.
+        :param callback:
+            None for a Reporter, False or "silent" for no events at all,
+            or a callable taking an IterationEvent.
+        :param stop: StoppingCriteria of the run, or None to run every iteration.
+        :param evaluations: evaluation count of target_function when the run started;
+            its current count when None.
+        """
+        if callback is None:
+            callback = Reporter()
+        elif callback is False or callback == "silent":
+            callback = None
+        self.callback = callback
+        self.stop = stop
+        if stop is not None:
+            stop.reset()
+        self.reason = None
+        self.target_function = target_function
+        if evaluations is None:
+            evaluations = getattr(target_function, "evaluations", 0)
+        self.evaluations = evaluations
+        self.start = time.perf_counter()
+
+    def __call__(self, iteration, best_fitness):
+        """
+        Report an iteration.
+
+        :return: True when a stopping criterion fired and the run should stop.
+        """
+        if self.callback is None and self.stop is None:
+            return False
+        event = self.event(iteration, best_fitness)
+        if self.stop is not None:
+            self.reason = self.stop(event)
+            if self.reason is not None:
+                return True
+        if self.callback is not None:
+            self.callback(event)
+        return False
+
+    def close(self, iteration, best_fitness):
+        """Report the end of the run."""
+        if self.reason is None:
+            self.reason = "iterations"
+        if self.stop is not None:
+            self.stop.reason = self.reason
+        if self.callback is None:
+            return
+        self.callback(self.event(iteration, best_fitness, final=True, reason=self.reason))
+
+    def event(self, iteration, best_fitness, final=False, reason=None):
+        return IterationEvent(
+            iteration,
+            float(best_fitness),
+            getattr(self.target_function, "evaluations", 0) - self.evaluations,
+            time.perf_counter() - self.start,
+            final=final,
+            reason=reason,
+        )
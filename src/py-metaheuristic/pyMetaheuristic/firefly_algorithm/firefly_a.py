@@ -14,12 +14,13 @@
 ############################################################################
 
 import math
-import random
 
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_fireflies(
@@ -28,8 +29,10 @@ def initial_fireflies(
     position = np.zeros((swarm_size, len(min_values) + 1))
     for i in range(swarm_size):
         for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+            position[i, j] = engine.uniform(min_values[j], max_values[j])
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -81,9 +84,61 @@ def update_position(
             min_values[j],
             max_values[j],
         )
-    position[firefly, -1] = target_function(
-        position[firefly, 0: position.shape[1] - 1]
+    position[firefly, -1] = evaluate(
+        target_function, position[firefly: firefly + 1, 0: position.shape[1] - 1]
+    )[0]
+    return position
+
+
+# Function: Update Positions of the Whole Swarm
+def update_swarm(
+        target_function,
+        position,
+        alpha_0=0.2,
+        beta_0=1,
+        gama=1,
+        neighbors=None,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+):
+    """
+    Synchronous generation: every firefly moves at once toward the brighter
+    fireflies of the swarm, or of its neighbors brightest members only, with the
+    attractiveness of each pair taken from one (n, k) distance matrix. The pull
+    of several fireflies adds up, scaled down when their total attractiveness
+    exceeds 1 so that the move stays within their convex hull. Fireflies that
+    moved are then evaluated in one batch.
+    """
+    variables = position[:, :-1]
+    light = position[:, -1]
+    if neighbors is not None and neighbors < position.shape[0]:
+        brightest = np.argpartition(light, neighbors - 1)[:neighbors]
+    else:
+        brightest = np.arange(position.shape[0])
+    others = variables[brightest]
+    squared_distance = (
+            np.sum(variables ** 2, axis=1)[:, np.newaxis]
+            + np.sum(others ** 2, axis=1)[np.newaxis, :]
+            - 2 * variables @ others.T
+    )
+    np.maximum(squared_distance, 0, out=squared_distance)
+    beta = beta_0 * np.exp(-gama * squared_distance)
+    beta[light[brightest][np.newaxis, :] >= light[:, np.newaxis]] = 0
+    total = beta.sum(axis=1)
+    moved = np.flatnonzero(total > 0)
+    if moved.size == 0:
+        return position
+    beta = beta[moved] / np.maximum(total[moved], 1)[:, np.newaxis]
+    epson = engine.random((moved.size, variables.shape[1])) - 1 / 2
+    variables[moved] = np.clip(
+        variables[moved]
+        + beta @ others
+        - beta.sum(axis=1)[:, np.newaxis] * variables[moved]
+        + alpha_0 * epson,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
     )
+    position[moved, -1] = evaluate(target_function, variables[moved])
     return position
 
 
@@ -96,6 +151,19 @@ def firefly_algorithm(
         alpha_0=0.2,
         beta_0=1,
         gama=1,
+        synchronous=False,
+        neighbors=None,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     # FA Function
@@ -110,8 +178,41 @@ def firefly_algorithm(
     :param alpha_0:
     :param beta_0:
     :param gama:
+    :param synchronous:
+        False to move the fireflies one pair at a time, evaluating each move;
+        True to move the whole swarm per generation with update_swarm.
+        Each pairwise move depends on the previous one, so vectorized, n_jobs and
+        executor only speed up the initial swarm unless synchronous is True.
+    :param neighbors:
+        with synchronous=True, the number of brightest fireflies that attract the
+        others, which caps the distance matrix at swarm_size x neighbors; None for all.
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_fireflies(
         target_function=target_function,
@@ -120,37 +221,55 @@ def firefly_algorithm(
         max_values=max_values,
     )
     while count <= generations:
-        print(
-            "Generation: ",
-            count,
-            " f(x) = ",
-            position[position[:, -1].argsort()][0, :][-1],
-        )
-        for i in range(swarm_size):
-            for j in range(swarm_size):
-                if i != j:
-                    firefly_i = np.copy(position[i, 0: position.shape[1] - 1])
-                    firefly_j = np.copy(position[j, 0: position.shape[1] - 1])
-                    ligth_i = ligth_value(
-                        position[i, -1], firefly_i, firefly_j, gama=gama
-                    )
-                    ligth_j = ligth_value(
-                        position[j, -1], firefly_i, firefly_j, gama=gama
-                    )
-                    if ligth_i > ligth_j:
-                        position = update_position(
-                            target_function=target_function,
-                            position=position,
-                            x=firefly_i,
-                            y=firefly_j,
-                            alpha_0=alpha_0,
-                            beta_0=beta_0,
-                            gama=gama,
-                            firefly=i,
-                            min_values=min_values,
-                            max_values=max_values,
+        if monitor(count, position[:, -1].min()):
+            break
+        if synchronous:
+            position = update_swarm(
+                target_function=target_function,
+                position=position,
+                alpha_0=alpha_0,
+                beta_0=beta_0,
+                gama=gama,
+                neighbors=neighbors,
+                min_values=min_values,
+                max_values=max_values,
+            )
+        else:
+            for i in range(swarm_size):
+                for j in range(swarm_size):
+                    if i != j:
+                        firefly_i = np.copy(position[i, 0: position.shape[1] - 1])
+                        firefly_j = np.copy(position[j, 0: position.shape[1] - 1])
+                        ligth_i = ligth_value(
+                            position[i, -1], firefly_i, firefly_j, gama=gama
                         )
+                        ligth_j = ligth_value(
+                            position[j, -1], firefly_i, firefly_j, gama=gama
+                        )
+                        if ligth_i > ligth_j:
+                            position = update_position(
+                                target_function=target_function,
+                                position=position,
+                                x=firefly_i,
+                                y=firefly_j,
+                                alpha_0=alpha_0,
+                                beta_0=beta_0,
+                                gama=gama,
+                                firefly=i,
+                                min_values=min_values,
+                                max_values=max_values,
+                            )
         count = count + 1
     best_firefly = np.copy(position[position[:, -1].argsort()][0, :])
-    print(best_firefly)
+    target_function.close()
+    monitor.close(count, best_firefly[-1])
     return best_firefly
+
+
+# Function: Asynchronous Entry Point
+async def firefly_algorithm_async(target_function, **kwargs):
+    """
+    firefly_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(firefly_algorithm, target_function, **kwargs)
@@ -12,31 +12,36 @@
 # GitHub repository: <https://github.com/Valdecy/Metaheuristic-Flower_Pollination_Algorithm>
 
 ############################################################################
-import logging
-import random
 from math import gamma
 
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
         target_function, flowers=3, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((flowers, len(min_values) + 1))
-    for i in range(flowers):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(flowers, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # Function Levy Distribution
-def levy_flight(beta=1.5):
-    r1 = rando()
-    r2 = rando()
+def levy_flight(beta=1.5, size=None):
+    """Levy step, or an array of size steps drawn at once."""
+    r1 = engine.random(size)
+    r2 = engine.random(size)
     sig_num = gamma(1 + beta) * np.sin((np.pi * beta) / 2.0)
     sig_den = gamma((1 + beta) / 2) * beta * 2 ** ((beta - 1) / 2)
     sigma = (sig_num / sig_den) ** (1 / beta)
@@ -44,6 +49,33 @@ def levy_flight(beta=1.5):
     return levy
 
 
+# Function: Global Pollination Moves
+def global_moves(
+        position, best_global, gama=0.5, lamb=1.4, min_values=(-5, -5), max_values=(5, 5)
+):
+    """Candidate of every flower of position after a Levy flight relative to best_global."""
+    variables = position[:, :-1]
+    return np.clip(
+        variables + gama * levy_flight(lamb, variables.shape) * (variables - best_global[:-1]),
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+
+
+# Function: Local Pollination Moves
+def local_moves(
+        position, flowers, nb_flowers_1, nb_flowers_2, min_values=(-5, -5), max_values=(5, 5)
+):
+    """Candidate of each of flowers, moved along the difference of its two neighbors."""
+    variables = position[:, :-1]
+    r = engine.random((len(flowers), variables.shape[1]))
+    return np.clip(
+        variables[flowers] + r * (variables[nb_flowers_1] - variables[nb_flowers_2]),
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+
+
 # Function: Global Pollination
 def pollination_global(
         target_function,
@@ -56,16 +88,10 @@ def pollination_global(
         max_values=(5, 5),
 ):
     x = np.copy(best_global)
-    for j in range(len(min_values)):
-        x[j] = np.clip(
-            (
-                    position[flower, j]
-                    + gama * levy_flight(lamb) * (position[flower, j] - best_global[j])
-            ),
-            min_values[j],
-            max_values[j],
-        )
-    x[-1] = target_function(x[0: len(min_values)])
+    x[:-1] = global_moves(
+        position[[flower]], best_global, gama, lamb, min_values, max_values
+    )[0]
+    x[-1] = evaluate(target_function, x[np.newaxis, 0: len(min_values)])[0]
     return x
 
 
@@ -81,20 +107,50 @@ def pollination_local(
         max_values=(5, 5),
 ):
     x = np.copy(best_global)
-    for j in range(len(min_values)):
-        r = rando()
-        x[j] = np.clip(
-            (
-                    position[flower, j]
-                    + r * (position[nb_flower_1, j] - position[nb_flower_2, j])
-            ),
-            min_values[j],
-            max_values[j],
-        )
-    x[-1] = target_function(x[0: len(min_values)])
+    x[:-1] = local_moves(
+        position, [flower], [nb_flower_1], [nb_flower_2], min_values, max_values
+    )[0]
+    x[-1] = evaluate(target_function, x[np.newaxis, 0: len(min_values)])[0]
     return x
 
 
+# Function: Pollinate the Whole Population
+def pollination(
+        target_function,
+        position,
+        best_global,
+        gama=0.5,
+        lamb=1.4,
+        p=0.8,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+):
+    """
+    One generation: every flower pollinates globally with probability p and
+    locally otherwise, with two distinct neighbors. All the candidates are drawn
+    first and evaluated in one batch, then each replaces its flower when it is
+    no worse.
+    """
+    n = position.shape[0]
+    flowers = np.arange(n)
+    nb_flowers_1 = engine.integers(n, size=n)
+    nb_flowers_2 = nb_flowers_1
+    if n > 1:
+        nb_flowers_2 = (nb_flowers_1 + engine.integers(1, n, size=n)) % n
+    pollinate = engine.random(n) < p
+    candidates = local_moves(
+        position, flowers, nb_flowers_1, nb_flowers_2, min_values, max_values
+    )
+    candidates[pollinate] = global_moves(
+        position[pollinate], best_global, gama, lamb, min_values, max_values
+    )
+    fitness = evaluate(target_function, candidates)
+    improved = fitness <= position[:, -1]
+    position[improved, :-1] = candidates[improved]
+    position[improved, -1] = fitness[improved]
+    return position
+
+
 def flower_pollination_algorithm(
         target_function,
         flowers=3,
@@ -104,6 +160,17 @@ def flower_pollination_algorithm(
         gama=0.5,
         lamb=1.4,
         p=0.8,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     # FPA Function.
@@ -118,8 +185,33 @@ def flower_pollination_algorithm(
     :param gama:
     :param lamb:
     :param p:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -127,45 +219,33 @@ def flower_pollination_algorithm(
         min_values=min_values,
         max_values=max_values,
     )
-    best_global = np.copy(position[position[:, -1].argsort()][0, :])
-    x = np.copy(best_global)
-    logging.debug(f"x = {x}")
+    best_global = np.copy(position[np.argmin(position[:, -1]), :])
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_global[-1])
-        for i in range(position.shape[0]):
-            nb_flower_1 = int(np.random.randint(position.shape[0], size=1))
-            nb_flower_2 = int(np.random.randint(position.shape[0], size=1))
-            while nb_flower_1 == nb_flower_2:
-                nb_flower_1 = int(np.random.randint(position.shape[0], size=1))
-            r = rando()
-            if r < p:
-                x = pollination_global(
-                    target_function=target_function,
-                    position=position,
-                    best_global=best_global,
-                    flower=i,
-                    gama=gama,
-                    lamb=lamb,
-                    min_values=min_values,
-                    max_values=max_values,
-                )
-            else:
-                x = pollination_local(
-                    target_function=target_function,
-                    position=position,
-                    best_global=best_global,
-                    flower=i,
-                    nb_flower_1=nb_flower_1,
-                    nb_flower_2=nb_flower_2,
-                    min_values=min_values,
-                    max_values=max_values,
-                )
-            if x[-1] <= position[i, -1]:
-                for j in range(position.shape[1]):
-                    position[i, j] = x[j]
-            value = np.copy(position[position[:, -1].argsort()][0, :])
-            if best_global[-1] > value[-1]:
-                best_global = np.copy(value)
+        if monitor(count, best_global[-1]):
+            break
+        position = pollination(
+            target_function=target_function,
+            position=position,
+            best_global=best_global,
+            gama=gama,
+            lamb=lamb,
+            p=p,
+            min_values=min_values,
+            max_values=max_values,
+        )
+        best = np.argmin(position[:, -1])
+        if best_global[-1] > position[best, -1]:
+            best_global = np.copy(position[best, :])
         count = count + 1
-    print(best_global)
+    target_function.close()
+    monitor.close(count, best_global[-1])
     return best_global
+
+
+# Function: Asynchronous Entry Point
+async def flower_pollination_algorithm_async(target_function, **kwargs):
+    """
+    flower_pollination_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(flower_pollination_algorithm, target_function, **kwargs)
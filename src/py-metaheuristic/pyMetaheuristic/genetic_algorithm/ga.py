@@ -13,103 +13,77 @@
 
 ############################################################################
 
-import os
-import random
+import logging
 
 import numpy as np
 
 
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+from pyMetaheuristic.selection import fitness_function, roulette_wheel, select
 
 
 def initial_population(
         target_function, population_size=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     population = np.zeros((population_size, len(min_values) + 1))
-    for i in range(population_size):
-        for j in range(len(min_values)):
-            population[i, j] = random.uniform(min_values[j], max_values[j])
-        population[i, -1] = target_function(population[i, 0: population.shape[1] - 1])
+    population[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(population_size, len(min_values)),
+    )
+    evaluate(
+        target_function,
+        population[:, 0: population.shape[1] - 1],
+        out=population[:, -1],
+    )
     return population
 
 
-# Function: Fitness
-def fitness_function(population):
-    fitness = np.zeros((population.shape[0], 2))
-    for i in range(fitness.shape[0]):
-        fitness[i, 0] = 1 / (1 + population[i, -1] + abs(population[:, -1].min()))
-    fit_sum = fitness[:, 0].sum()
-    fitness[0, 1] = fitness[0, 0]
-    for i in range(1, fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 0] + fitness[i - 1, 1]
-    for i in range(fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 1] / fit_sum
-    return fitness
-
-
-# Function: Selection
-def roulette_wheel(fitness):
-    ix = 0
-    _random = rando()
-    for i in range(fitness.shape[0]):
-        if _random <= fitness[i, 1]:
-            ix = i
-            break
-    return ix
-
-
 # Function: Offspring
 def breeding(
-        target_function,
         population,
         fitness,
         min_values=(-5, -5),
         max_values=(5, 5),
         mu=1,
         elite=0,
+        selection="roulette",
+        tournament_size=2,
 ):
+    """
+    Simulated binary crossover of the whole generation. The first elite rows are
+    the best of population, kept as they are; the others are new children whose
+    fitness column is left for mutation to evaluate. Parents are picked by
+    selection, any method of pyMetaheuristic.selection.select.
+    """
     offspring = np.copy(population)
-    b_offspring = 0
     if elite > 0:
-        preserve = np.copy(population[population[:, -1].argsort()])
-        for i in range(elite):
-            for j in range(offspring.shape[1]):
-                offspring[i, j] = preserve[i, j]
-    for i in range(elite, offspring.shape[0]):
-        parent_1, parent_2 = roulette_wheel(fitness), roulette_wheel(fitness)
-        while parent_1 == parent_2:
-            parent_2 = np.random.choice(range(len(population) - 1), 1)[0]
-            print(f"parent_2 = {parent_2}")
-        for j in range(offspring.shape[1] - 1):
-            rand = rando()
-            rand_b = rando()
-            if rand <= 0.5:
-                b_offspring = 2 * rand_b
-                b_offspring = b_offspring ** (1 / (mu + 1))
-            elif rand > 0.5:
-                b_offspring = 1 / (2 * (1 - rand_b))
-                b_offspring = b_offspring ** (1 / (mu + 1))
-            offspring[i, j] = np.clip(
-                (
-                        (1 + b_offspring) * population[parent_1, j]
-                        + (1 - b_offspring) * population[parent_2, j]
-                )
-                / 2,
-                min_values[j],
-                max_values[j],
-            )
-            if i < population.shape[0] - 1:
-                offspring[i + 1, j] = np.clip(
-                    (
-                            (1 - b_offspring) * population[parent_1, j]
-                            + (1 + b_offspring) * population[parent_2, j]
-                    )
-                    / 2,
-                    min_values[j],
-                    max_values[j],
-                )
-        offspring[i, -1] = target_function(offspring[i, 0: offspring.shape[1] - 1])
+        offspring[:elite] = population[np.argsort(population[:, -1])[:elite]]
+    size = offspring.shape[0] - elite
+    parent_1, parent_2 = select(
+        population, fitness, 2 * size, selection, tournament_size
+    ).reshape(2, size)
+    twins = parent_1 == parent_2
+    while population.shape[0] > 1 and twins.any():
+        parent_2[twins] = engine.integers(population.shape[0], size=int(twins.sum()))
+        logging.debug("parent_2 = %s", parent_2[twins])
+        twins = parent_1 == parent_2
+    rand = engine.random((size, offspring.shape[1] - 1))
+    rand_b = engine.random((size, offspring.shape[1] - 1))
+    b_offspring = np.where(rand <= 0.5, 2 * rand_b, 1 / (2 * (1 - rand_b)))
+    b_offspring = b_offspring ** (1 / (mu + 1))
+    offspring[elite:, :-1] = np.clip(
+        (
+                (1 + b_offspring) * population[parent_1, :-1]
+                + (1 - b_offspring) * population[parent_2, :-1]
+        )
+        / 2,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
     return offspring
 
 
@@ -121,28 +95,40 @@ def mutation(
         eta=1,
         min_values=(-5, -5),
         max_values=(5, 5),
+        elite=0,
 ):
-    d_mutation = 0
-    for i in range(offspring.shape[0]):
-        for j in range(offspring.shape[1] - 1):
-            probability = int.from_bytes(os.urandom(8), byteorder="big") / (
-                    (1 << 64) - 1
-            )
-            if probability < mutation_rate:
-                rand = rando()
-                rand_d = int.from_bytes(os.urandom(8), byteorder="big") / (
-                        (1 << 64) - 1
-                )
-                if rand <= 0.5:
-                    d_mutation = 2 * rand_d
-                    d_mutation = d_mutation ** (1 / (eta + 1)) - 1
-                elif rand > 0.5:
-                    d_mutation = 2 * (1 - rand_d)
-                    d_mutation = 1 - d_mutation ** (1 / (eta + 1))
-                offspring[i, j] = np.clip(
-                    (offspring[i, j] + d_mutation), min_values[j], max_values[j]
-                )
-        offspring[i, -1] = target_function(offspring[i, 0: offspring.shape[1] - 1])
+    """
+    Polynomial mutation of each gene with probability mutation_rate, then one
+    evaluation of the rows from elite on and of the elite rows that mutated.
+    """
+    variables = offspring[:, :-1]
+    mutate = engine.random(variables.shape) < mutation_rate
+    rand = engine.random(variables.shape)
+    rand_d = engine.random(variables.shape)
+    d_mutation = np.where(
+        rand <= 0.5,
+        (2 * rand_d) ** (1 / (eta + 1)) - 1,
+        1 - (2 * (1 - rand_d)) ** (1 / (eta + 1)),
+    )
+    np.add(variables, d_mutation, out=variables, where=mutate)
+    np.clip(
+        variables,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        out=variables,
+    )
+    changed = mutate[:elite].any(axis=1)
+    if not changed.any():
+        evaluate(
+            target_function,
+            offspring[elite:, 0: offspring.shape[1] - 1],
+            out=offspring[elite:, -1],
+        )
+    else:
+        rows = np.concatenate(
+            [np.flatnonzero(changed), np.arange(elite, offspring.shape[0])]
+        )
+        offspring[rows, -1] = evaluate(target_function, offspring[rows, :-1])
     return offspring
 
 
@@ -156,6 +142,19 @@ def genetic_algorithm(
         eta=1,
         mu=1,
         generations=50,
+        selection="roulette",
+        tournament_size=2,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     GA Function
@@ -171,8 +170,35 @@ def genetic_algorithm(
     :param eta:
     :param mu:
     :param generations:
+    :param selection:
+    :param tournament_size:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     population = initial_population(
         target_function=target_function,
@@ -181,17 +207,19 @@ def genetic_algorithm(
         max_values=max_values,
     )
     fitness = fitness_function(population)
-    elite_ind = np.copy(population[population[:, -1].argsort()][0, :])
+    elite_ind = np.copy(population[np.argmin(population[:, -1]), :])
     while count <= generations:
-        print("Generation = ", count, " f(x) = ", elite_ind[-1])
+        if monitor(count, elite_ind[-1]):
+            break
         offspring = breeding(
-            target_function=target_function,
             population=population,
             fitness=fitness,
             min_values=min_values,
             max_values=max_values,
             mu=mu,
             elite=elite,
+            selection=selection,
+            tournament_size=tournament_size,
         )
         population = mutation(
             target_function=target_function,
@@ -200,11 +228,22 @@ def genetic_algorithm(
             eta=eta,
             min_values=min_values,
             max_values=max_values,
+            elite=elite,
         )
         fitness = fitness_function(population)
-        value = np.copy(population[population[:, -1].argsort()][0, :])
+        value = population[np.argmin(population[:, -1]), :]
         if elite_ind[-1] > value[-1]:
             elite_ind = np.copy(value)
         count = count + 1
-    print(elite_ind)
+    target_function.close()
+    monitor.close(count, elite_ind[-1])
     return elite_ind
+
+
+# Function: Asynchronous Entry Point
+async def genetic_algorithm_async(target_function, **kwargs):
+    """
+    genetic_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(genetic_algorithm, target_function, **kwargs)
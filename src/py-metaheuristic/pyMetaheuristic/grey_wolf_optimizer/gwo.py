@@ -27,69 +27,78 @@ Three steps to perform optimization.
 
 ############################################################################
 
-import random
-
 # Required Libraries
+import warnings
+
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
         target_function, pack_size=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((pack_size, len(min_values) + 1))
-    for i in range(pack_size):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(pack_size, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
+# Function: Initialize Alpha, Beta and Delta at the Origin
+def _origin_leader(target_function, dimension=2):
+    """
+    Deprecated: a leader at the origin, evaluated on its own. grey_wolf_optimizer
+    now takes its first leaders from the initial pack with update_pack.
+    """
+    warnings.warn(
+        "alpha_position, beta_position and delta_position are deprecated, "
+        "use update_pack(position)",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    leader = np.zeros((1, dimension + 1))
+    evaluate(target_function, leader[:, 0: leader.shape[1] - 1], out=leader[:, -1])
+    return leader
+
+
 # Function: Initialize Alpha
 def alpha_position(target_function, dimension=2):
-    alpha = np.zeros((1, dimension + 1))
-    for j in range(dimension):
-        alpha[0, j] = 0.0
-    alpha[0, -1] = target_function(alpha[0, 0: alpha.shape[1] - 1])
-    return alpha
+    return _origin_leader(target_function, dimension)
 
 
 # Function: Initialize Beta
 def beta_position(target_function, dimension=2):
-    beta = np.zeros((1, dimension + 1))
-    for j in range(dimension):
-        beta[0, j] = 0.0
-    beta[0, -1] = target_function(beta[0, 0: beta.shape[1] - 1])
-    return beta
+    return _origin_leader(target_function, dimension)
 
 
 # Function: Initialize Delta
 def delta_position(target_function, dimension=2):
-    delta = np.zeros((1, dimension + 1))
-    for j in range(dimension):
-        delta[0, j] = 0.0
-    delta[0, -1] = target_function(delta[0, 0: delta.shape[1] - 1])
-    return delta
+    return _origin_leader(target_function, dimension)
 
 
 # Function: Update Pack by Fitness
-def update_pack(position, alpha, beta, delta):
-    updated_position = np.copy(position)
-    for i in range(position.shape[0]):
-        if updated_position[i, -1] < alpha[0, -1]:
-            alpha[0, :] = np.copy(updated_position[i, :])
-        if (
-                updated_position[i, -1] > alpha[0, -1]
-                and updated_position[i, -1] < beta[0, -1]
-        ):
-            beta[0, :] = np.copy(updated_position[i, :])
-        if (
-                updated_position[i, -1] > alpha[0, -1]
-                and updated_position[i, -1] > beta[0, -1]
-                and updated_position[i, -1] < delta[0, -1]
-        ):
-            delta[0, :] = np.copy(updated_position[i, :])
+def update_pack(position, alpha=None, beta=None, delta=None):
+    """
+    Alpha, beta and delta: the three best wolves among the pack and the current
+    leaders, picked with argpartition and returned in order as (1, d + 1) arrays.
+    Without leaders they are taken from the pack alone; a pack of fewer than three
+    wolves repeats its worst one.
+    """
+    leaders = [leader for leader in (alpha, beta, delta) if leader is not None]
+    candidates = np.vstack([position] + leaders)
+    k = min(3, candidates.shape[0])
+    best = np.argpartition(candidates[:, -1], k - 1)[:k]
+    best = best[np.argsort(candidates[best, -1])]
+    best = best[np.minimum(np.arange(3), k - 1)]
+    alpha, beta, delta = (candidates[[i], :].copy() for i in best)
     return alpha, beta, delta
 
 
@@ -104,38 +113,47 @@ def update_position(
         min_values=(-5, -5),
         max_values=(5, 5),
 ):
+    """
+    Move the whole pack to the mean of its three leader-guided moves, with A and
+    C drawn per wolf, variable and leader, and evaluate it in one batch.
+    """
     updated_position = np.copy(position)
-    for i in range(updated_position.shape[0]):
-        for j in range(len(min_values)):
-            r1_alpha = rando()
-            r2_alpha = rando()
-            a_alpha = 2 * a_linear_component * r1_alpha - a_linear_component
-            c_alpha = 2 * r2_alpha
-            distance_alpha = abs(c_alpha * alpha[0, j] - position[i, j])
-            x1 = alpha[0, j] - a_alpha * distance_alpha
-            r1_beta = rando()
-            r2_beta = rando()
-            a_beta = 2 * a_linear_component * r1_beta - a_linear_component
-            c_beta = 2 * r2_beta
-            distance_beta = abs(c_beta * beta[0, j] - position[i, j])
-            x2 = beta[0, j] - a_beta * distance_beta
-            r1_delta = rando()
-            r2_delta = rando()
-            a_delta = 2 * a_linear_component * r1_delta - a_linear_component
-            c_delta = 2 * r2_delta
-            distance_delta = abs(c_delta * delta[0, j] - position[i, j])
-            x3 = delta[0, j] - a_delta * distance_delta
-            updated_position[i, j] = np.clip(
-                ((x1 + x2 + x3) / 3), min_values[j], max_values[j]
-            )
-        updated_position[i, -1] = target_function(
-            updated_position[i, 0: updated_position.shape[1] - 1]
-        )
+    variables = position[:, :-1]
+    leaders = np.stack([alpha[0, :-1], beta[0, :-1], delta[0, :-1]])[:, np.newaxis, :]
+    r_values = engine.random((2, 3) + variables.shape)
+    a_leaders = 2 * a_linear_component * r_values[0] - a_linear_component
+    c_leaders = 2 * r_values[1]
+    distance = np.abs(c_leaders * leaders - variables)
+    updated_position[:, :-1] = np.clip(
+        np.mean(leaders - a_leaders * distance, axis=0),
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+    evaluate(
+        target_function,
+        updated_position[:, 0: updated_position.shape[1] - 1],
+        out=updated_position[:, -1],
+    )
     return updated_position
 
 
 def grey_wolf_optimizer(
-        target_function, pack_size=5, min_values=(-5, -5), max_values=(5, 5), iterations=50
+        target_function,
+        pack_size=5,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+        iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     GWO Function
@@ -147,22 +165,45 @@ def grey_wolf_optimizer(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
-    alpha = alpha_position(target_function=target_function, dimension=len(min_values))
-    beta = beta_position(target_function=target_function, dimension=len(min_values))
-    delta = delta_position(target_function=target_function, dimension=len(min_values))
     position = initial_position(
         target_function=target_function,
         pack_size=pack_size,
         min_values=min_values,
         max_values=max_values,
     )
+    alpha, beta, delta = update_pack(position)
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", alpha[-1])
+        if monitor(count, alpha[0, -1]):
+            break
         a_linear_component = 2 - count * (2 / iterations)
-        alpha, beta, delta = update_pack(position, alpha, beta, delta)
         position = update_position(
             target_function=target_function,
             position=position,
@@ -173,6 +214,17 @@ def grey_wolf_optimizer(
             min_values=min_values,
             max_values=max_values,
         )
+        alpha, beta, delta = update_pack(position, alpha, beta, delta)
         count = count + 1
-    print(alpha[-1])
+    target_function.close()
+    monitor.close(count, alpha[0, -1])
     return alpha
+
+
+# Function: Asynchronous Entry Point
+async def grey_wolf_optimizer_async(target_function, **kwargs):
+    """
+    grey_wolf_optimizer, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(grey_wolf_optimizer, target_function, **kwargs)
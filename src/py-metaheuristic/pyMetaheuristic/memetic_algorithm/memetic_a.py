@@ -32,12 +32,15 @@ in general, converging to high-quality solutions more efficiently than their con
 # GitHub repository: <https://github.com/Valdecy/Metaheuristic-Memetic_Algorithm>
 
 ############################################################################
+import logging
 import math
 import os
-import random
 
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+from pyMetaheuristic.selection import fitness_function, roulette_wheel
 
 
 class Memetic:
@@ -62,6 +65,17 @@ class Memetic:
             mu=1,
             std=0.1,
             generations=50,
+            vectorized=False,
+            n_jobs=None,
+            executor=None,
+            initializer=None,
+            initargs=(),
+            chunksize=None,
+            concurrency=None,
+            cache=None,
+            callback=None,
+            stop=None,
+            seed=None,
     ):
         """
         :param target_function:
@@ -78,9 +92,39 @@ class Memetic:
         :param mu:
         :param std:
         :param generations:
+        :param vectorized:
+            Breeding and mutation evaluate a generation in one batch. The crossover
+            hill climbing that follows climbs one parent pair at a time, each climb
+            seeing the previous one, so it evaluates its two offspring per call
+            whatever vectorized, n_jobs and executor say.
+        :param n_jobs:
+        :param executor:
+        :param initializer:
+        :param initargs:
+        :param chunksize:
+        :param concurrency:
+        :param cache:
+        :param callback:
+        :param stop:
+        :param seed:
         :return:
         """
-        self.target_function = target_function
+        if seed is not None:
+            engine.seed(seed)
+        self.target_function = as_evaluator(
+            target_function,
+            vectorized=vectorized,
+            n_jobs=n_jobs,
+            executor=executor,
+            initializer=initializer,
+            initargs=initargs,
+            chunksize=chunksize,
+            concurrency=concurrency,
+            cache=cache,
+        )
+        self.evaluations = self.target_function.evaluations
+        self.callback = callback
+        self.stop = stop
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.elite = elite
@@ -95,40 +139,31 @@ class Memetic:
         self.offspring_xhc = np.zeros((2, len(self.min_values) + 1))
         self.b_offspring = 0
 
-        self.offspring = self.breeding()
-        self.elite_ind = np.copy(self.population[self.population[:, -1].argsort()][0, :])
+        self.offspring = np.copy(self.population)
+        self.elite_ind = np.copy(self.population[0, :])
 
     def initial_population(self):
         """initialize population"""
 
         for i in range(self.population_size):
             for j in range(len(self.min_values)):
-                self.population[i, j] = random.uniform(self.min_values[j], self.max_values[j])
-            self.population[i, -1] = self.target_function(self.population[i, 0: self.population.shape[1] - 1])
+                self.population[i, j] = engine.uniform(self.min_values[j], self.max_values[j])
+        evaluate(
+            self.target_function,
+            self.population[:, 0: self.population.shape[1] - 1],
+            out=self.population[:, -1],
+        )
         return self.population
 
     def fitness_function(self):
         """Fitness"""
-        for i in range(self.fitness.shape[0]):
-            self.fitness[i, 0] = 1 / (1 + self.population[i, -1] + abs(self.population[:, -1].min()))
-        fit_sum = self.fitness[:, 0].sum()
-        self.fitness[0, 1] = self.fitness[0, 0]
-        for i in range(1, self.fitness.shape[0]):
-            self.fitness[i, 1] = self.fitness[i, 0] + self.fitness[i - 1, 1]
-        for i in range(self.fitness.shape[0]):
-            self.fitness[i, 1] = self.fitness[i, 1] / fit_sum
+        self.fitness = fitness_function(self.population)
         return self.fitness
 
     # Function: Selection
-    def roulette_wheel(self):
+    def roulette_wheel(self, size=None):
         """Selection"""
-        ix = 0
-        _random = rando()
-        for i in range(self.fitness.shape[0]):
-            if _random <= self.fitness[i, 1]:
-                ix = i
-                break
-        return ix
+        return roulette_wheel(self.fitness, size)
 
     def breeding(self):
         """Offspring"""
@@ -136,11 +171,13 @@ class Memetic:
         if self.elite > 0:
             preserve = np.copy(self.population[self.population[:, -1].argsort()])
             offspring[:self.elite, :] = preserve[:self.elite, :]
+        parents_1 = self.roulette_wheel(offspring.shape[0])
+        parents_2 = self.roulette_wheel(offspring.shape[0])
         for i in range(self.elite, offspring.shape[0]):
-            parent_1 = self.roulette_wheel()
-            parent_2 = self.roulette_wheel()
+            parent_1 = parents_1[i]
+            parent_2 = parents_2[i]
             while parent_1 == parent_2:
-                parent_2 = np.random.choice(range(len(self.population) - 1), 1)[0]
+                parent_2 = engine.integers(len(self.population) - 1)
             for j in range(offspring.shape[1] - 1):
                 rand = rando()
                 rand_b = rando()
@@ -163,18 +200,24 @@ class Memetic:
                         self.min_values[j],
                         self.max_values[j],
                     )
-            offspring[i, -1] = self.target_function(offspring[i, 0: offspring.shape[1] - 1])
+        evaluate(
+            self.target_function,
+            offspring[self.elite:, 0: offspring.shape[1] - 1],
+            out=offspring[self.elite:, -1],
+        )
         return offspring
 
     def xhc(self):
-        """Crossover Hill Climbing"""
+        """Crossover Hill Climbing, one parent pair at a time"""
         n_rows = self.offspring.shape[0]
         n_cols = self.offspring.shape[1]
-        for _ in range(n_rows):
-            parent_1 = self.roulette_wheel()
-            parent_2 = self.roulette_wheel()
+        parents_1 = self.roulette_wheel(n_rows)
+        parents_2 = self.roulette_wheel(n_rows)
+        for i in range(n_rows):
+            parent_1 = parents_1[i]
+            parent_2 = parents_2[i]
             while parent_1 == parent_2:
-                parent_2 = np.random.choice(range(n_rows - 1), 1)[0]
+                parent_2 = engine.integers(n_rows - 1)
             for j in range(n_cols - 1):
                 rand = rando()
                 rand_b = rando()
@@ -196,11 +239,10 @@ class Memetic:
                     self.min_values[j],
                     self.max_values[j],
                 )
-            self.offspring_xhc[0, -1] = self.target_function(
-                self.offspring_xhc[0, 0: self.offspring_xhc.shape[1] - 1]
-            )
-            self.offspring_xhc[1, -1] = self.target_function(
-                self.offspring_xhc[1, 0: self.offspring_xhc.shape[1] - 1]
+            evaluate(
+                self.target_function,
+                self.offspring_xhc[:, 0: self.offspring_xhc.shape[1] - 1],
+                out=self.offspring_xhc[:, -1],
             )
             xhc1_less_xhc0 = self.offspring_xhc[1, -1] < self.offspring_xhc[0, -1]
             if xhc1_less_xhc0:
@@ -226,14 +268,10 @@ class Memetic:
         d_mutation = 0
         for i in range(self.offspring.shape[0]):
             for j in range(self.offspring.shape[1] - 1):
-                probability = int.from_bytes(os.urandom(8), byteorder="big") / (
-                        (1 << 64) - 1
-                )
+                probability = rando()
                 if probability < self.mutation_rate:
                     rand = rando()
-                    rand_d = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
+                    rand_d = rando()
                     if rand <= 0.5:
                         d_mutation = 2 * rand_d
                         d_mutation = d_mutation ** (1 / (self.eta + 1)) - 1
@@ -243,29 +281,47 @@ class Memetic:
                     self.offspring[i, j] = np.clip(
                         (self.offspring[i, j] + d_mutation), self.min_values[j], self.max_values[j]
                     )
-            self.offspring[i, -1] = self.target_function(self.offspring[i, 0: self.offspring.shape[1] - 1])
+        evaluate(
+            self.target_function,
+            self.offspring[:, 0: self.offspring.shape[1] - 1],
+            out=self.offspring[:, -1],
+        )
         return self.offspring
 
     def minimize(self):
         """ minimize target function """
+        monitor = Monitor(
+            self.target_function, self.callback, self.stop, evaluations=self.evaluations
+        )
         count = 0
         self.population = self.initial_population()
+        self.fitness = self.fitness_function()
+        self.elite_ind = np.copy(self.population[self.population[:, -1].argsort()][0, :])
 
         while count <= self.generations:
-            print("Generation = ", count, " f(x) = ", round(self.elite_ind[-1], 4))
+            if monitor(count, self.elite_ind[-1]):
+                break
             self.offspring = self.breeding()
             self.population = self.mutation()
             self.population = self.xhc()
             if (self.population[:, 0: self.population.shape[1] - 1].std()) / len(self.min_values) < self.std:
-                print("Reinitializing Population")
+                logging.debug("Reinitializing Population")
                 self.population = self.initial_population()
             self.fitness = self.fitness_function()
             if self.elite_ind[-1] > self.population[self.population[:, -1].argsort()][0, :][-1]:
                 self.elite_ind = np.copy(self.population[self.population[:, -1].argsort()][0, :])
             count = count + 1
-        print(self.elite_ind)
+        self.target_function.close()
+        monitor.close(count, self.elite_ind[-1])
         return self.elite_ind
 
+    async def minimize_async(self):
+        """
+        minimize, awaited without blocking the running event loop
+        :return:
+        """
+        return await run_async(self.minimize)
+
     def plot_target(self):
         """plot target function"""
         from matplotlib import pyplot as plt
@@ -22,30 +22,44 @@ a moth flies by maintaining a fixed angle with respect to the moon:
 
 ############################################################################
 
-import math
-import random
-
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_moths(
         target_function, swarm_size=3, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((swarm_size, len(min_values) + 1))
-    for i in range(swarm_size):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(swarm_size, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # Function: Update Flames
 def update_flames(flames, position):
-    population = np.vstack([flames, position])
-    flames = np.copy(population[population[:, -1].argsort()][: flames.shape[0], :])
+    """
+    Merge the moths into the flames, in place: the flames.shape[0] best of both
+    are picked with argpartition, and only the flames they drop are overwritten,
+    by the moths that made the cut. The flames are left unsorted.
+    """
+    size = flames.shape[0]
+    fitness = np.concatenate([flames[:, -1], position[:, -1]])
+    keep = np.argpartition(fitness, size - 1)[:size]
+    moths = keep[keep >= size] - size
+    if moths.size > 0:
+        dropped = np.ones(size, dtype=bool)
+        dropped[keep[keep < size]] = False
+        flames[dropped] = position[moths]
     return flames
 
 
@@ -60,33 +74,28 @@ def update_position(
         min_values=(-5, -5),
         max_values=(5, 5),
 ):
-    for i in range(position.shape[0]):
-        for j in range(len(min_values)):
-            if i <= flame_number:
-                flame_distance = abs(flames[i, j] - position[i, j])
-                rnd_1 = rando()
-                rnd_2 = (a_linear_component - 1) * rnd_1 + 1
-                position[i, j] = (
-                        flame_distance
-                        * math.exp(b_constant * rnd_2)
-                        * math.cos(rnd_2 * 2 * math.pi)
-                        + flames[i, j]
-                )
-            elif i > flame_number:
-                flame_distance = abs(flames[i, j] - position[i, j])
-                rnd_1 = rando()
-                rnd_2 = (a_linear_component - 1) * rnd_1 + 1
-                position[i, j] = np.clip(
-                    (
-                            flame_distance
-                            * math.exp(b_constant * rnd_2)
-                            * math.cos(rnd_2 * 2 * math.pi)
-                            + flames[flame_number, j]
-                    ),
-                    min_values[j],
-                    max_values[j],
-                )
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    """
+    Fly every moth along a logarithmic spiral around its flame. The flame_number
+    best flames, found with argpartition, get one moth each; the remaining moths
+    all circle the worst of them. The swarm is clipped and evaluated in one batch.
+    """
+    flame_number = min(max(flame_number, 1), flames.shape[0])
+    active = np.argpartition(flames[:, -1], flame_number - 1)[:flame_number]
+    ranks = np.minimum(np.arange(position.shape[0]), flame_number - 1)
+    targets = flames[active[ranks], :-1]
+    variables = position[:, :-1]
+    rnd_2 = (a_linear_component - 1) * engine.random(variables.shape) + 1
+    variables[:] = np.clip(
+        np.abs(targets - variables)
+        * np.exp(b_constant * rnd_2)
+        * np.cos(rnd_2 * 2 * np.pi)
+        + targets,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -98,6 +107,17 @@ def moth_flame_algorithm(
         max_values=(5, 5),
         generations=50,
         b_constant=1,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
 
@@ -109,8 +129,33 @@ def moth_flame_algorithm(
     :param max_values:
     :param generations:
     :param b_constant:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_moths(
         target_function=target_function,
@@ -118,10 +163,11 @@ def moth_flame_algorithm(
         min_values=min_values,
         max_values=max_values,
     )
-    flames = np.copy(position[position[:, -1].argsort()][:, :])
-    best_moth = np.copy(flames[0, :])
+    flames = np.copy(position)
+    best_moth = np.copy(flames[np.argmin(flames[:, -1]), :])
     while count <= generations:
-        print("Generation: ", count, " of ", generations, " f(x) = ", best_moth[-1])
+        if monitor(count, best_moth[-1]):
+            break
         flame_number = round(
             position.shape[0] - count * ((position.shape[0] - 1) / generations)
         )
@@ -138,7 +184,18 @@ def moth_flame_algorithm(
         )
         flames = update_flames(flames, position)
         count = count + 1
-        if best_moth[-1] > flames[0, -1]:
-            best_moth = np.copy(flames[0, :])
-    print(best_moth)
+        best_flame = np.argmin(flames[:, -1])
+        if best_moth[-1] > flames[best_flame, -1]:
+            best_moth = np.copy(flames[best_flame, :])
+    target_function.close()
+    monitor.close(count, best_moth[-1])
     return best_moth
+
+
+# Function: Asynchronous Entry Point
+async def moth_flame_algorithm_async(target_function, **kwargs):
+    """
+    moth_flame_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(moth_flame_algorithm, target_function, **kwargs)
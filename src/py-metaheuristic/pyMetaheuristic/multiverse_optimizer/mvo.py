@@ -20,50 +20,29 @@ the Multi-Verse Optimizer (MVO) based on cosmological concepts:
 ############################################################################
 
 import math
-import os
-import random
 
 # Required Libraries
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
+from pyMetaheuristic.selection import fitness_function, roulette_wheel
+
 
 # Function: Initialize Variables
 def initial_universes(
         target_function, universes=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     cosmos = np.zeros((universes, len(min_values) + 1))
-    for i in range(universes):
-        for j in range(len(min_values)):
-            cosmos[i, j] = random.uniform(min_values[j], max_values[j])
-        cosmos[i, -1] = target_function(cosmos[i, 0: cosmos.shape[1] - 1])
+    cosmos[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(universes, len(min_values)),
+    )
+    evaluate(target_function, cosmos[:, 0: cosmos.shape[1] - 1], out=cosmos[:, -1])
     return cosmos
 
 
-# Function: Fitness
-def fitness_function(cosmos):
-    fitness = np.zeros((cosmos.shape[0], 2))
-    for i in range(fitness.shape[0]):
-        fitness[i, 0] = 1 / (1 + cosmos[i, -1] + abs(cosmos[:, -1].min()))
-    fit_sum = fitness[:, 0].sum()
-    fitness[0, 1] = fitness[0, 0]
-    for i in range(1, fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 0] + fitness[i - 1, 1]
-    for i in range(fitness.shape[0]):
-        fitness[i, 1] = fitness[i, 1] / fit_sum
-    return fitness
-
-
-# Function: Selection
-def roulette_wheel(fitness):
-    ix = 0
-    _random = rando()
-    for i in range(fitness.shape[0]):
-        if _random <= fitness[i, 1]:
-            ix = i
-            break
-    return ix
-
-
 # Function: Big Bang
 def big_bang(
         target_function,
@@ -75,41 +54,47 @@ def big_bang(
         min_values=(-5, -5),
         max_values=(5, 5),
 ):
-    for i in range(cosmos.shape[0]):
-        for j in range(len(min_values)):
-            r1 = rando()
-            if r1 < fitness[i, 1]:
-                white_hole_i = roulette_wheel(fitness)
-                cosmos[i, j] = cosmos[white_hole_i, j]
-            r2 = rando()
-            if r2 < wormhole_existence_probability:
-                r3 = rando()
-                if r3 <= 0.5:
-                    rand = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
-                    cosmos[i, j] = best_universe[j] + travelling_distance_rate * (
-                            (max_values[j] - min_values[j]) * rand + min_values[j]
-                    )
-                elif r3 > 0.5:
-                    rand = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
-                    cosmos[i, j] = np.clip(
-                        (
-                                best_universe[j]
-                                - travelling_distance_rate
-                                * ((max_values[j] - min_values[j]) * rand + min_values[j])
-                        ),
-                        min_values[j],
-                        max_values[j],
-                    )
-        cosmos[i, -1] = target_function(cosmos[i, 0: cosmos.shape[1] - 1])
+    """
+    Every universe variable first takes, with probability given by the fitness
+    matrix of its universe, the value of a white hole picked by the roulette wheel
+    from the cosmos as it stood before the big bang. Then, with probability
+    wormhole_existence_probability, a wormhole sends it around the best universe.
+    All the draws are made for the whole (universes, dimension) matrix at once,
+    and the new universes are clipped and evaluated in one batch.
+    """
+    min_values = np.asarray(min_values, dtype=float)
+    max_values = np.asarray(max_values, dtype=float)
+    variables = cosmos[:, :-1]
+    shape = variables.shape
+    white_holes = roulette_wheel(fitness, shape)
+    r1, r2, r3, rand = engine.random((4,) + shape)
+    exchange = r1 < fitness[:, 1:2]
+    variables[:] = np.where(exchange, variables[white_holes, np.arange(shape[1])], variables)
+    travel = travelling_distance_rate * ((max_values - min_values) * rand + min_values)
+    wormhole = best_universe[:-1] + np.where(r3 <= 0.5, travel, -travel)
+    np.copyto(variables, wormhole, where=r2 < wormhole_existence_probability)
+    np.clip(variables, min_values, max_values, out=variables)
+    evaluate(target_function, cosmos[:, 0: cosmos.shape[1] - 1], out=cosmos[:, -1])
     return cosmos
 
 
 def muti_verse_optimizer(
-        target_function, universes=5, min_values=(-5, -5), max_values=(5, 5), iterations=50
+        target_function,
+        universes=5,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+        iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     MVO Function
@@ -129,6 +114,28 @@ def muti_verse_optimizer(
         max_values = The maximum value that the variable(s) from a list can have. The default value is 5.
     :param iterations:
         iterations = The total number of iterations. The Default Value is 50.
+    :param vectorized:
+        vectorized = If True, target_function receives an (n, d) matrix of universes and returns an (n,) vector. The Default Value is False.
+    :param n_jobs:
+        n_jobs = Number of worker processes that evaluate each generation. -1 uses every core. The Default Value is None (serial).
+    :param executor:
+        executor = A concurrent.futures.Executor to evaluate with instead of n_jobs. The Default Value is None.
+    :param initializer:
+        initializer = Called once in every worker process or thread started for n_jobs, e.g. to load data. The Default Value is None.
+    :param initargs:
+        initargs = Arguments for initializer. The Default Value is ().
+    :param chunksize:
+        chunksize = Candidates sent to a worker per task. The Default Value is None (about four chunks per worker and batch).
+    :param concurrency:
+        concurrency = Evaluations of an async def target_function awaited at once. The Default Value is None (a whole generation).
+    :param cache:
+        cache = A FitnessCache, or True for a new one, so repeated candidates are not evaluated again. The Default Value is None.
+    :param callback:
+        callback = Called with an IterationEvent every iteration; False silences the run. The Default Value is None (a rate-limited Reporter).
+    :param stop:
+        stop = StoppingCriteria ending the run early on an evaluation budget, a deadline, a target fitness or a plateau. The Default Value is None.
+    :param seed:
+        seed = Seed for the package random engine, for reproducible runs. The Default Value is None.
 
     :return:
 
@@ -137,6 +144,20 @@ def muti_verse_optimizer(
     For example, if the function f(x1, x2) is used, then the array would be [x1, x2, f(x1, x2)].
 
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     cosmos = initial_universes(
         target_function=target_function,
@@ -145,11 +166,12 @@ def muti_verse_optimizer(
         max_values=max_values,
     )
     fitness = fitness_function(cosmos)
-    best_universe = np.copy(cosmos[cosmos[:, -1].argsort()][0, :])
+    best_universe = np.copy(cosmos[np.argmin(cosmos[:, -1]), :])
     wormhole_existence_probability_max = 1.0
     wormhole_existence_probability_min = 0.2
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_universe[-1])
+        if monitor(count, best_universe[-1]):
+            break
         wormhole_existence_probability = wormhole_existence_probability_min + count * (
                 (wormhole_existence_probability_max - wormhole_existence_probability_min)
                 / iterations
@@ -168,9 +190,19 @@ def muti_verse_optimizer(
             max_values=max_values,
         )
         fitness = fitness_function(cosmos)
-        value = np.copy(cosmos[cosmos[:, -1].argsort()][0, :])
+        value = cosmos[np.argmin(cosmos[:, -1]), :]
         if best_universe[-1] > value[-1]:
             best_universe = np.copy(value)
         count = count + 1
-    print(best_universe)
+    target_function.close()
+    monitor.close(count, best_universe[-1])
     return best_universe
+
+
+# Function: Asynchronous Entry Point
+async def muti_verse_optimizer_async(target_function, **kwargs):
+    """
+    muti_verse_optimizer, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(muti_verse_optimizer, target_function, **kwargs)
@@ -1,5 +1,21 @@
+"""
+Target functions for testing and benchmarking the optimizers.
+
+Apart from the scalar ``easom``, every function is written in NumPy for any
+dimension: given an (n, d) matrix it returns the (n,) fitness of its rows in
+one call, so it can be passed with ``vectorized=True``; given a single list of
+variables it returns a number, so it works row by row as well.
+
+``ShiftedRotated`` turns any of them into a CEC-style variant
+f(M (x - o)) + bias, with ``random_shift`` and ``random_rotation`` to draw o
+and M. ``DOMAINS`` holds the usual search box of each function and its global
+minimum per variable, ``MINIMIZERS`` the value of every variable at that minimum.
+"""
+import functools
 import math
 
+import numpy as np
+
 
 def easom(variables_values=(0, 0)):
     """
@@ -10,3 +26,215 @@ def easom(variables_values=(0, 0)):
     return (
             -math.cos(variables_values[0]) * math.cos(variables_values[1]) *
             math.exp(-((variables_values[0] - math.pi) ** 2) - (variables_values[1] - math.pi) ** 2))
+
+
+def batch_function(function):
+    """Let a function of an (n, d) matrix also take a single list of variables."""
+
+    @functools.wraps(function)
+    def wrapper(variables_values):
+        candidates = np.asarray(variables_values, dtype=float)
+        if candidates.ndim == 1:
+            return float(function(candidates[np.newaxis, :])[0])
+        return function(candidates)
+
+    return wrapper
+
+
+@batch_function
+def sphere(candidates):
+    """
+    Target Function: Sphere Function
+    Global Minimum f(x) = 0 for x = (0, ..., 0)
+    :param candidates:
+    :return:
+    """
+    return np.sum(candidates ** 2, axis=1)
+
+
+@batch_function
+def rastrigin(candidates):
+    """
+    Target Function: Rastrigin Function
+    Global Minimum f(x) = 0 for x = (0, ..., 0)
+    :param candidates:
+    :return:
+    """
+    return 10 * candidates.shape[1] + np.sum(
+        candidates ** 2 - 10 * np.cos(2 * np.pi * candidates), axis=1
+    )
+
+
+@batch_function
+def rosenbrock(candidates):
+    """
+    Target Function: Rosenbrock Function
+    Global Minimum f(x) = 0 for x = (1, ..., 1)
+    :param candidates:
+    :return:
+    """
+    head = candidates[:, :-1]
+    tail = candidates[:, 1:]
+    return np.sum(100 * (tail - head ** 2) ** 2 + (1 - head) ** 2, axis=1)
+
+
+@batch_function
+def ackley(candidates):
+    """
+    Target Function: Ackley Function
+    Global Minimum f(x) = 0 for x = (0, ..., 0)
+    :param candidates:
+    :return:
+    """
+    return (
+            -20 * np.exp(-0.2 * np.sqrt(np.mean(candidates ** 2, axis=1)))
+            - np.exp(np.mean(np.cos(2 * np.pi * candidates), axis=1))
+            + 20
+            + math.e
+    )
+
+
+@batch_function
+def griewank(candidates):
+    """
+    Target Function: Griewank Function
+    Global Minimum f(x) = 0 for x = (0, ..., 0)
+    :param candidates:
+    :return:
+    """
+    index = np.sqrt(np.arange(1, candidates.shape[1] + 1))
+    return (
+            np.sum(candidates ** 2, axis=1) / 4000
+            - np.prod(np.cos(candidates / index), axis=1)
+            + 1
+    )
+
+
+@batch_function
+def schwefel(candidates):
+    """
+    Target Function: Schwefel Function
+    Global Minimum f(x) = 0 for x = (420.9687, ..., 420.9687)
+    :param candidates:
+    :return:
+    """
+    return 418.9828872724338 * candidates.shape[1] - np.sum(
+        candidates * np.sin(np.sqrt(np.abs(candidates))), axis=1
+    )
+
+
+@batch_function
+def levy(candidates):
+    """
+    Target Function: Levy Function
+    Global Minimum f(x) = 0 for x = (1, ..., 1)
+    :param candidates:
+    :return:
+    """
+    w = 1 + (candidates - 1) / 4
+    head = w[:, :-1]
+    last = w[:, -1]
+    return (
+            np.sin(np.pi * w[:, 0]) ** 2
+            + np.sum((head - 1) ** 2 * (1 + 10 * np.sin(np.pi * head + 1) ** 2), axis=1)
+            + (last - 1) ** 2 * (1 + np.sin(2 * np.pi * last) ** 2)
+    )
+
+
+@batch_function
+def styblinski_tang(candidates):
+    """
+    Target Function: Styblinski-Tang Function
+    Global Minimum f(x) = -39.16616570377142 * d for x = (-2.903534, ..., -2.903534)
+    :param candidates:
+    :return:
+    """
+    return 0.5 * np.sum(candidates ** 4 - 16 * candidates ** 2 + 5 * candidates, axis=1)
+
+
+# Function: (search box of every variable, global minimum divided by the dimension)
+DOMAINS = {
+    "sphere": ((-5.12, 5.12), 0.0),
+    "rastrigin": ((-5.12, 5.12), 0.0),
+    "rosenbrock": ((-5.0, 10.0), 0.0),
+    "ackley": ((-32.768, 32.768), 0.0),
+    "griewank": ((-600.0, 600.0), 0.0),
+    "schwefel": ((-500.0, 500.0), 0.0),
+    "levy": ((-10.0, 10.0), 0.0),
+    "styblinski_tang": ((-5.0, 5.0), -39.16616570377142),
+}
+
+
+# Function: value of every variable at the global minimum
+MINIMIZERS = {
+    "sphere": 0.0,
+    "rastrigin": 0.0,
+    "rosenbrock": 1.0,
+    "ackley": 0.0,
+    "griewank": 0.0,
+    "schwefel": 420.9687462275036,
+    "levy": 1.0,
+    "styblinski_tang": -2.903534027771178,
+}
+
+
+def random_shift(dimension, low=None, high=None, seed=None, function=None):
+    """
+    Shift vector o with entries drawn uniformly from [low, high].
+
+    Without low and high the range comes from function, one of DOMAINS given by
+    name or as the function itself: the shifted global minimum then falls in the
+    central 80% of its search box, so ShiftedRotated(function, o) keeps its
+    optimum inside the box (with a rotation too for the functions minimized at
+    the origin).
+    """
+    if low is None or high is None:
+        name = getattr(function, "__name__", function)
+        if name not in DOMAINS:
+            raise ValueError(
+                f"random_shift needs low and high, or a function of {tuple(DOMAINS)}, not {name!r}"
+            )
+        (box_low, box_high), _ = DOMAINS[name]
+        margin = 0.1 * (box_high - box_low)
+        if low is None:
+            low = box_low + margin - MINIMIZERS[name]
+        if high is None:
+            high = box_high - margin - MINIMIZERS[name]
+    return np.random.default_rng(seed).uniform(low, high, dimension)
+
+
+def random_rotation(dimension, seed=None):
+    """Random orthogonal (d, d) matrix M, from the QR decomposition of a Gaussian matrix."""
+    q, r = np.linalg.qr(np.random.default_rng(seed).standard_normal((dimension, dimension)))
+    return q * np.sign(np.diag(r))
+
+
+class ShiftedRotated:
+    """
+    CEC-style variant f(M (x - o)) + bias of a batch target function f.
+
+    Instances are picklable when f is a module-level function, so they can be
+    evaluated by a process pool.
+    """
+
+    def __init__(self, function, shift=None, rotation=None, bias=0.0):
+        """
+        :param function: a target function of this module, or any function of an (n, d) matrix.
+        :param shift: vector o subtracted from x before the rotation; None for no shift.
+        :param rotation: (d, d) matrix M, e.g. from random_rotation; None for no rotation.
+        :param bias: added to every fitness value.
+        """
+        self.function = function
+        self.shift = None if shift is None else np.asarray(shift, dtype=float)
+        self.rotation = None if rotation is None else np.asarray(rotation, dtype=float)
+        self.bias = bias
+
+    def __call__(self, variables_values):
+        candidates = np.asarray(variables_values, dtype=float)
+        if candidates.ndim == 1:
+            return float(self(candidates[np.newaxis, :])[0])
+        if self.shift is not None:
+            candidates = candidates - self.shift
+        if self.rotation is not None:
+            candidates = candidates @ self.rotation.T
+        return np.asarray(self.function(candidates)) + self.bias
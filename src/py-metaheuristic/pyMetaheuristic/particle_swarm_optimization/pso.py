@@ -25,40 +25,42 @@ This vector defines the magnitude and direction of step size for each dimension
 
 ############################################################################
 
-import random
-
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
         target_function, swarm_size=3, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((swarm_size, len(min_values) + 1))
-    for i in range(swarm_size):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(swarm_size, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # Function: Initialize Velocity
 def initial_velocity(position, min_values=(-5, -5), max_values=(5, 5)):
-    init_velocity = np.zeros((position.shape[0], len(min_values)))
-    for i in range(init_velocity.shape[0]):
-        for j in range(init_velocity.shape[1]):
-            init_velocity[i, j] = random.uniform(min_values[j], max_values[j])
-    return init_velocity
+    return engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(position.shape[0], len(min_values)),
+    )
 
 
 # Function: Individual Best
 def individual_best_matrix(position, i_b_matrix):
-    for i in range(position.shape[0]):
-        if i_b_matrix[i, -1] > position[i, -1]:
-            for j in range(position.shape[1]):
-                i_b_matrix[i, j] = position[i, j]
+    improved = position[:, -1] < i_b_matrix[:, -1]
+    i_b_matrix[improved] = position[improved]
     return i_b_matrix
 
 
@@ -66,16 +68,13 @@ def individual_best_matrix(position, i_b_matrix):
 def velocity_vector(
         position, init_velocity, i_b_matrix, best_global, w=0.5, c1=2, c2=2
 ):
-    r1 = rando()
-    r2 = rando()
-    velocity = np.zeros((position.shape[0], init_velocity.shape[1]))
-    for i in range(init_velocity.shape[0]):
-        for j in range(init_velocity.shape[1]):
-            velocity[i, j] = (
-                    w * init_velocity[i, j]
-                    + c1 * r1 * (i_b_matrix[i, j] - position[i, j])
-                    + c2 * r2 * (best_global[j] - position[i, j])
-            )
+    # r1 and r2 are drawn per particle and per dimension
+    r1 = engine.random(init_velocity.shape)
+    r2 = engine.random(init_velocity.shape)
+    variables = position[:, :-1]
+    velocity = w * init_velocity
+    velocity += c1 * r1 * (i_b_matrix[:, :-1] - variables)
+    velocity += c2 * r2 * (best_global[:-1] - variables)
     return velocity
 
 
@@ -83,12 +82,17 @@ def velocity_vector(
 def update_position(
         target_function, position, velocity, min_values=(-5, -5), max_values=(5, 5)
 ):
-    for i in range(position.shape[0]):
-        for j in range(position.shape[1] - 1):
-            position[i, j] = np.clip(
-                (position[i, j] + velocity[i, j]), min_values[j], max_values[j]
-            )
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    variables = position[:, :-1]
+    variables += velocity
+    np.clip(
+        variables,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        out=variables,
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -102,6 +106,17 @@ def particle_swarm_optimization(
         w=0.9,
         c1=2,
         c2=2,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     # PSO Function
@@ -117,8 +132,33 @@ def particle_swarm_optimization(
     :param w:
     :param c1:
     :param c2:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -130,14 +170,19 @@ def particle_swarm_optimization(
         position, min_values=min_values, max_values=max_values
     )
     i_b_matrix = np.copy(position)
-    best_global = np.copy(position[position[:, -1].argsort()][0, :])
+    best_global = np.copy(position[np.argmin(position[:, -1]), :])
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_global[-1])
+        if monitor(count, best_global[-1]):
+            break
         position = update_position(
-            target_function=target_function, position=position, velocity=init_velocity
+            target_function=target_function,
+            position=position,
+            velocity=init_velocity,
+            min_values=min_values,
+            max_values=max_values,
         )
         i_b_matrix = individual_best_matrix(position, i_b_matrix)
-        value = np.copy(i_b_matrix[i_b_matrix[:, -1].argsort()][0, :])
+        value = i_b_matrix[np.argmin(i_b_matrix[:, -1]), :]
         if best_global[-1] > value[-1]:
             best_global = np.copy(value)
         if decay > 0:
@@ -149,5 +194,15 @@ def particle_swarm_optimization(
             position, init_velocity, i_b_matrix, best_global, w=w, c1=c1, c2=c2
         )
         count = count + 1
-    print(best_global)
+    target_function.close()
+    monitor.close(count, best_global[-1])
     return best_global
+
+
+# Function: Asynchronous Entry Point
+async def particle_swarm_optimization_async(target_function, **kwargs):
+    """
+    particle_swarm_optimization, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(particle_swarm_optimization, target_function, **kwargs)
@@ -13,12 +13,12 @@
 
 ############################################################################
 
-import random
-
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine, rando
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
@@ -27,8 +27,10 @@ def initial_position(
     position = np.zeros((solutions, len(min_values) + 1))
     for i in range(solutions):
         for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+            position[i, j] = engine.uniform(min_values[j], max_values[j])
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -43,14 +45,31 @@ def update_position(target_function, position, min_values=(-5, -5), max_values=(
                 min_values[j],
                 max_values[j],
             )
-        updated_position[i, -1] = target_function(
-            updated_position[i, 0: updated_position.shape[1] - 1]
-        )
+    evaluate(
+        target_function,
+        updated_position[:, 0: updated_position.shape[1] - 1],
+        out=updated_position[:, -1],
+    )
     return updated_position
 
 
 def random_search(
-        target_function, solutions=5, min_values=(-5, -5), max_values=(5, 5), iterations=50
+        target_function,
+        solutions=5,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+        iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     RS Function
@@ -63,8 +82,33 @@ def random_search(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -74,7 +118,8 @@ def random_search(
     )
     best_solution = np.copy(position[position[:, -1].argsort()][0, :])
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", best_solution[-1])
+        if monitor(count, best_solution[-1]):
+            break
         position = update_position(
             target_function=target_function,
             position=position,
@@ -84,5 +129,15 @@ def random_search(
         if best_solution[-1] > position[position[:, -1].argsort()][0, :][-1]:
             best_solution = np.copy(position[position[:, -1].argsort()][0, :])
         count = count + 1
-    print(best_solution)
+    target_function.close()
+    monitor.close(count, best_solution[-1])
     return best_solution
+
+
+# Function: Asynchronous Entry Point
+async def random_search_async(target_function, **kwargs):
+    """
+    random_search, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(random_search, target_function, **kwargs)
@@ -0,0 +1,94 @@
+"""
+Package-level random number engine.
+
+Every optimizer draws its random numbers from the shared ``engine`` below.
+Scalar draws are served from pre-generated blocks of a ``numpy.random.Generator``,
+so inner loops pay a list lookup per number instead of a system call,
+and seeding the engine makes a run reproducible.
+"""
+import numpy as np
+
+
+class RandomEngine:
+    """
+    Block-buffered random number engine built on numpy.random.Generator.
+
+    Scalar draws (size=None) come from blocks of ``block_size`` uniforms or
+    standard normals that are refilled on demand; array draws go straight to
+    the underlying generator.
+    """
+
+    def __init__(self, seed=None, block_size=4096):
+        """
+        :param seed: anything accepted by numpy.random.default_rng.
+        :param block_size: number of values generated per refill.
+        """
+        self.block_size = block_size
+        self.generator = None
+        self._uniforms = []
+        self._uniform_index = 0
+        self._normals = []
+        self._normal_index = 0
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Reset the generator and discard any buffered values."""
+        self.generator = np.random.default_rng(seed)
+        self._uniforms = []
+        self._uniform_index = 0
+        self._normals = []
+        self._normal_index = 0
+
+    def random(self, size=None):
+        """Uniform value(s) in [0, 1)."""
+        if size is not None:
+            return self.generator.random(size)
+        if self._uniform_index >= len(self._uniforms):
+            self._uniforms = self.generator.random(self.block_size).tolist()
+            self._uniform_index = 0
+        value = self._uniforms[self._uniform_index]
+        self._uniform_index = self._uniform_index + 1
+        return value
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        """Uniform value(s) in [low, high)."""
+        if size is not None:
+            return self.generator.uniform(low, high, size)
+        return low + (high - low) * self.random()
+
+    def standard_normal(self, size=None):
+        """Standard normal value(s)."""
+        if size is not None:
+            return self.generator.standard_normal(size)
+        if self._normal_index >= len(self._normals):
+            self._normals = self.generator.standard_normal(self.block_size).tolist()
+            self._normal_index = 0
+        value = self._normals[self._normal_index]
+        self._normal_index = self._normal_index + 1
+        return value
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        """Normal value(s) with mean ``loc`` and standard deviation ``scale``."""
+        if size is not None:
+            return self.generator.normal(loc, scale, size)
+        return loc + scale * self.standard_normal()
+
+    def integers(self, low, high=None, size=None):
+        """Integer(s) in [low, high), or [0, low) when high is omitted."""
+        if high is None:
+            low, high = 0, low
+        if size is not None:
+            return self.generator.integers(low, high, size)
+        return low + int((high - low) * self.random())
+
+    def permutation(self, x):
+        """Shuffled copy of array x, or a permutation of range(x) for an integer."""
+        return self.generator.permutation(x)
+
+
+engine = RandomEngine()
+
+
+def seed(value=None):
+    """Seed the package-level engine."""
+    engine.seed(value)
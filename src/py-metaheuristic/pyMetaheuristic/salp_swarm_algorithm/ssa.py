@@ -24,86 +24,110 @@ that this is done for achieving better locomotion using rapid coordinated change
 ############################################################################
 
 import math
-import random
 
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
         target_function, swarm_size=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((swarm_size, len(min_values) + 1))
-    for i in range(swarm_size):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(swarm_size, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # Function: Initialize Food Position
 def food_position(target_function, dimension=2):
     food = np.zeros((1, dimension + 1))
-    for j in range(dimension):
-        food[0, j] = 0.0
-    food[0, -1] = target_function(food[0, 0: food.shape[1] - 1])
+    evaluate(target_function, food[:, 0: food.shape[1] - 1], out=food[:, -1])
     return food
 
 
 # Function: Update Food Position by Fitness
 def update_food(position, food):
-    for i in range(position.shape[0]):
-        if food[0, -1] > position[i, -1]:
-            for j in range(position.shape[1]):
-                food[0, j] = position[i, j]
+    best = np.argmin(position[:, -1])
+    if food[0, -1] > position[best, -1]:
+        food[0, :] = position[best, :]
     return food
 
 
+# Function: Follower Chain
+def follow_chain(head, followers, block=32):
+    """
+    Solve the follower recurrence y[i] = (y[i - 1] + followers[i]) / 2, with
+    y[-1] = head, in place. Within a block of rows it unrolls to
+    y[s + t] = (head + sum(2 ** u * followers[s + u] for u <= t)) / 2 ** (t + 1),
+    a cumulative sum; blocks are kept short so that 2 ** u stays exact, and each
+    one starts from the last row of the previous block.
+    """
+    scale = 2.0 ** np.arange(block)[:, np.newaxis]
+    for start in range(0, followers.shape[0], block):
+        rows = followers[start: start + block]
+        steps = scale[: rows.shape[0]]
+        np.cumsum(rows * steps, axis=0, out=rows)
+        rows += head
+        rows /= 2 * steps
+        head = rows[-1]
+    return followers
+
+
 # Function: Update Position
 def update_position(
         target_function, position, food, c1=1.0, min_values=(-5, -5), max_values=(5, 5)
 ):
-    for i in range(position.shape[0]):
-        if i <= position.shape[0] / 2:
-            for j in range(len(min_values)):
-                c2 = rando()
-                c3 = rando()
-                if c3 >= 0.5:  # c3 < 0.5
-                    position[i, j] = np.clip(
-                        (
-                                food[0, j]
-                                + c1
-                                * ((max_values[j] - min_values[j]) * c2 + min_values[j])
-                        ),
-                        min_values[j],
-                        max_values[j],
-                    )
-                else:
-                    position[i, j] = np.clip(
-                        (
-                                food[0, j]
-                                - c1
-                                * ((max_values[j] - min_values[j]) * c2 + min_values[j])
-                        ),
-                        min_values[j],
-                        max_values[j],
-                    )
-        elif i > position.shape[0] / 2 and i < position.shape[0] + 1:
-            for j in range(len(min_values)):
-                position[i, j] = np.clip(
-                    ((position[i - 1, j] + position[i, j]) / 2),
-                    min_values[j],
-                    max_values[j],
-                )
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    """
+    Leaders, the salps i <= swarm_size / 2, jump around the food by c1 times a
+    random step, with the sign drawn per variable; followers then move, in chain
+    order, halfway to the salp ahead of them. The swarm is evaluated in one batch.
+    """
+    min_values = np.asarray(min_values, dtype=float)
+    max_values = np.asarray(max_values, dtype=float)
+    leaders = position.shape[0] // 2 + 1
+    shape = (min(leaders, position.shape[0]), len(min_values))
+    c2 = engine.random(shape)
+    c3 = engine.random(shape)
+    step = c1 * ((max_values - min_values) * c2 + min_values)
+    position[: shape[0], :-1] = np.clip(
+        food[0, :-1] + np.where(c3 >= 0.5, step, -step), min_values, max_values
+    )
+    if position.shape[0] > leaders:
+        follow_chain(position[leaders - 1, :-1], position[leaders:, :-1])
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
 # SSA Function
 def salp_swarm_algorithm(
-        target_function, swarm_size=5, min_values=(-5, -5), max_values=(5, 5), iterations=50
+        target_function,
+        swarm_size=5,
+        min_values=(-5, -5),
+        max_values=(5, 5),
+        iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
 
@@ -115,8 +139,33 @@ def salp_swarm_algorithm(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -126,7 +175,8 @@ def salp_swarm_algorithm(
     )
     food = food_position(target_function=target_function, dimension=len(min_values))
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", food[0, -1])
+        if monitor(count, food[0, -1]):
+            break
         c1 = 2 * math.exp(-((4 * (count / iterations)) ** 2))
         food = update_food(position, food)
         position = update_position(
@@ -138,5 +188,15 @@ def salp_swarm_algorithm(
             max_values=max_values,
         )
         count = count + 1
-    print(food)
+    target_function.close()
+    monitor.close(count, food[0, -1])
     return food
+
+
+# Function: Asynchronous Entry Point
+async def salp_swarm_algorithm_async(target_function, **kwargs):
+    """
+    salp_swarm_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(salp_swarm_algorithm, target_function, **kwargs)
@@ -0,0 +1,75 @@
+"""
+Parent selection kernels shared by the optimizers.
+
+Fitness-proportional selection works on the (n, 2) fitness matrix the
+optimizers have always used: column 0 holds the weight of each row, column 1
+the normalized cumulative sum of the weights. The matrix is built once per
+generation, after which ``roulette_wheel`` draws any number of indices with a
+binary search each, and ``stochastic_universal_sampling`` draws them with
+evenly spaced pointers. ``tournament`` needs no fitness matrix, only the
+fitness column of the population.
+"""
+import numpy as np
+
+from pyMetaheuristic import engine
+
+METHODS = ("roulette", "sus", "tournament")
+
+
+def fitness_matrix(weights):
+    """Fitness matrix of non-negative selection weights."""
+    fitness = np.zeros((len(weights), 2))
+    fitness[:, 0] = weights
+    np.cumsum(fitness[:, 0], out=fitness[:, 1])
+    fitness[:, 1] = fitness[:, 1] / fitness[-1, 1]
+    return fitness
+
+
+def fitness_function(population):
+    """Fitness matrix of a population to minimize, its last column being the target value."""
+    return fitness_matrix(1 / (1 + population[:, -1] + abs(population[:, -1].min())))
+
+
+def roulette_wheel(fitness, size=None):
+    """Index of a row, or an array of size indices, drawn in proportion to fitness."""
+    if size is None:
+        return int(roulette_wheel(fitness, 1)[0])
+    ix = np.searchsorted(fitness[:, 1], engine.random(size))
+    return np.minimum(ix, fitness.shape[0] - 1)
+
+
+def stochastic_universal_sampling(fitness, size):
+    """
+    size indices drawn in proportion to fitness with a single random offset, so
+    every row is picked within one of its expected count. The indices come back
+    shuffled, ready to be paired.
+    """
+    pointers = (engine.random() + np.arange(size)) / size
+    ix = np.minimum(np.searchsorted(fitness[:, 1], pointers), fitness.shape[0] - 1)
+    return engine.permutation(ix)
+
+
+def tournament(population, size, tournament_size=2):
+    """size indices, each the best of tournament_size rows drawn at random."""
+    contenders = engine.integers(population.shape[0], size=(size, tournament_size))
+    winners = np.argmin(population[contenders, -1], axis=1)
+    return contenders[np.arange(size), winners]
+
+
+def select(population, fitness, size, method="roulette", tournament_size=2):
+    """
+    size indices of population picked by method.
+
+    :param population: population to minimize, its last column being the target value.
+    :param fitness: its fitness matrix; unused by "tournament".
+    :param size: number of indices.
+    :param method: "roulette", "sus" (stochastic universal sampling) or "tournament".
+    :param tournament_size: rows competing in each tournament.
+    """
+    if method == "roulette":
+        return roulette_wheel(fitness, size)
+    if method == "sus":
+        return stochastic_universal_sampling(fitness, size)
+    if method == "tournament":
+        return tournament(population, size, tournament_size)
+    raise ValueError(f"method must be one of {METHODS}, not {method!r}")
@@ -19,22 +19,24 @@ to decrease defects, thus minimizing the system energy.
 # GitHub repository: <https://github.com/Valdecy/Metaheuristic-Simulated_Annealing>
 
 ############################################################################
-import logging
-import random
-
 # Required Libraries
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
-def initial_guess(target_function, min_values=(-5, -5), max_values=(5, 5)):
+def initial_guess(target_function, min_values=(-5, -5), max_values=(5, 5), chains=1):
     """
-    Initialize Variables
+    Initialize Variables, one row per chain
     """
-    guess = np.zeros((1, len(min_values) + 1))
-    for j, min_values_j in enumerate(min_values):
-        guess[0, j] = random.uniform(min_values_j, max_values[j])
-    guess[0, -1] = target_function(guess[0, 0: guess.shape[1] - 1])
+    guess = np.zeros((chains, len(min_values) + 1))
+    guess[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(chains, len(min_values)),
+    )
+    evaluate(target_function, guess[:, 0: guess.shape[1] - 1], out=guess[:, -1])
     return guess
 
 
@@ -44,19 +46,18 @@ def epson_vector(guess, mu=0, sigma=1):
     :param guess:
     :param mu:
     :param sigma:
-    :return:
+    :return: one normal step per chain and variable.
     """
-    epson = np.zeros((1, guess.shape[1] - 1))
-    for j in range(guess.shape[1] - 1):
-        epson[0, j] = float(np.random.normal(mu, sigma, 1))
-    return epson
+    return engine.normal(mu, sigma, (guess.shape[0], guess.shape[1] - 1))
 
 
 def update_solution(
         target_function, guess, epson, min_values=(-5, -5), max_values=(5, 5)
 ):
     """
-    Update Solution
+    Update Solution: every chain takes its step, variables stepping out of
+    bounds are redrawn uniformly within them, and the chains are evaluated in
+    one batch.
 
     :param target_function:
     :param guess:
@@ -65,20 +66,38 @@ def update_solution(
     :param max_values:
     :return:
     """
+    min_values = np.asarray(min_values, dtype=float)
+    max_values = np.asarray(max_values, dtype=float)
     updated_solution = np.copy(guess)
-    for j in range(guess.shape[1] - 1):
-        if guess[0, j] + epson[0, j] > max_values[j]:
-            updated_solution[0, j] = random.uniform(min_values[j], max_values[j])
-        elif guess[0, j] + epson[0, j] < min_values[j]:
-            updated_solution[0, j] = random.uniform(min_values[j], max_values[j])
-        else:
-            updated_solution[0, j] = guess[0, j] + epson[0, j]
-    updated_solution[0, -1] = target_function(
-        updated_solution[0, 0: updated_solution.shape[1] - 1]
+    variables = updated_solution[:, :-1]
+    variables += epson
+    outside = np.logical_or(variables > max_values, variables < min_values)
+    if outside.any():
+        redrawn = engine.uniform(min_values, max_values, size=variables.shape)
+        np.copyto(variables, redrawn, where=outside)
+    evaluate(
+        target_function,
+        updated_solution[:, 0: updated_solution.shape[1] - 1],
+        out=updated_solution[:, -1],
     )
     return updated_solution
 
 
+def replica_exchange(guess, temperatures, parity=0):
+    """
+    Parallel tempering: swap the states of the adjacent chains (i, i + 1), for
+    every i of the given parity, with probability
+    min(1, exp((1 / T_i - 1 / T_i+1) * (f_i - f_i+1))).
+    """
+    i = np.arange(parity, guess.shape[0] - 1, 2)
+    delta = (1 / temperatures[i] - 1 / temperatures[i + 1]) * (
+            guess[i, -1] - guess[i + 1, -1]
+    )
+    swap = i[engine.random(i.size) < np.exp(np.minimum(delta, 0))]
+    guess[np.concatenate([swap, swap + 1])] = guess[np.concatenate([swap + 1, swap])]
+    return guess
+
+
 def simulated_annealing(
         target_function,
         min_values=(-5, -5),
@@ -89,6 +108,19 @@ def simulated_annealing(
         temperature_iterations=1000,
         final_temperature=0.0001,
         alpha=0.9,
+        chains=1,
+        tempering=None,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     SA Function
@@ -105,29 +137,58 @@ def simulated_annealing(
     :param temperature_iterations:
     :param final_temperature:
     :param alpha:
+    :param chains: number of chains advanced together, their steps evaluated in one batch.
+    :param tempering:
+        None for every chain to follow the temperature schedule; a ratio > 1 for
+        parallel tempering, chain m running at temperature * tempering ** m and
+        adjacent chains exchanging states after every step.
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     guess = initial_guess(
         target_function=target_function,
         min_values=min_values,
-        max_values=max_values
+        max_values=max_values,
+        chains=chains,
     )
-    epson = epson_vector(guess, mu=mu, sigma=sigma)
-    logging.debug(f"epson = {epson}")
-    best = np.copy(guess)
-    fx_best = guess[0, -1]
+    min_values = np.asarray(min_values, dtype=float)
+    max_values = np.asarray(max_values, dtype=float)
+    ladder = np.ones(chains)
+    if tempering is not None:
+        ladder = float(tempering) ** np.arange(chains)
+    best = np.copy(guess[[np.argmin(guess[:, -1])]])
     temperature = float(initial_temperature)
-    while temperature > final_temperature:
-        for repeat in range(temperature_iterations):
-            print(
-                "Temperature = ",
-                round(temperature, 4),
-                " ; iteration = ",
-                repeat,
-                " ; f(x) = ",
-                round(best[0, -1], 4),
-            )
-            fx_old = guess[0, -1]
+    count = 0
+    while temperature > final_temperature and monitor.reason is None:
+        temperatures = temperature * ladder
+        for _ in range(temperature_iterations):
+            if monitor(count, best[0, -1]):
+                break
+            count = count + 1
             epson = epson_vector(guess, mu=mu, sigma=sigma)
             new_guess = update_solution(
                 target_function=target_function,
@@ -136,15 +197,25 @@ def simulated_annealing(
                 min_values=min_values,
                 max_values=max_values,
             )
-            fx_new = new_guess[0, -1]
-            delta = fx_new - fx_old
-            rand = rando()
-            p_value = np.exp(-delta / temperature)
-            if delta < 0 or rand <= p_value:
-                guess = np.copy(new_guess)
-            if fx_new < fx_best:
-                fx_best = fx_new
-                best = np.copy(guess)
+            delta = new_guess[:, -1] - guess[:, -1]
+            # delta < 0 or rand <= exp(-delta / T), without overflowing exp
+            accepted = delta <= -temperatures * np.log(1 - engine.random(chains))
+            np.copyto(guess, new_guess, where=accepted[:, np.newaxis])
+            i = new_guess[:, -1].argmin()
+            if new_guess[i, -1] < best[0, -1]:
+                best = np.copy(new_guess[[i]])
+            if tempering is not None:
+                guess = replica_exchange(guess, temperatures, parity=count % 2)
         temperature = alpha * temperature
-    print(best)
+    target_function.close()
+    monitor.close(count, best[0, -1])
     return best
+
+
+# Function: Asynchronous Entry Point
+async def simulated_annealing_async(target_function, **kwargs):
+    """
+    simulated_annealing, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(simulated_annealing, target_function, **kwargs)
@@ -13,23 +13,26 @@
 
 ############################################################################
 
-import math
-import random
-
 # Required Libraries
 import numpy as np
 # Function: Initialize Variables
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 def initial_position(
         target_function, solutions=5, min_values=(-5, -5), max_values=(5, 5)
 ):
     position = np.zeros((solutions, len(min_values) + 1))
-    for i in range(solutions):
-        for j in range(len(min_values)):
-            position[i, j] = random.uniform(min_values[j], max_values[j])
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    position[:, :-1] = engine.uniform(
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        size=(solutions, len(min_values)),
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -37,42 +40,26 @@ def initial_position(
 def update_position(
         target_function, position, destination, r1=2, min_values=(-5, -5), max_values=(5, 5)
 ):
-    for i in range(position.shape[0]):
-        for j in range(len(min_values)):
-            r2 = (
-                    2
-                    * math.pi
-                    * (rando())
-            )
-            r3 = 2 * (rando())
-            r4 = rando()
-            if r4 < 0.5:
-                position[i, j] = np.clip(
-                    (
-                            position[i, j]
-                            + (
-                                    r1
-                                    * math.sin(r2)
-                                    * abs(r3 * destination[j] - position[i, j])
-                            )
-                    ),
-                    min_values[j],
-                    max_values[j],
-                )
-            else:
-                position[i, j] = np.clip(
-                    (
-                            position[i, j]
-                            + (
-                                    r1
-                                    * math.cos(r2)
-                                    * abs(r3 * destination[j] - position[i, j])
-                            )
-                    ),
-                    min_values[j],
-                    max_values[j],
-                )
-        position[i, -1] = target_function(position[i, 0: position.shape[1] - 1])
+    """
+    Move every solution by r1 times the sine or the cosine, picked per variable by
+    r4, of a random angle r2 along its distance to the destination scaled by r3.
+    r2, r3 and r4 are drawn for the whole population at once.
+    """
+    variables = position[:, :-1]
+    r2, r3, r4 = engine.random((3,) + variables.shape)
+    r2 = 2 * np.pi * r2
+    r3 = 2 * r3
+    wave = np.where(r4 < 0.5, np.sin(r2), np.cos(r2))
+    variables += r1 * wave * np.abs(r3 * destination[:-1] - variables)
+    np.clip(
+        variables,
+        np.asarray(min_values, dtype=float),
+        np.asarray(max_values, dtype=float),
+        out=variables,
+    )
+    evaluate(
+        target_function, position[:, 0: position.shape[1] - 1], out=position[:, -1]
+    )
     return position
 
 
@@ -84,6 +71,17 @@ def sine_cosine_algorithm(
         min_values=(-5, -5),
         max_values=(5, 5),
         iterations=50,
+        vectorized=False,
+        n_jobs=None,
+        executor=None,
+        initializer=None,
+        initargs=(),
+        chunksize=None,
+        concurrency=None,
+        cache=None,
+        callback=None,
+        stop=None,
+        seed=None,
 ):
     """
     :param target_function:
@@ -95,8 +93,33 @@ def sine_cosine_algorithm(
     :param min_values:
     :param max_values:
     :param iterations:
+    :param vectorized:
+    :param n_jobs:
+    :param executor:
+    :param initializer:
+    :param initargs:
+    :param chunksize:
+    :param concurrency:
+    :param cache:
+    :param callback:
+    :param stop:
+    :param seed:
     :return:
     """
+    if seed is not None:
+        engine.seed(seed)
+    target_function = as_evaluator(
+        target_function,
+        vectorized=vectorized,
+        n_jobs=n_jobs,
+        executor=executor,
+        initializer=initializer,
+        initargs=initargs,
+        chunksize=chunksize,
+        concurrency=concurrency,
+        cache=cache,
+    )
+    monitor = Monitor(target_function, callback, stop)
     count = 0
     position = initial_position(
         target_function=target_function,
@@ -104,9 +127,10 @@ def sine_cosine_algorithm(
         min_values=min_values,
         max_values=max_values,
     )
-    destination = np.copy(position[position[:, -1].argsort()][0, :])
+    destination = np.copy(position[np.argmin(position[:, -1]), :])
     while count <= iterations:
-        print("Iteration = ", count, " f(x) = ", destination[-1])
+        if monitor(count, destination[-1]):
+            break
         r1 = a_linear_component - count * (a_linear_component / iterations)
         position = update_position(
             target_function=target_function,
@@ -116,9 +140,19 @@ def sine_cosine_algorithm(
             min_values=min_values,
             max_values=max_values,
         )
-        value = np.copy(position[position[:, -1].argsort()][0, :])
+        value = position[np.argmin(position[:, -1]), :]
         if destination[-1] > value[-1]:
             destination = np.copy(value)
         count = count + 1
-    print(destination)
+    target_function.close()
+    monitor.close(count, destination[-1])
     return destination
+
+
+# Function: Asynchronous Entry Point
+async def sine_cosine_algorithm_async(target_function, **kwargs):
+    """
+    sine_cosine_algorithm, awaited without blocking the running event loop.
+    target_function may be an async def function.
+    """
+    return await run_async(sine_cosine_algorithm, target_function, **kwargs)
@@ -21,12 +21,10 @@ the bubble-net foraging behavior of humpback whales
 
 ############################################################################
 
-import math
-import os
-import random
-
 import numpy as np
-from pyMetaheuristic import rando
+from pyMetaheuristic import engine
+from pyMetaheuristic.evaluation import as_evaluator, evaluate, run_async
+from pyMetaheuristic.events import Monitor
 
 
 class WOA:
@@ -47,6 +45,17 @@ class WOA:
             min_values=(-5, -5),
             max_values=(5, 5),
             iterations=50,
+            vectorized=False,
+            n_jobs=None,
+            executor=None,
+            initializer=None,
+            initargs=(),
+            chunksize=None,
+            concurrency=None,
+            cache=None,
+            callback=None,
+            stop=None,
+            seed=None,
     ):
         """
 
@@ -60,8 +69,34 @@ class WOA:
         :param min_values:
         :param max_values:
         :param iterations:
+        :param vectorized:
+        :param n_jobs:
+        :param executor:
+        :param initializer:
+        :param initargs:
+        :param chunksize:
+        :param concurrency:
+        :param cache:
+        :param callback:
+        :param stop:
+        :param seed:
         """
-        self.target_function = target_function
+        if seed is not None:
+            engine.seed(seed)
+        self.target_function = as_evaluator(
+            target_function,
+            vectorized=vectorized,
+            n_jobs=n_jobs,
+            executor=executor,
+            initializer=initializer,
+            initargs=initargs,
+            chunksize=chunksize,
+            concurrency=concurrency,
+            cache=cache,
+        )
+        self.evaluations = self.target_function.evaluations
+        self.callback = callback
+        self.stop = stop
         self.hunting_party = hunting_party
         self.spiral_param = spiral_param
         self.min_values = min_values
@@ -71,19 +106,18 @@ class WOA:
         self.leader = np.zeros((1, self.dimension + 1))
         self.position = np.zeros((self.hunting_party, self.dimension + 1))
 
-        self.position = self.initial_position()
-        self.leader = self.initial_leader_position()
-
     def initial_position(self):
         """Initialize Variables"""
-        for i in range(self.hunting_party):
-            for j, _ in enumerate(self.min_values):
-                self.position[i, j] = random.uniform(
-                    self.min_values[j], self.max_values[j]
-                )
-            self.position[i, -1] = self.target_function(
-                self.position[i, 0: self.position.shape[1] - 1]
-            )
+        self.position[:, :-1] = engine.uniform(
+            np.asarray(self.min_values, dtype=float),
+            np.asarray(self.max_values, dtype=float),
+            size=(self.hunting_party, self.dimension),
+        )
+        evaluate(
+            self.target_function,
+            self.position[:, 0: self.position.shape[1] - 1],
+            out=self.position[:, -1],
+        )
         return self.position
 
     def initial_leader_position(self):
@@ -92,10 +126,11 @@ class WOA:
 
         :return:
         """
-        for j in range(self.dimension):
-            self.leader[0, j] = 0.0
-        self.leader[0, -1] = self.target_function(
-            self.leader[0, 0: self.leader.shape[1] - 1]
+        self.leader[0, :-1] = 0.0
+        evaluate(
+            self.target_function,
+            self.leader[:, 0: self.leader.shape[1] - 1],
+            out=self.leader[:, -1],
         )
         return self.leader
 
@@ -105,71 +140,55 @@ class WOA:
         :param position:
         :return:
         """
-        for i in range(position.shape[0]):
-            if self.leader[0, -1] > position[i, -1]:
-                for j in range(position.shape[1]):
-                    self.leader[0, j] = position[i, j]
+        best = np.argmin(position[:, -1])
+        if self.leader[0, -1] > position[best, -1]:
+            self.leader[0, :] = position[best, :]
         return self.leader
 
     def update_position(self, a_linear_component=2, b_linear_component=1):
         """
         Update Position
+
+        The whole hunting party moves at once. Each whale draws its own a, C and
+        p: with p < 0.5 it encircles the leader when abs(a) < 1 and searches
+        around random whales otherwise; with p >= 0.5 it spirals toward the
+        leader. The random whales and the spiral parameter are drawn per variable.
         :param a_linear_component:
         :param b_linear_component:
         :return:
         """
-        for i in range(self.position.shape[0]):
-            r1_leader = rando()
-            r2_leader = rando()
-            p_value = rando()
-
-            a_leader = 2 * a_linear_component * r1_leader - a_linear_component
-            c_leader = 2 * r2_leader
-
-            for j, _ in enumerate(self.min_values):
-                if p_value < 0.5:
-                    if abs(a_leader) >= 1:
-                        rand = int.from_bytes(os.urandom(8), byteorder="big") / (
-                                (1 << 64) - 1
-                        )
-                        rand_leader_index = math.floor(self.position.shape[0] * rand)
-                        x_rand = self.position[rand_leader_index, :]
-                        distance_x_rand = abs(
-                            c_leader * x_rand[j] - self.position[i, j]
-                        )
-                        self.position[i, j] = np.clip(
-                            x_rand[j] - a_leader * distance_x_rand,
-                            self.min_values[j],
-                            self.max_values[j],
-                        )
-                    elif abs(a_leader) < 1:
-                        distance_leader = abs(
-                            c_leader * self.leader[0, j] - self.position[i, j]
-                        )
-                        self.position[i, j] = np.clip(
-                            self.leader[0, j] - a_leader * distance_leader,
-                            self.min_values[j],
-                            self.max_values[j],
-                        )
-                elif p_value >= 0.5:
-                    distance_leader = abs(self.leader[0, j] - self.position[i, j])
-                    rand = int.from_bytes(os.urandom(8), byteorder="big") / (
-                            (1 << 64) - 1
-                    )
-                    m_param = (b_linear_component - 1) * rand + 1
-                    self.position[i, j] = np.clip(
-                        (
-                                distance_leader
-                                * math.exp(self.spiral_param * m_param)
-                                * math.cos(m_param * 2 * math.pi)
-                                + self.leader[0, j]
-                        ),
-                        self.min_values[j],
-                        self.max_values[j],
-                    )
-            self.position[i, -1] = self.target_function(
-                self.position[i, 0: self.position.shape[1] - 1]
-            )
+        variables = self.position[:, :-1]
+        shape = variables.shape
+        r1_leader = engine.random((shape[0], 1))
+        r2_leader = engine.random((shape[0], 1))
+        p_value = engine.random((shape[0], 1))
+        a_leader = 2 * a_linear_component * r1_leader - a_linear_component
+        c_leader = 2 * r2_leader
+
+        search = (p_value < 0.5) & (np.abs(a_leader) >= 1)
+        x_rand = variables[
+            engine.integers(shape[0], size=shape), np.arange(shape[1])
+        ]
+        target = np.where(search, x_rand, self.leader[0, :-1])
+        encircling = target - a_leader * np.abs(c_leader * target - variables)
+
+        m_param = (b_linear_component - 1) * engine.random(shape) + 1
+        spiral = (
+                np.abs(self.leader[0, :-1] - variables)
+                * np.exp(self.spiral_param * m_param)
+                * np.cos(m_param * 2 * np.pi)
+                + self.leader[0, :-1]
+        )
+        variables[:] = np.clip(
+            np.where(p_value < 0.5, encircling, spiral),
+            np.asarray(self.min_values, dtype=float),
+            np.asarray(self.max_values, dtype=float),
+        )
+        evaluate(
+            self.target_function,
+            self.position[:, 0: self.position.shape[1] - 1],
+            out=self.position[:, -1],
+        )
         return self.position
 
     def minimize(self):
@@ -177,16 +196,30 @@ class WOA:
         WOA minimizer
         :return:
         """
+        monitor = Monitor(
+            self.target_function, self.callback, self.stop, evaluations=self.evaluations
+        )
         count = 0
+        self.position = self.initial_position()
+        self.leader = self.initial_leader_position()
         while count <= self.iterations:
-            print("Iteration = ", count, " f(x) = ", self.leader[0, -1])
+            if monitor(count, self.leader[0, -1]):
+                break
             a_linear_component = 2 - count * (2 / self.iterations)
             b_linear_component = -1 + count * (-1 / self.iterations)
-            leader = self.update_leader(self.position)
+            self.update_leader(self.position)
             self.position = self.update_position(
                 a_linear_component=a_linear_component,
                 b_linear_component=b_linear_component,
             )
             count = count + 1
-        print(leader)
-        return leader
+        self.target_function.close()
+        monitor.close(count, self.leader[0, -1])
+        return self.leader
+
+    async def minimize_async(self):
+        """
+        minimize, awaited without blocking the running event loop
+        :return:
+        """
+        return await run_async(self.minimize)
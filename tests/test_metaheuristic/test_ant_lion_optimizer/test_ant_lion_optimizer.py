@@ -1,10 +1,12 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import ant_lion_optimizer
 from pyMetaheuristic.ant_lion_optimizer import alo
+from pyMetaheuristic.evaluation import Evaluator
 from pyMetaheuristic.objectives import easom
 
 
@@ -38,3 +40,36 @@ def test_ant_lion_optimizer(front):
         pytest.approx(math.pi, abs=0.1),
         pytest.approx(math.pi, abs=0.1),
     ]
+
+
+def test_random_walk():
+    walks = np.zeros((3, 4, 5))
+    trail = [walks[0].copy()]
+    positions = []
+    for _ in range(50):
+        positions.append(alo.random_walk(walks[0], walks[1], walks[2]))
+        trail.append(walks[0].copy())
+    assert (np.abs(np.diff(trail, axis=0)) == 1).all()
+    assert (walks[1] == np.min(trail, axis=0)).all()
+    assert (walks[2] == np.max(trail, axis=0)).all()
+    assert all(((0 <= p) & (p <= 1)).all() for p in positions)
+
+
+def test_exploration_ratio():
+    assert alo.exploration_ratio(5, 100) == 1
+    assert alo.exploration_ratio(20, 100) == pytest.approx(100 * 0.2)
+    assert alo.exploration_ratio(60, 100) == pytest.approx(1000 * 0.6)
+    assert alo.exploration_ratio(99, 100) == pytest.approx(10 ** 6 * 0.99)
+
+
+def test_update_ants_moves_whole_colony():
+    target_function = Evaluator(easom)
+    population = alo.initial_population(target_function, colony_size=20)
+    antlions = alo.initial_population(target_function, colony_size=20)
+    before = population.copy()
+
+    population, _ = alo.update_ants(target_function, population, antlions, 1, 10)
+
+    assert (population[:, :-1] != before[:, :-1]).any(axis=1).all()
+    assert population[:, -1] == pytest.approx([easom(row) for row in population[:, :-1]])
+    assert target_function.evaluations == 60
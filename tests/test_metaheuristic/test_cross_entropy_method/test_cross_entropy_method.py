@@ -1,11 +1,12 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import cross_entropy_method
 from pyMetaheuristic.cross_entropy_method import cem
-from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.objectives import easom, random_rotation
 
 
 def test_smoke():
@@ -39,3 +40,55 @@ def test_cross_entropy_method(front):
         pytest.approx(math.pi, abs=0.05),
         pytest.approx(math.pi, abs=0.05),
     ]
+
+
+@pytest.mark.parametrize("covariance", cem.COVARIANCES)
+def test_cross_entropy_method_covariance(covariance):
+    cem_search = cem.cross_entropy_method(
+        target_function=easom,
+        n=50,
+        iterations=100,
+        k_samples=15,
+        covariance=covariance,
+        rank=1,
+        callback=False,
+        seed=0,
+    )
+    assert cem_search[-1] == pytest.approx(-1.0, abs=0.05)
+
+
+def test_full_covariance_learns_correlation():
+    rotation = random_rotation(10, seed=1)
+    scale = np.logspace(0, 2, 10)
+
+    def ellipsoid(candidates):
+        return np.sum((candidates @ rotation.T * scale) ** 2, axis=1)
+
+    results = {
+        covariance: cem.cross_entropy_method(
+            target_function=ellipsoid,
+            n=100,
+            min_values=[-5] * 10,
+            max_values=[5] * 10,
+            iterations=150,
+            k_samples=30,
+            covariance=covariance,
+            vectorized=True,
+            callback=False,
+            seed=0,
+        )[-1]
+        for covariance in ("diagonal", "full")
+    }
+    assert results["full"] < 0.1 * results["diagonal"]
+
+
+def test_low_rank_keeps_the_diagonal():
+    columns = np.random.default_rng(0).standard_normal((6, 9))
+    factor, dropped = cem.low_rank(columns, 2)
+    assert factor.shape == (6, 2)
+    assert np.diag(factor @ factor.T) + dropped == pytest.approx(np.sum(columns ** 2, axis=1))
+
+
+def test_elite_rows():
+    guess = np.array([[0.0, 5.0], [0.0, 1.0], [0.0, 3.0], [0.0, 2.0]])
+    assert sorted(cem.elite_rows(guess, 2)) == [1, 3]
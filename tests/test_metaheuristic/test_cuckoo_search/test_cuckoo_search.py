@@ -1,10 +1,12 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import cuckoo_search
 from pyMetaheuristic.cuckoo_search import cuckoo_s
+from pyMetaheuristic.evaluation import Evaluator
 from pyMetaheuristic.objectives import easom
 
 
@@ -41,3 +43,26 @@ def test_cuckoo_search(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_levy_flight_is_heavy_tailed():
+    pyMetaheuristic.seed(0)
+    steps = cuckoo_s.levy_flight(1.5, 100000)
+    assert steps.shape == (100000,)
+    assert np.median(np.abs(steps)) == pytest.approx(0.63, abs=0.05)
+    assert np.abs(steps).max() > 100
+    assert isinstance(float(cuckoo_s.levy_flight(1.5)), float)
+
+
+def test_generation_keeps_improvements_only():
+    target_function = Evaluator(easom)
+    position = cuckoo_s.initial_position(target_function, birds=200)
+    before = position.copy()
+
+    position = cuckoo_s.replace_bird(target_function, position)
+    position = cuckoo_s.update_positions(target_function, position, discovery_rate=0.5)
+
+    assert (position[:, -1] <= before[:, -1]).all()
+    assert (position[:, -1] < before[:, -1]).any()
+    assert position[:, -1] == pytest.approx([easom(row) for row in position[:, :-1]])
+    assert 200 + 200 < target_function.evaluations <= 200 + 2 * 200
@@ -1,6 +1,7 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import differential_evolution
@@ -41,3 +42,62 @@ def test_differential_evolution(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+@pytest.mark.parametrize("replacement", de.REPLACEMENTS)
+@pytest.mark.parametrize("crossover", de.CROSSOVERS)
+@pytest.mark.parametrize("strategy", de.STRATEGIES)
+def test_differential_evolution_schemes(strategy, crossover, replacement):
+    de_search = de.differential_evolution(
+        target_function=easom,
+        n=60,
+        iterations=60,
+        f=0.5,
+        cr=0.5,
+        strategy=strategy,
+        crossover=crossover,
+        replacement=replacement,
+        callback=False,
+        seed=0,
+    )
+    assert de_search[-1] == pytest.approx(-1.0, abs=0.05)
+
+
+def test_donors_are_distinct():
+    pyMetaheuristic.seed(0)
+    ix = de.donors(6, 5)
+    assert (np.sort(np.column_stack([np.arange(6), ix]), axis=1) == np.arange(6)).all()
+
+
+@pytest.mark.parametrize("crossover", de.CROSSOVERS)
+def test_crossover_mask(crossover):
+    pyMetaheuristic.seed(1)
+    mask = de.crossover_mask(20000, 10, cr=0.5, crossover=crossover)
+    assert mask.any(axis=1).all()
+    if crossover == "bin":
+        assert mask.mean() == pytest.approx(0.1 + 0.9 * 0.5, abs=0.01)
+    else:
+        # one run of consecutive genes, possibly wrapping around
+        assert ((np.diff(mask, axis=1, append=mask[:, :1]) != 0).sum(axis=1) <= 2).all()
+        assert mask.sum(axis=1).mean() == pytest.approx(2.0, abs=0.05)
+
+
+def test_differential_evolution_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        de.differential_evolution(target_function=easom, strategy="best/3")
+    with pytest.raises(ValueError):
+        de.differential_evolution(target_function=easom, n=5, strategy="rand/2")
+
+
+def test_velocity_is_a_deprecated_trial():
+    pyMetaheuristic.seed(15)
+    position = de.initial_position(easom, n=5)
+    best_global = np.copy(position[np.argmin(position[:, -1])])
+    with pytest.warns(DeprecationWarning):
+        v = de.velocity(easom, position, best_global, k0=3, k1=0, k2=4, f=0.5, cr=1.0)
+    expected = np.clip(best_global[:-1] + 0.5 * (position[0, :-1] - position[4, :-1]), -5, 5)
+    assert v[:-1] == pytest.approx(expected)
+    assert v[-1] == pytest.approx(easom(v[:-1]))
+    with pytest.warns(DeprecationWarning):
+        v = de.velocity(easom, position, best_global, k0=3, cr=0.0)
+    assert v[:-1] == pytest.approx(position[3, :-1])
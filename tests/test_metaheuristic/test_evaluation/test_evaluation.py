@@ -0,0 +1,298 @@
+import asyncio
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from pyMetaheuristic.artificial_bee_colony_optimization import abco
+from pyMetaheuristic.evaluation import (
+    AsyncEvaluator, Evaluator, FitnessCache, as_evaluator, evaluate
+)
+from pyMetaheuristic.genetic_algorithm import ga
+from pyMetaheuristic.memetic_algorithm import memetic_a
+from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.particle_swarm_optimization import pso
+from pyMetaheuristic.whale_optimization_algorithm import whale_optimization_a
+
+
+def easom_batch(candidates):
+    """Easom Function evaluated on every row of an (n, 2) matrix"""
+    return (
+            -np.cos(candidates[:, 0]) * np.cos(candidates[:, 1]) *
+            np.exp(-((candidates[:, 0] - math.pi) ** 2) - (candidates[:, 1] - math.pi) ** 2))
+
+
+OFFSET = 0.0
+
+
+def set_offset(offset):
+    """Worker initializer"""
+    global OFFSET
+    OFFSET = offset
+
+
+def offset_easom(variables_values):
+    return easom(variables_values) + OFFSET
+
+
+def test_row_and_batch_protocols_agree():
+    candidates = np.array([[0.0, 0.0], [math.pi, math.pi], [1.0, -2.0]])
+    by_row = evaluate(easom, candidates)
+    by_batch = Evaluator(easom_batch, vectorized=True).evaluate(candidates)
+    assert by_row.shape == (3,)
+    assert by_row == pytest.approx(by_batch)
+
+
+def test_evaluator_is_callable_with_one_candidate():
+    evaluator = Evaluator(easom_batch, vectorized=True)
+    assert evaluator([math.pi, math.pi]) == pytest.approx(-1.0)
+    assert as_evaluator(evaluator) is evaluator
+
+
+def test_vectorized_shape_mismatch_raises():
+    evaluator = Evaluator(lambda candidates: np.zeros(1), vectorized=True)
+    with pytest.raises(ValueError):
+        evaluator.evaluate(np.zeros((3, 2)))
+
+
+def test_vectorized_objective_is_called_once_per_batch():
+    calls = []
+
+    def counting_easom(candidates):
+        calls.append(candidates.shape)
+        return easom_batch(candidates)
+
+    pso.particle_swarm_optimization(
+        target_function=counting_easom,
+        swarm_size=20,
+        iterations=5,
+        vectorized=True,
+        seed=3,
+    )
+    assert calls == [(20, 2)] * 7
+
+
+@pytest.mark.parametrize(
+    "run",
+    [
+        lambda f, v: ga.genetic_algorithm(
+            target_function=f, population_size=20, elite=1, generations=10, vectorized=v, seed=7
+        ),
+        lambda f, v: whale_optimization_a.WOA(
+            target_function=f, hunting_party=20, iterations=10, vectorized=v, seed=7
+        ).minimize()[0],
+    ],
+)
+def test_vectorized_run_matches_row_by_row_run(run):
+    assert run(easom, False) == pytest.approx(run(easom_batch, True))
+
+
+def test_process_pool_runs_initializer_and_keeps_order():
+    candidates = np.random.default_rng(0).uniform(-5, 5, (25, 2))
+    evaluator = Evaluator(offset_easom, n_jobs=2, initializer=set_offset, initargs=(10.0,), chunksize=3)
+    try:
+        fitness = evaluator.evaluate(candidates)
+    finally:
+        evaluator.close()
+    assert fitness == pytest.approx(evaluate(easom, candidates) + 10.0)
+
+
+def test_process_pool_splits_vectorized_batches():
+    candidates = np.random.default_rng(1).uniform(-5, 5, (9, 2))
+    evaluator = Evaluator(easom_batch, vectorized=True, n_jobs=2)
+    try:
+        fitness = evaluator.evaluate(candidates)
+    finally:
+        evaluator.close()
+    assert fitness == pytest.approx(easom_batch(candidates))
+
+
+def test_parallel_run_matches_serial_run():
+    def run(**options):
+        return ga.genetic_algorithm(
+            target_function=easom, population_size=20, elite=1, generations=5, seed=11, **options
+        )
+
+    assert run(n_jobs=2) == pytest.approx(run())
+
+
+@pytest.mark.parametrize(
+    "run",
+    [
+        lambda f, **options: pso.particle_swarm_optimization(
+            target_function=f, swarm_size=12, iterations=5, seed=12, **options
+        ),
+        lambda f, **options: whale_optimization_a.WOA(
+            target_function=f, hunting_party=12, iterations=5, seed=12, **options
+        ).minimize()[0],
+    ],
+)
+def test_entry_point_forwards_worker_initializer(run):
+    best = run(offset_easom, n_jobs=2, initializer=set_offset, initargs=(10.0,), chunksize=5)
+    serial = run(easom)
+    assert best[:-1] == pytest.approx(serial[:-1])
+    assert best[-1] == pytest.approx(serial[-1] + 10.0)
+
+
+def test_caller_executor_is_left_running():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pso.particle_swarm_optimization(
+            target_function=easom, swarm_size=10, iterations=3, executor=executor, seed=5
+        )
+        assert executor.submit(easom, [math.pi, math.pi]).result() == pytest.approx(-1.0)
+
+
+def test_thread_pool_writes_fitness_into_population():
+    population = np.random.default_rng(2).uniform(-5, 5, (30, 3))
+    evaluator = Evaluator(easom, n_jobs=3, executor="thread", chunksize=4)
+    try:
+        result = evaluator.evaluate(population[:, 0:2], out=population[:, -1])
+        assert isinstance(evaluator.pool(), ThreadPoolExecutor)
+    finally:
+        evaluator.close()
+    assert np.shares_memory(result, population)
+    assert population[:, -1] == pytest.approx(evaluate(easom, population[:, 0:2]))
+
+
+def test_unknown_executor_name_raises():
+    with pytest.raises(ValueError):
+        Evaluator(easom, n_jobs=2, executor="fiber").evaluate(np.zeros((3, 2)))
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_thread_run_matches_serial_run(vectorized):
+    def run(**options):
+        return ga.genetic_algorithm(
+            target_function=easom_batch if vectorized else easom,
+            population_size=20,
+            elite=1,
+            generations=5,
+            vectorized=vectorized,
+            seed=13,
+            **options,
+        )
+
+    assert run(n_jobs=2, executor="thread") == pytest.approx(run())
+
+
+async def sleepy_easom(variables_values):
+    await asyncio.sleep(0)
+    return easom(variables_values)
+
+
+def test_async_objective_gets_async_evaluator():
+    evaluator = as_evaluator(sleepy_easom, concurrency=2)
+    assert isinstance(evaluator, AsyncEvaluator)
+    candidates = np.random.default_rng(3).uniform(-5, 5, (7, 2))
+    assert evaluator.evaluate(candidates) == pytest.approx(evaluate(easom, candidates))
+
+
+def test_async_run_against_local_server():
+    async def main():
+        in_flight, peak = 0, 0
+
+        async def handle(reader, writer):
+            nonlocal in_flight, peak
+            in_flight = in_flight + 1
+            peak = max(peak, in_flight)
+            x, y = map(float, (await reader.readline()).split())
+            await asyncio.sleep(0.001)
+            in_flight = in_flight - 1
+            writer.write(f"{easom([x, y])!r}\n".encode())
+            await writer.drain()
+            writer.close()
+
+        async def remote_easom(variables_values):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(" ".join(repr(float(x)) for x in variables_values).encode() + b"\n")
+            fitness = float(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+            return fitness
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            best = await pso.particle_swarm_optimization_async(
+                remote_easom, swarm_size=12, iterations=4, concurrency=4, seed=3
+            )
+        return best, peak
+
+    best, peak = asyncio.run(main())
+    serial = pso.particle_swarm_optimization(easom, swarm_size=12, iterations=4, seed=3)
+    assert best == pytest.approx(serial)
+    assert 1 < peak <= 4
+
+
+@pytest.mark.parametrize(
+    "optimizer",
+    [
+        lambda f: whale_optimization_a.WOA(
+            target_function=f, hunting_party=10, iterations=5, seed=9
+        ),
+        lambda f: abco.ArtificialBeeColony(
+            target_function=f, food_sources=10, iterations=5, seed=9
+        ),
+        lambda f: memetic_a.Memetic(
+            target_function=f, population_size=10, generations=5, seed=9
+        ),
+    ],
+)
+def test_class_minimize_async_matches_minimize(optimizer):
+    async def main():
+        return await optimizer(sleepy_easom).minimize_async()
+
+    best = asyncio.run(main())
+    assert np.ravel(best) == pytest.approx(np.ravel(optimizer(easom).minimize()))
+
+
+def counting(calls):
+    def counted_easom(variables_values):
+        calls.append(tuple(variables_values))
+        return easom(variables_values)
+
+    return counted_easom
+
+
+def test_cache_evaluates_each_distinct_candidate_once():
+    calls = []
+    evaluator = Evaluator(counting(calls), cache=True)
+    candidates = np.array([[0.0, 1.0], [2.0, 3.0], [0.0, 1.0], [-0.0, 1.0]])
+    assert evaluator.evaluate(candidates) == pytest.approx(evaluate(easom, candidates))
+    assert evaluator.evaluate(candidates[1:2]) == pytest.approx([easom([2.0, 3.0])])
+    assert len(calls) == 2
+    assert (evaluator.cache.hits, evaluator.cache.misses) == (3, 2)
+
+
+def test_cache_quantizes_to_tolerance():
+    calls = []
+    evaluator = Evaluator(counting(calls), cache=FitnessCache(tolerance=1e-3))
+    evaluator.evaluate(np.array([[1.0, 2.0], [1.0001, 2.0002], [1.01, 2.0]]))
+    assert len(calls) == 2
+
+
+def test_cache_evicts_least_recently_used_entries():
+    entry_size = sys.getsizeof(FitnessCache().key([0, 0])) + FitnessCache.entry_overhead
+    cache = FitnessCache(max_bytes=3 * entry_size)
+    for i in range(3):
+        cache.put(cache.key([i, i]), i)
+    cache.get(cache.key([0, 0]))
+    cache.put(cache.key([3, 3]), 3)
+    assert len(cache) == 3
+    assert cache.evictions == 1
+    assert cache.get(cache.key([1, 1])) is None
+    assert cache.get(cache.key([0, 0])) == 0
+    assert cache.nbytes == 3 * entry_size
+
+
+def test_cached_run_matches_uncached_run():
+    calls = []
+    cache = FitnessCache()
+    run = dict(
+        population_size=10, elite=2, generations=10, min_values=(0, 0), max_values=(1, 1), seed=21
+    )
+    best = ga.genetic_algorithm(target_function=counting(calls), cache=cache, **run)
+    assert best == pytest.approx(ga.genetic_algorithm(target_function=easom, **run))
+    assert len(calls) == cache.misses
+    assert cache.hits > 0
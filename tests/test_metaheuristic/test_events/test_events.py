@@ -0,0 +1,127 @@
+import importlib
+import io
+import time
+
+import pytest
+from pyMetaheuristic.events import IterationEvent, Monitor, Reporter, StoppingCriteria
+from pyMetaheuristic.genetic_algorithm import ga
+from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.simulated_anealling import sa
+
+
+def test_callback_receives_iteration_events():
+    events = []
+    best = ga.genetic_algorithm(
+        target_function=easom, population_size=10, generations=4, callback=events.append, seed=1
+    )
+    assert [event.iteration for event in events] == [0, 1, 2, 3, 4, 5]
+    assert [event.final for event in events] == [False] * 5 + [True]
+    assert events[-1].best_fitness == pytest.approx(best[-1])
+    assert events[-1].evaluations == 10 + 5 * 10
+    assert all(a.elapsed <= b.elapsed for a, b in zip(events, events[1:]))
+
+
+def test_silent_run_prints_nothing(capsys):
+    sa.simulated_annealing(
+        target_function=easom,
+        temperature_iterations=50,
+        final_temperature=0.01,
+        callback=False,
+        seed=2,
+    )
+    assert capsys.readouterr().out == ""
+
+
+def test_silent_monitor_builds_no_events():
+    monitor = Monitor(None, callback="silent")
+    assert monitor.callback is None
+    monitor(0, object())
+    monitor.close(1, object())
+
+
+def test_reporter_is_rate_limited():
+    stream = io.StringIO()
+    reporter = Reporter(interval=1.0, stream=stream)
+    for i, elapsed in enumerate([0.0, 0.2, 0.9, 1.1, 1.5, 2.3]):
+        reporter(IterationEvent(i, -float(i), 10 * i, elapsed))
+    reporter(IterationEvent(6, -6.0, 60, 2.4, final=True))
+    lines = stream.getvalue().splitlines()
+    assert [line.split()[2] for line in lines] == ["0", "3", "5", "6"]
+
+
+ENTRY_POINTS = [
+    ("adaptive_random_search", "ars", "adaptive_random_search"),
+    ("ant_lion_optimizer", "alo", "ant_lion_optimizer"),
+    ("artificial_bee_colony_optimization", "abco", "ArtificialBeeColony"),
+    ("bat_algorithm", "bat_a", "bat_algorithm"),
+    ("cross_entropy_method", "cem", "cross_entropy_method"),
+    ("cuckoo_search", "cuckoo_s", "cuckoo_search"),
+    ("differential_evolution", "de", "differential_evolution"),
+    ("dispersive_flies_optimization", "dfo", "dispersive_fly_optimization"),
+    ("firefly_algorithm", "firefly_a", "firefly_algorithm"),
+    ("flower_pollination_algorithm", "fpa", "flower_pollination_algorithm"),
+    ("genetic_algorithm", "ga", "genetic_algorithm"),
+    ("grey_wolf_optimizer", "gwo", "grey_wolf_optimizer"),
+    ("memetic_algorithm", "memetic_a", "Memetic"),
+    ("moth_flame_optimization", "mfa", "moth_flame_algorithm"),
+    ("multiverse_optimizer", "mvo", "muti_verse_optimizer"),
+    ("particle_swarm_optimization", "pso", "particle_swarm_optimization"),
+    ("random_search", "random_s", "random_search"),
+    ("salp_swarm_algorithm", "ssa", "salp_swarm_algorithm"),
+    ("simulated_anealling", "sa", "simulated_annealing"),
+    ("sine_cosine_algorithm", "sine_cosine_a", "sine_cosine_algorithm"),
+    ("whale_optimization_algorithm", "whale_optimization_a", "WOA"),
+]
+
+
+def run_entry_point(package, module, name, **kwargs):
+    entry = getattr(importlib.import_module(f"pyMetaheuristic.{package}.{module}"), name)
+    if isinstance(entry, type):
+        return entry(target_function=easom, **kwargs).minimize()
+    return entry(target_function=easom, **kwargs)
+
+
+@pytest.mark.parametrize("package, module, name", ENTRY_POINTS)
+def test_every_optimizer_stops_on_evaluation_budget(package, module, name):
+    events = []
+    stop = StoppingCriteria(max_evaluations=1)
+    run_entry_point(package, module, name, callback=events.append, stop=stop, seed=4)
+    assert stop.reason == "max_evaluations"
+    assert [(event.iteration, event.final, event.reason) for event in events] == [
+        (0, True, "max_evaluations")
+    ]
+
+
+def test_patience_stops_a_plateau():
+    events = []
+    stop = StoppingCriteria(patience=3)
+    sa.simulated_annealing(
+        target_function=lambda variables_values: 1.0,
+        callback=events.append,
+        stop=stop,
+        seed=3,
+    )
+    assert stop.reason == "patience"
+    assert events[-1].iteration == 3
+
+
+def test_target_fitness_and_iterations_reasons():
+    stop = StoppingCriteria(target_fitness=-0.99)
+    best = ga.genetic_algorithm(
+        target_function=easom, population_size=20, generations=500, callback=False, stop=stop, seed=6
+    )
+    assert stop.reason == "target_fitness"
+    assert best[-1] <= -0.99
+    stop = StoppingCriteria(max_time=3600)
+    ga.genetic_algorithm(target_function=easom, generations=3, callback=False, stop=stop, seed=6)
+    assert stop.reason == "iterations"
+
+
+def test_deadline_stops_the_run():
+    stop = StoppingCriteria(max_time=0.05)
+    start = time.perf_counter()
+    sa.simulated_annealing(
+        target_function=easom, final_temperature=1e-300, callback=False, stop=stop, seed=8
+    )
+    assert stop.reason == "max_time"
+    assert time.perf_counter() - start < 1.0
@@ -1,9 +1,11 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import firefly_algorithm
+from pyMetaheuristic.evaluation import Evaluator
 from pyMetaheuristic.firefly_algorithm import firefly_a
 from pyMetaheuristic.objectives import easom
 
@@ -42,3 +44,40 @@ def test_firefly_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+@pytest.mark.parametrize("neighbors", [None, 10])
+def test_firefly_algorithm_synchronous(neighbors):
+    fa = firefly_a.firefly_algorithm(
+        target_function=easom,
+        swarm_size=50,
+        min_values=[-5, -5],
+        max_values=[5, 5],
+        generations=100,
+        synchronous=True,
+        neighbors=neighbors,
+        callback=False,
+        seed=0,
+    )
+
+    assert fa[-1] == pytest.approx(-1.0, abs=0.05)
+    assert list(fa[:-1]) == [
+        pytest.approx(math.pi, abs=0.5),
+        pytest.approx(math.pi, abs=0.5),
+    ]
+
+
+def test_update_swarm_moves_toward_brighter():
+    position = np.array([[0.0, 0.0, 1.0], [1.0, 1.0, 0.0], [0.5, 0.0, 2.0]])
+    target_function = Evaluator(lambda x: float(sum(x)))
+
+    position = firefly_a.update_swarm(
+        target_function, position.copy(), alpha_0=0, beta_0=1, gama=0
+    )
+
+    # the brightest stays; the others move to the convex hull of the brighter ones
+    assert position[1].tolist() == [1.0, 1.0, 0.0]
+    assert position[0, :2].tolist() == [1.0, 1.0]
+    assert position[2, :2] == pytest.approx([0.5, 0.5])
+    assert position[[0, 2], -1] == pytest.approx([2.0, 1.0])
+    assert target_function.evaluations == 2
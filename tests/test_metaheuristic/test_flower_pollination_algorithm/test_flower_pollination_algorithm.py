@@ -1,6 +1,7 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import flower_pollination_algorithm
@@ -41,3 +42,33 @@ def test_fpa(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_pollination_evaluates_generation_in_one_batch():
+    batches = []
+
+    def batch_easom(variables):
+        batches.append(len(variables))
+        return np.array([easom(row) for row in variables])
+
+    fpa.flower_pollination_algorithm(
+        target_function=batch_easom,
+        flowers=30,
+        iterations=4,
+        vectorized=True,
+        callback=False,
+        seed=13,
+    )
+    assert batches == [30] * 6
+
+
+def test_pollination_replaces_only_improved_flowers():
+    pyMetaheuristic.seed(14)
+    position = fpa.initial_position(easom, flowers=40)
+    previous = np.copy(position)
+    best_global = np.copy(position[np.argmin(position[:, -1])])
+    position = fpa.pollination(easom, position, best_global, p=0.5)
+    assert (position[:, -1] <= previous[:, -1]).all()
+    assert list(position[:, -1]) == [easom(row) for row in position[:, :-1]]
+    kept = (position == previous).all(axis=1)
+    assert 0 < kept.sum() < 40
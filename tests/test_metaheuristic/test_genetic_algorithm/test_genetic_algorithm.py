@@ -1,11 +1,13 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import genetic_algorithm
+from pyMetaheuristic.evaluation import Evaluator
 from pyMetaheuristic.genetic_algorithm import ga
-from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.objectives import easom, sphere
 
 
 def test_smoke():
@@ -44,3 +46,29 @@ def test_genetic_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_generation_is_evaluated_once():
+    """crossover and mutation build the generation, then it is evaluated in one batch"""
+    target_function = Evaluator(sphere, vectorized=True)
+    population = ga.initial_population(
+        target_function, population_size=40, min_values=[-1] * 8, max_values=[1] * 8
+    )
+    fitness = ga.fitness_function(population)
+    offspring = ga.breeding(
+        population, fitness, min_values=[-1] * 8, max_values=[1] * 8, elite=2
+    )
+    assert offspring[:2].tolist() == population[population[:, -1].argsort()][:2].tolist()
+
+    offspring = ga.mutation(
+        target_function,
+        offspring,
+        mutation_rate=0.5,
+        min_values=[-1] * 8,
+        max_values=[1] * 8,
+        elite=2,
+    )
+
+    assert (np.abs(offspring[:, :-1]) <= 1).all()
+    assert offspring[:, -1] == pytest.approx(sphere(offspring[:, :-1]))
+    assert 40 + 38 <= target_function.evaluations <= 40 + 40
@@ -1,6 +1,7 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import grey_wolf_optimizer
@@ -39,3 +40,71 @@ def test_grey_wolf_optimizer(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_update_pack_ranks_leaders():
+    position = np.array([[0.0, 4.0], [1.0, -2.0], [2.0, 3.0], [3.0, 0.5], [4.0, 1.0]])
+    alpha, beta, delta = gwo.update_pack(position)
+    assert [alpha[0, -1], beta[0, -1], delta[0, -1]] == [-2.0, 0.5, 1.0]
+    assert alpha.shape == (1, 2)
+
+    moved = position + [[0.0, 10.0]]
+    moved[2, -1] = 0.0
+    alpha, beta, delta = gwo.update_pack(moved, alpha, beta, delta)
+    assert [alpha[0, -1], beta[0, -1], delta[0, -1]] == [-2.0, 0.0, 0.5]
+
+    alpha, beta, delta = gwo.update_pack(position[:2])
+    assert [alpha[0, -1], beta[0, -1], delta[0, -1]] == [-2.0, 4.0, 4.0]
+
+
+def test_grey_wolf_optimizer_evaluates_pack_in_batches():
+    evaluations = []
+
+    def batch_easom(variables):
+        evaluations.append(len(variables))
+        return np.array([easom(row) for row in variables])
+
+    gwo.grey_wolf_optimizer(
+        target_function=batch_easom,
+        pack_size=20,
+        iterations=10,
+        vectorized=True,
+        callback=False,
+        seed=5,
+    )
+    assert evaluations == [20] * 12
+
+
+def test_first_update_uses_three_distinct_leaders(monkeypatch):
+    leaders = []
+    update_position = gwo.update_position
+
+    def record(**kwargs):
+        leaders.append([np.copy(kwargs[name]) for name in ("alpha", "beta", "delta")])
+        return update_position(**kwargs)
+
+    monkeypatch.setattr(gwo, "update_position", record)
+    pyMetaheuristic.seed(1)
+    pack = gwo.initial_position(lambda x: float(np.sum(np.square(x))), pack_size=6)
+    gwo.grey_wolf_optimizer(
+        target_function=lambda x: float(np.sum(np.square(x))),
+        pack_size=6,
+        iterations=3,
+        callback=False,
+        seed=1,
+    )
+    fitness = [leader[0, -1] for leader in leaders[0]]
+    assert fitness == list(np.sort(pack[:, -1])[:3])
+    for alpha, beta, delta in leaders:
+        rows = {tuple(alpha[0]), tuple(beta[0]), tuple(delta[0])}
+        assert len(rows) == 3
+
+
+@pytest.mark.parametrize("name", ["alpha_position", "beta_position", "delta_position"])
+def test_leader_positions_are_deprecated(name):
+    with pytest.warns(DeprecationWarning) as record:
+        leader = getattr(gwo, name)(target_function=easom, dimension=3)
+    assert record[0].filename == __file__
+    assert leader.shape == (1, 4)
+    assert (leader[0, :-1] == 0).all()
+    assert leader[0, -1] == easom([0, 0, 0])
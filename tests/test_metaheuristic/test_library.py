@@ -1,7 +1,25 @@
-from pyMetaheuristic import rando
+from pyMetaheuristic import RandomEngine, rando, seed
 
 
 def test_rando():
     x = rando()
     assert x < 1
     assert x > 0
+
+
+def test_seed_makes_draws_reproducible():
+    seed(42)
+    first = [rando() for _ in range(10)]
+    seed(42)
+    second = [rando() for _ in range(10)]
+    assert first == second
+
+
+def test_random_engine_refills_blocks():
+    engine = RandomEngine(seed=0, block_size=3)
+    uniforms = [engine.uniform(-1, 1) for _ in range(10)]
+    normals = [engine.normal(0, 1) for _ in range(10)]
+    integers = [engine.integers(5) for _ in range(10)]
+    assert all(-1 <= u < 1 for u in uniforms)
+    assert len(set(normals)) == 10
+    assert all(0 <= k < 5 for k in integers)
@@ -1,9 +1,10 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
-from pyMetaheuristic import moth_flame_optimization
+from pyMetaheuristic import moth_flame_optimization, seed
 from pyMetaheuristic.moth_flame_optimization import mfa
 from pyMetaheuristic.objectives import easom
 
@@ -40,3 +41,27 @@ def test_moth_flame_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_update_flames_keeps_best_rows():
+    flames = np.array([[0.0, 1.0], [1.0, 5.0], [2.0, 3.0], [3.0, 8.0]])
+    position = np.array([[4.0, 2.0], [5.0, 9.0], [6.0, 0.0], [7.0, 4.0]])
+    flames = mfa.update_flames(flames, position)
+    assert sorted(flames[:, -1]) == [0.0, 1.0, 2.0, 3.0]
+    assert sorted(flames[:, 0]) == [0.0, 2.0, 4.0, 6.0]
+
+
+def test_update_position_spirals_toward_active_flames():
+    seed(9)
+    flames = mfa.initial_moths(easom, swarm_size=30)
+    position = np.copy(flames)
+    position = mfa.update_position(
+        easom, position, flames, flame_number=5, b_constant=-1000, a_linear_component=1
+    )
+    active = np.sort(flames[:, -1])[:5]
+    assert ((position[:, :-1] >= -5) & (position[:, :-1] <= 5)).all()
+    # a vanishing spiral lands every moth on its flame
+    landed = [flames[(flames[:, :-1] == row[:-1]).all(axis=1), -1][0] for row in position]
+    assert sorted(landed[:5]) == list(active)
+    assert landed[5:] == [active[-1]] * 25
+    assert list(position[:, -1]) == [easom(row) for row in position[:, :-1]]
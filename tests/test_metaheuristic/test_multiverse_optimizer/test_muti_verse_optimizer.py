@@ -1,11 +1,13 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
-from pyMetaheuristic import multiverse_optimizer
+from pyMetaheuristic import multiverse_optimizer, seed
 from pyMetaheuristic.multiverse_optimizer import mvo
 from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.selection import fitness_function
 
 
 def test_smoke():
@@ -39,3 +41,23 @@ def test_muti_verse_optimizer(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_big_bang_white_holes_and_wormholes():
+    seed(10)
+    cosmos = mvo.initial_universes(easom, universes=20, min_values=[-5] * 3, max_values=[5] * 3)
+    previous = np.copy(cosmos)
+    fitness = fitness_function(cosmos)
+    fitness[:, 1] = 1
+    best_universe = np.copy(cosmos[np.argmin(cosmos[:, -1])])
+    cosmos = mvo.big_bang(
+        easom, cosmos, fitness, best_universe, 0, 0.5, min_values=[-5] * 3, max_values=[5] * 3
+    )
+    for j in range(3):
+        assert set(cosmos[:, j]) <= set(previous[:, j])
+    assert list(cosmos[:, -1]) == [easom(row) for row in cosmos[:, :-1]]
+
+    cosmos = mvo.big_bang(
+        easom, cosmos, fitness, best_universe, 1, 0, min_values=[-5] * 3, max_values=[5] * 3
+    )
+    assert (cosmos[:, :-1] == best_universe[:-1]).all()
@@ -0,0 +1,78 @@
+import pickle
+
+import numpy as np
+import pytest
+from pyMetaheuristic import objectives
+from pyMetaheuristic.evaluation import Evaluator
+from pyMetaheuristic.particle_swarm_optimization import pso
+
+
+@pytest.mark.parametrize("name", sorted(objectives.DOMAINS))
+@pytest.mark.parametrize("dimension", [2, 10, 1000])
+def test_global_minimum(name, dimension):
+    function = getattr(objectives, name)
+    _, minimum = objectives.DOMAINS[name]
+    optimum = np.full(dimension, objectives.MINIMIZERS[name])
+    assert function(optimum) == pytest.approx(minimum * dimension, abs=1e-6 * dimension)
+    nearby = optimum + np.random.default_rng(0).uniform(-0.1, 0.1, (5, dimension))
+    assert np.all(function(nearby) > minimum * dimension)
+
+
+@pytest.mark.parametrize("name", sorted(objectives.DOMAINS))
+def test_batch_matches_rows(name):
+    function = getattr(objectives, name)
+    (low, high), _ = objectives.DOMAINS[name]
+    candidates = np.random.default_rng(1).uniform(low, high, (6, 7))
+    fitness = function(candidates)
+    assert fitness.shape == (6,)
+    assert fitness == pytest.approx([function(list(row)) for row in candidates])
+
+
+def test_shifted_rotated_variant():
+    dimension = 8
+    shift = objectives.random_shift(dimension, seed=2, function=objectives.rastrigin)
+    rotation = objectives.random_rotation(dimension, seed=3)
+    assert rotation @ rotation.T == pytest.approx(np.eye(dimension))
+    variant = objectives.ShiftedRotated(objectives.rastrigin, shift, rotation, bias=100.0)
+    assert variant(shift) == pytest.approx(100.0)
+    candidates = np.random.default_rng(4).uniform(-5, 5, (4, dimension))
+    expected = objectives.rastrigin((candidates - shift) @ rotation.T) + 100.0
+    assert variant(candidates) == pytest.approx(expected)
+    restored = pickle.loads(pickle.dumps(variant))
+    assert restored(candidates) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("name", sorted(objectives.DOMAINS))
+def test_random_shift_keeps_optimum_inside_domain(name):
+    (low, high), minimum = objectives.DOMAINS[name]
+    function = getattr(objectives, name)
+    shift = objectives.random_shift(50, seed=6, function=function)
+    optimum = objectives.MINIMIZERS[name] + shift
+    margin = 0.1 * (high - low)
+    assert np.all((optimum >= low + margin) & (optimum <= high - margin))
+    variant = objectives.ShiftedRotated(function, shift)
+    assert variant(optimum) == pytest.approx(minimum * 50, abs=1e-6 * 50)
+    assert (objectives.random_shift(50, seed=6, function=name) == shift).all()
+
+
+def test_random_shift_needs_a_range():
+    with pytest.raises(ValueError):
+        objectives.random_shift(3)
+    assert np.all(np.abs(objectives.random_shift(3, -1.0, 1.0, seed=7)) <= 1)
+
+
+def test_vectorized_optimizer_on_library_function():
+    best = pso.particle_swarm_optimization(
+        target_function=Evaluator(objectives.sphere, vectorized=True),
+        swarm_size=20,
+        min_values=(-5,) * 5,
+        max_values=(5,) * 5,
+        iterations=100,
+        w=0.7,
+        c1=1.5,
+        c2=1.5,
+        callback=False,
+        seed=5,
+    )
+    assert best[-1] == pytest.approx(objectives.sphere(best[:-1]))
+    assert best[-1] < 1.0
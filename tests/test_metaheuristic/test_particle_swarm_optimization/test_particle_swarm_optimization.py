@@ -1,6 +1,7 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import particle_swarm_optimization
@@ -43,3 +44,36 @@ def test_particle_swarm_optimization(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_particle_swarm_optimization_bounds():
+    """the swarm moves as a whole and stays inside the caller's box, not the default one"""
+    from pyMetaheuristic.objectives import sphere
+
+    best = pso.particle_swarm_optimization(
+        target_function=lambda x: sphere(x - 8),
+        swarm_size=200,
+        min_values=[6] * 50,
+        max_values=[12] * 50,
+        iterations=100,
+        w=0.5,
+        c1=1.5,
+        c2=1.5,
+        vectorized=True,
+        callback=False,
+        seed=0,
+    )
+
+    assert best.shape == (51,)
+    assert (best[:-1] >= 6).all() and (best[:-1] <= 12).all()
+    assert best[-1] == pytest.approx(sphere(best[:-1] - 8))
+    assert best[-1] < 10
+
+
+def test_individual_best_matrix():
+    position = np.array([[1.0, 1.0, 2.0], [2.0, 2.0, 8.0], [3.0, 3.0, 5.0]])
+    i_b_matrix = np.array([[0.0, 0.0, 4.0], [0.0, 0.0, 4.0], [0.0, 0.0, 5.0]])
+
+    i_b_matrix = pso.individual_best_matrix(position, i_b_matrix)
+
+    assert i_b_matrix.tolist() == [[1.0, 1.0, 2.0], [0.0, 0.0, 4.0], [0.0, 0.0, 5.0]]
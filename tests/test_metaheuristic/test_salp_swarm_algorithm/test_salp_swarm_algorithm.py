@@ -1,9 +1,10 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
-from pyMetaheuristic import salp_swarm_algorithm
+from pyMetaheuristic import salp_swarm_algorithm, seed
 from pyMetaheuristic.objectives import easom
 from pyMetaheuristic.salp_swarm_algorithm import ssa
 
@@ -40,3 +41,43 @@ def test_salp_swarm_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def chain(head, followers):
+    expected = np.copy(followers)
+    for i in range(expected.shape[0]):
+        expected[i] = (head + expected[i]) / 2
+        head = expected[i]
+    return expected
+
+
+@pytest.mark.parametrize("rows", [1, 7, 32, 33, 2501])
+def test_follow_chain_matches_recurrence(rows):
+    rng = np.random.default_rng(rows)
+    head = rng.uniform(-5, 5, 3)
+    followers = rng.uniform(-5, 5, (rows, 3))
+    expected = chain(head, followers)
+    assert ssa.follow_chain(head, followers) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("swarm_size", [1, 2, 5, 150, 1001])
+def test_update_position_leaders_and_followers(swarm_size):
+    seed(6)
+    position = ssa.initial_position(easom, swarm_size=swarm_size)
+    previous = np.copy(position)
+    food = ssa.update_food(position, ssa.food_position(easom))
+    position = ssa.update_position(easom, position, food, c1=0.5)
+    leaders = swarm_size // 2 + 1
+    assert ((position[:, :-1] >= -5) & (position[:, :-1] <= 5)).all()
+    if swarm_size > leaders:
+        assert position[leaders:, :-1] == pytest.approx(
+            chain(position[leaders - 1, :-1], previous[leaders:, :-1])
+        )
+    assert list(position[:, -1]) == [easom(row) for row in position[:, :-1]]
+
+
+def test_food_position_keeps_its_signature():
+    food = ssa.food_position(easom, 3)
+    assert food.shape == (1, 4)
+    assert (food[0, :-1] == 0).all()
+    assert food[0, -1] == pytest.approx(easom([0, 0, 0]))
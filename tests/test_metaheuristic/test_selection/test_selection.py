@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from pyMetaheuristic import seed
+from pyMetaheuristic.genetic_algorithm import ga
+from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.selection import (
+    fitness_function,
+    fitness_matrix,
+    roulette_wheel,
+    select,
+    stochastic_universal_sampling,
+    tournament,
+)
+
+POPULATION = np.array([[0.0, 3.0], [0.0, 1.0], [0.0, 0.0], [0.0, 7.0]])
+
+
+def test_fitness_function():
+    fitness = fitness_function(POPULATION)
+    assert fitness[:, 0] == pytest.approx([1 / 4, 1 / 2, 1, 1 / 8])
+    assert fitness[:, 1] == pytest.approx(np.cumsum(fitness[:, 0]) / fitness[:, 0].sum())
+    assert fitness[-1, 1] == 1
+
+
+def test_roulette_wheel_frequencies():
+    seed(0)
+    fitness = fitness_matrix([1.0, 2.0, 0.0, 5.0])
+    ix = roulette_wheel(fitness, 80000)
+    assert np.bincount(ix, minlength=4) / 80000 == pytest.approx(
+        [1 / 8, 2 / 8, 0, 5 / 8], abs=0.01
+    )
+    assert isinstance(roulette_wheel(fitness), int)
+
+
+def test_stochastic_universal_sampling_counts():
+    seed(1)
+    fitness = fitness_matrix([1.0, 2.0, 0.0, 5.0])
+    counts = np.bincount(stochastic_universal_sampling(fitness, 16), minlength=4)
+    assert counts.tolist() == [2, 4, 0, 10]
+
+
+def test_tournament_returns_winners():
+    seed(2)
+    winners = tournament(POPULATION, 1000, tournament_size=4)
+    assert np.bincount(winners, minlength=4)[2] > 600
+    assert (tournament(POPULATION, 50, tournament_size=64) == 2).all()
+
+
+def test_select_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        select(POPULATION, fitness_function(POPULATION), 2, method="rank")
+
+
+@pytest.mark.parametrize("selection", ["roulette", "sus", "tournament"])
+def test_genetic_algorithm_selection(selection):
+    best = ga.genetic_algorithm(
+        target_function=easom,
+        population_size=100,
+        elite=1,
+        generations=100,
+        selection=selection,
+        callback=False,
+        seed=3,
+    )
+    assert best[-1] == pytest.approx(-1.0, abs=0.05)
+
+
+def test_optimizer_modules_keep_their_selection_helpers():
+    assert ga.fitness_function is fitness_function
+    assert ga.roulette_wheel is roulette_wheel
@@ -1,10 +1,12 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
 from pyMetaheuristic import simulated_anealling
-from pyMetaheuristic.objectives import easom
+from pyMetaheuristic.evaluation import Evaluator
+from pyMetaheuristic.objectives import easom, sphere
 from pyMetaheuristic.simulated_anealling import sa
 
 
@@ -43,3 +45,44 @@ def test_simulated_annealing(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+@pytest.mark.parametrize("tempering", [None, 1.5])
+def test_simulated_annealing_chains(tempering):
+    target_function = Evaluator(sphere, vectorized=True)
+    sa_search = sa.simulated_annealing(
+        target_function=target_function,
+        min_values=[-5] * 4,
+        max_values=[5] * 4,
+        sigma=0.2,
+        temperature_iterations=20,
+        final_temperature=0.01,
+        alpha=0.8,
+        chains=16,
+        tempering=tempering,
+        callback=False,
+        seed=0,
+    )
+    assert sa_search.shape == (1, 5)
+    assert sa_search[0, -1] == pytest.approx(sphere(sa_search[0, :-1]))
+    assert sa_search[0, -1] < 0.5
+    # 16 initial guesses, then 16 proposals per step
+    steps = 20 * 21
+    assert target_function.evaluations == 16 + 16 * steps
+
+
+def test_update_solution_redraws_outside_bounds():
+    guess = np.array([[4.5, 0.0, 0.0], [0.0, -4.5, 0.0]])
+    epson = np.array([[1.0, 1.0], [1.0, 1.0]])
+    updated = sa.update_solution(sphere, guess, epson)
+    assert updated[0, 1] == 1.0 and updated[1, 0] == 1.0
+    assert -5 <= updated[0, 0] <= 5 and updated[0, 0] != 5.5
+    assert updated[1, 1] == -3.5
+    assert updated[:, -1] == pytest.approx(sphere(updated[:, :-1]))
+
+
+def test_replica_exchange_moves_better_state_to_colder_chain():
+    guess = np.array([[0.0, 5.0], [1.0, 1.0], [2.0, 3.0]])
+    temperatures = np.array([0.001, 1.0, 1000.0])
+    guess = sa.replica_exchange(guess, temperatures, parity=0)
+    assert guess[:, -1].tolist() == [1.0, 5.0, 3.0]
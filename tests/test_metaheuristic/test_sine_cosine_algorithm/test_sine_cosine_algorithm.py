@@ -1,9 +1,10 @@
 import math
 from pprint import pprint
 
+import numpy as np
 import pyMetaheuristic
 import pytest
-from pyMetaheuristic import sine_cosine_algorithm
+from pyMetaheuristic import engine, seed, sine_cosine_algorithm
 from pyMetaheuristic.objectives import easom
 from pyMetaheuristic.sine_cosine_algorithm import sine_cosine_a
 
@@ -43,3 +44,20 @@ def test_sine_cosine_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_update_position_moves_all_solutions():
+    seed(7)
+    position = sine_cosine_a.initial_position(easom, solutions=20, min_values=[-5] * 4, max_values=[5] * 4)
+    destination = np.copy(position[np.argmin(position[:, -1])])
+    previous = np.copy(position[:, :-1])
+    seed(8)
+    r2, r3, r4 = engine.random((3, 20, 4))
+    wave = np.where(r4 < 0.5, np.sin(2 * math.pi * r2), np.cos(2 * math.pi * r2))
+    expected = np.clip(previous + 1.5 * wave * np.abs(2 * r3 * destination[:-1] - previous), -5, 5)
+    seed(8)
+    position = sine_cosine_a.update_position(
+        easom, position, destination, r1=1.5, min_values=[-5] * 4, max_values=[5] * 4
+    )
+    assert position[:, :-1] == pytest.approx(expected)
+    assert list(position[:, -1]) == [easom(row) for row in position[:, :-1]]
@@ -49,3 +49,22 @@ def test_whale_optimization_algorithm(front):
         pytest.approx(math.pi, abs=0.5),
         pytest.approx(math.pi, abs=0.5),
     ]
+
+
+def test_update_position_moves_whole_party():
+    woa_instance = whale_optimization_a.WOA(
+        target_function=easom,
+        hunting_party=40,
+        min_values=[-5, -5],
+        max_values=[5, 5],
+        callback=False,
+        seed=4,
+    )
+    woa_instance.initial_position()
+    position = woa_instance.update_position(a_linear_component=1.5)
+    assert position.shape == (40, 3)
+    assert ((position[:, :-1] >= -5) & (position[:, :-1] <= 5)).all()
+    assert list(position[:, -1]) == [easom(row) for row in position[:, :-1]]
+
+    leader = woa_instance.update_leader(position)
+    assert leader[0, -1] == min(position[:, -1].min(), easom([0, 0]))